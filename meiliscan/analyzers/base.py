@@ -1,6 +1,7 @@
 """Base analyzer interface."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 
 from meiliscan.models.finding import Finding
 from meiliscan.models.index import IndexData
@@ -10,14 +11,14 @@ class BaseAnalyzer(ABC):
     """Abstract base class for analyzers."""
 
     @abstractmethod
-    def analyze(self, index: IndexData) -> list[Finding]:
+    def analyze(self, index: IndexData) -> Iterable[Finding]:
         """Analyze an index and return findings.
 
         Args:
             index: The index data to analyze
 
         Returns:
-            List of findings from the analysis
+            Findings from the analysis; a list or a generator
         """
         pass
 
@@ -1,5 +1,7 @@
 """Best practices analyzer for MeiliSearch instances."""
 
+from collections.abc import Sequence
+
 from packaging import version
 
 from meiliscan.analyzers.base import BaseAnalyzer
@@ -41,7 +43,7 @@ class BestPracticesAnalyzer(BaseAnalyzer):
         self,
         indexes: list[IndexData],
         global_stats: dict,
-        tasks: list[dict] | None = None,
+        tasks: Sequence[dict] | None = None,
         instance_version: str | None = None,
     ) -> list[Finding]:
         """Run global best practices analysis.
@@ -112,7 +114,7 @@ class BestPracticesAnalyzer(BaseAnalyzer):
         return findings
 
     def _check_settings_after_documents(
-        self, tasks: list[dict] | None, indexes: list[IndexData]
+        self, tasks: Sequence[dict] | None, indexes: list[IndexData]
     ) -> list[Finding]:
         """Check if settings were configured after documents were added (B001).
 
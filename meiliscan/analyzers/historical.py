@@ -11,7 +11,10 @@ from meiliscan.models.comparison import (
     MetricChange,
     TrendDirection,
 )
-from meiliscan.models.report import AnalysisReport
+from meiliscan.models.report import AnalysisReport, ComparisonInput
+
+# Reports are compared either as built or as loaded for comparison
+ComparableReport = AnalysisReport | ComparisonInput
 
 
 class HistoricalAnalyzer:
@@ -19,8 +22,8 @@ class HistoricalAnalyzer:
 
     def compare(
         self,
-        old_report: AnalysisReport,
-        new_report: AnalysisReport,
+        old_report: ComparableReport,
+        new_report: ComparableReport,
     ) -> ComparisonReport:
         """Compare two analysis reports and generate a comparison report.
 
@@ -294,8 +297,8 @@ class HistoricalAnalyzer:
 
     def _compare_findings(
         self,
-        old_report: AnalysisReport,
-        new_report: AnalysisReport,
+        old_report: ComparableReport,
+        new_report: ComparableReport,
     ) -> list[FindingChange]:
         """Compare findings between two reports."""
         changes: list[FindingChange] = []
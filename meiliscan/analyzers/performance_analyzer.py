@@ -2,6 +2,7 @@
 
 import re
 from collections import Counter
+from collections.abc import Sequence
 from datetime import datetime
 
 from meiliscan.analyzers.base import BaseAnalyzer
@@ -33,7 +34,7 @@ class PerformanceAnalyzer(BaseAnalyzer):
         self,
         indexes: list[IndexData],
         global_stats: dict,
-        tasks: list[dict] | None = None,
+        tasks: Sequence[dict] | None = None,
     ) -> list[Finding]:
         """Analyze global performance metrics.
 
@@ -96,7 +97,7 @@ class PerformanceAnalyzer(BaseAnalyzer):
         """Check individual index balance - placeholder for per-index checks."""
         return []
 
-    def _check_task_failures(self, tasks: list[dict] | None) -> list[Finding]:
+    def _check_task_failures(self, tasks: Sequence[dict] | None) -> list[Finding]:
         """Check for high task failure rate (P001)."""
         findings: list[Finding] = []
 
@@ -131,7 +132,7 @@ class PerformanceAnalyzer(BaseAnalyzer):
 
         return findings
 
-    def _check_slow_indexing(self, tasks: list[dict] | None) -> list[Finding]:
+    def _check_slow_indexing(self, tasks: Sequence[dict] | None) -> list[Finding]:
         """Check for slow indexing tasks (P002)."""
         findings: list[Finding] = []
 
@@ -291,7 +292,7 @@ class PerformanceAnalyzer(BaseAnalyzer):
 
         return findings
 
-    def _check_task_backlog(self, tasks: list[dict] | None) -> list[Finding]:
+    def _check_task_backlog(self, tasks: Sequence[dict] | None) -> list[Finding]:
         """Check for sustained task backlog (P007)."""
         findings: list[Finding] = []
 
@@ -367,7 +368,7 @@ class PerformanceAnalyzer(BaseAnalyzer):
 
         return findings
 
-    def _check_tiny_indexing_tasks(self, tasks: list[dict] | None) -> list[Finding]:
+    def _check_tiny_indexing_tasks(self, tasks: Sequence[dict] | None) -> list[Finding]:
         """Check for too many tiny indexing tasks (P008)."""
         findings: list[Finding] = []
 
@@ -429,7 +430,7 @@ class PerformanceAnalyzer(BaseAnalyzer):
         return findings
 
     def _check_oversized_indexing_tasks(
-        self, tasks: list[dict] | None
+        self, tasks: Sequence[dict] | None
     ) -> list[Finding]:
         """Check for oversized indexing tasks (P009)."""
         findings: list[Finding] = []
@@ -508,7 +509,7 @@ class PerformanceAnalyzer(BaseAnalyzer):
 
         return findings
 
-    def _check_error_clustering(self, tasks: list[dict] | None) -> list[Finding]:
+    def _check_error_clustering(self, tasks: Sequence[dict] | None) -> list[Finding]:
         """Check for recurring error patterns (P010)."""
         findings: list[Finding] = []
 
@@ -1,6 +1,10 @@
 """CLI application for Meiliscan."""
 
 import asyncio
+import io
+import logging
+import sys
+from operator import attrgetter
 from pathlib import Path
 from typing import Annotated, Optional
 
@@ -35,10 +39,50 @@ app = typer.Typer(
 )
 
 console = Console()
+# Errors and status messages that must not mix with machine-readable stdout
+err_console = Console(stderr=True)
 
 # Valid output formats
 VALID_FORMATS = ("json", "markdown", "sarif", "agent")
 
+# Health score bars indexed by filled segment count (one segment per 5 points)
+SCORE_BARS = tuple(
+    f"[green]{'█' * filled}[/green][dim]{'░' * (20 - filled)}[/dim]"
+    for filled in range(21)
+)
+
+# Fix script templates (formatted once per script and once per fixable finding)
+FIX_SCRIPT_HEADER = """\
+#!/bin/bash
+#
+# MeiliSearch Configuration Fix Script
+# Generated by Meiliscan
+#
+# Based on analysis from: {input_file}
+#
+
+set -e  # Exit on error
+
+MEILISEARCH_URL="${{MEILISEARCH_URL:-{base_url}}}"
+API_KEY="${{MEILI_MASTER_KEY:-YOUR_API_KEY}}"
+
+echo "Applying MeiliSearch configuration fixes..."
+echo "Target: $MEILISEARCH_URL"
+echo
+
+"""
+
+FIX_SCRIPT_STEP = """\
+# {id}: {title}
+{index_line}echo "Applying fix: {id} - {title}"
+curl -s -X {method} "$MEILISEARCH_URL{endpoint}" \\
+  -H 'Content-Type: application/json' \\
+  -H "Authorization: Bearer $API_KEY" \\
+  --data-binary '{payload}'
+echo
+
+"""
+
 
 def version_callback(value: bool) -> None:
     """Show version and exit."""
@@ -47,6 +91,32 @@ def version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
+def _parse_sample_documents(value: str) -> int | None:
+    """Parse the --sample-documents option.
+
+    Args:
+        value: A positive integer or 'all'
+
+    Returns:
+        The number of sample documents, or None for all documents
+    """
+    if value.lower() == "all":
+        return None
+
+    try:
+        sample_docs = int(value)
+    except ValueError:
+        sample_docs = 0
+
+    if sample_docs < 1:
+        err_console.print(
+            "[red]Error:[/red] --sample-documents must be a positive integer or 'all'."
+        )
+        raise typer.Exit(1)
+
+    return sample_docs
+
+
 @app.callback()
 def main(
     version: Annotated[
@@ -61,7 +131,7 @@ def main(
     ] = None,
 ) -> None:
     """Meiliscan - Identify optimization opportunities in your MeiliSearch setup."""
-    pass
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
 
 
 @app.command()
@@ -149,39 +219,32 @@ def analyze(
             help="Enable detection of potential PII/sensitive fields in documents",
         ),
     ] = False,
+    parallel: Annotated[
+        bool,
+        typer.Option(
+            "--parallel",
+            help="Analyze indexes in worker processes (faster for many large indexes)",
+        ),
+    ] = False,
 ) -> None:
     """Analyze a MeiliSearch instance or dump file."""
     if not url and not dump:
-        console.print("[red]Error:[/red] Either --url or --dump must be provided.")
+        err_console.print("[red]Error:[/red] Either --url or --dump must be provided.")
         raise typer.Exit(1)
 
     if url and dump:
-        console.print("[red]Error:[/red] Cannot specify both --url and --dump.")
+        err_console.print("[red]Error:[/red] Cannot specify both --url and --dump.")
         raise typer.Exit(1)
 
     if format_type not in VALID_FORMATS:
-        console.print(
+        err_console.print(
             f"[red]Error:[/red] Unknown format '{format_type}'. "
             f"Use one of: {', '.join(VALID_FORMATS)}."
         )
         raise typer.Exit(1)
 
     # Parse sample_documents option
-    if sample_documents.lower() == "all":
-        sample_docs_value: int | None = None
-    else:
-        try:
-            sample_docs_value = int(sample_documents)
-            if sample_docs_value < 1:
-                console.print(
-                    "[red]Error:[/red] --sample-documents must be a positive integer or 'all'."
-                )
-                raise typer.Exit(1)
-        except ValueError:
-            console.print(
-                "[red]Error:[/red] --sample-documents must be a positive integer or 'all'."
-            )
-            raise typer.Exit(1)
+    sample_docs_value = _parse_sample_documents(sample_documents)
 
     if probe_search and dump:
         console.print(
@@ -193,7 +256,7 @@ def analyze(
     instance_config = None
     if config_toml:
         if not config_toml.exists():
-            console.print(f"[red]Error:[/red] Config file not found: {config_toml}")
+            err_console.print(f"[red]Error:[/red] Config file not found: {config_toml}")
             raise typer.Exit(1)
         try:
             from meiliscan.models.instance_config import InstanceLaunchConfig
@@ -201,7 +264,7 @@ def analyze(
             instance_config = InstanceLaunchConfig.from_toml_file(config_toml)
             console.print(f"[dim]Loaded config from: {config_toml}[/dim]")
         except Exception as e:
-            console.print(f"[red]Error:[/red] Failed to parse config.toml: {e}")
+            err_console.print(f"[red]Error:[/red] Failed to parse config.toml: {e}")
             raise typer.Exit(1)
 
     # Build analysis options
@@ -210,6 +273,7 @@ def analyze(
         "probe_search": probe_search,
         "sample_documents": sample_docs_value,
         "detect_sensitive": detect_sensitive,
+        "parallel": parallel,
     }
 
     if dump:
@@ -296,7 +360,9 @@ async def _analyze_dump(
                     )
 
         if not await collector.collect(progress_cb):
-            console.print(f"[red]Error:[/red] Failed to parse dump file at {dump_path}")
+            err_console.print(
+                f"[red]Error:[/red] Failed to parse dump file at {dump_path}"
+            )
             await collector.close()
             return 1
 
@@ -388,7 +454,7 @@ async def _analyze_instance(
                     )
 
         if not await collector.collect(progress_cb):
-            console.print(
+            err_console.print(
                 f"[red]Error:[/red] Failed to connect to MeiliSearch at {url}"
             )
             await collector.close()
@@ -467,7 +533,7 @@ def _get_ci_exit_code(report, ci_mode: bool, fail_on_warnings: bool) -> int:
 def _export_report(report, output: Path | None, format_type: str) -> None:
     """Export the report in the specified format."""
     if format_type == "json":
-        exporter = JsonExporter(pretty=True)
+        exporter = JsonExporter(pretty=True, return_str=False)
     elif format_type == "markdown":
         exporter = MarkdownExporter()
     elif format_type == "sarif":
@@ -475,7 +541,7 @@ def _export_report(report, output: Path | None, format_type: str) -> None:
     elif format_type == "agent":
         exporter = AgentExporter()
     else:
-        exporter = JsonExporter(pretty=True)
+        exporter = JsonExporter(pretty=True, return_str=False)
 
     exporter.export(report, output)
 
@@ -490,10 +556,7 @@ def _display_summary(summary, version: str | None) -> None:
     scorer = HealthScorer()
     score_label = scorer.get_score_label(summary.health_score)
 
-    # Build score bar
-    filled = int(summary.health_score / 5)
-    empty = 20 - filled
-    score_bar = "[green]" + "█" * filled + "[/green][dim]" + "░" * empty + "[/dim]"
+    score_bar = SCORE_BARS[min(int(summary.health_score / 5), 20)]
 
     summary_text = f"""
 [bold]Version:[/bold] {version or "Unknown"}    [bold]Indexes:[/bold] {summary.total_indexes}    [bold]Documents:[/bold] {summary.total_documents:,}
@@ -546,17 +609,7 @@ def _display_findings(report) -> None:
     }
 
     # Sort by severity and limit to top 10
-    severity_order = {
-        FindingSeverity.CRITICAL: 0,
-        FindingSeverity.WARNING: 1,
-        FindingSeverity.SUGGESTION: 2,
-        FindingSeverity.INFO: 3,
-    }
-
-    sorted_findings = sorted(
-        display_findings,
-        key=lambda f: severity_order.get(f.severity, 4),
-    )[:10]
+    sorted_findings = sorted(display_findings, key=attrgetter("severity.rank"))[:10]
 
     for finding in sorted_findings:
         color = severity_colors.get(finding.severity, "white")
@@ -599,7 +652,9 @@ async def _summary_instance(url: str, api_key: str | None) -> None:
     collector = DataCollector.from_url(url, api_key)
 
     if not await collector.collect():
-        console.print(f"[red]Error:[/red] Failed to connect to MeiliSearch at {url}")
+        err_console.print(
+            f"[red]Error:[/red] Failed to connect to MeiliSearch at {url}"
+        )
         await collector.close()
         raise typer.Exit(1)
 
@@ -695,15 +750,17 @@ def tasks(
 ) -> None:
     """Display the MeiliSearch tasks queue."""
     if not url and not dump:
-        console.print("[red]Error:[/red] Either --url or --dump must be provided.")
+        err_console.print("[red]Error:[/red] Either --url or --dump must be provided.")
         raise typer.Exit(1)
 
     if url and dump:
-        console.print("[red]Error:[/red] Cannot specify both --url and --dump.")
+        err_console.print("[red]Error:[/red] Cannot specify both --url and --dump.")
         raise typer.Exit(1)
 
     if watch and dump:
-        console.print("[red]Error:[/red] Watch mode only works with live instances.")
+        err_console.print(
+            "[red]Error:[/red] Watch mode only works with live instances."
+        )
         raise typer.Exit(1)
 
     asyncio.run(
@@ -733,7 +790,7 @@ async def _display_tasks(
 
     if not await collector.collect():
         source = dump_path or url
-        console.print(f"[red]Error:[/red] Failed to connect to {source}")
+        err_console.print(f"[red]Error:[/red] Failed to connect to {source}")
         await collector.close()
         raise typer.Exit(1)
 
@@ -884,37 +941,16 @@ def fix_script(
     from meiliscan.models.report import AnalysisReport
 
     if not input_file.exists():
-        console.print(f"[red]Error:[/red] Input file not found: {input_file}")
+        err_console.print(f"[red]Error:[/red] Input file not found: {input_file}")
         raise typer.Exit(1)
 
     try:
         data = orjson.loads(input_file.read_bytes())
         report = AnalysisReport.from_dict(data)
     except Exception as e:
-        console.print(f"[red]Error:[/red] Failed to parse input file: {e}")
+        err_console.print(f"[red]Error:[/red] Failed to parse input file: {e}")
         raise typer.Exit(1)
 
-    # Generate fix script
-    script_lines = [
-        "#!/bin/bash",
-        "#",
-        "# MeiliSearch Configuration Fix Script",
-        "# Generated by Meiliscan",
-        "#",
-        f"# Based on analysis from: {input_file}",
-        "#",
-        "",
-        "set -e  # Exit on error",
-        "",
-        f'MEILISEARCH_URL="${{MEILISEARCH_URL:-{base_url}}}"',
-        'API_KEY="${MEILI_MASTER_KEY:-YOUR_API_KEY}"',
-        "",
-        'echo "Applying MeiliSearch configuration fixes..."',
-        'echo "Target: $MEILISEARCH_URL"',
-        "echo",
-        "",
-    ]
-
     # Collect all findings with fixes
     fixable_findings = []
     for index_data in report.indexes.values():
@@ -927,9 +963,13 @@ def fix_script(
             fixable_findings.append(finding)
 
     if not fixable_findings:
-        console.print("[yellow]No fixable findings found in the analysis.[/yellow]")
+        err_console.print("[yellow]No fixable findings found in the analysis.[/yellow]")
         raise typer.Exit(0)
 
+    # Generate fix script
+    script = io.StringIO()
+    script.write(FIX_SCRIPT_HEADER.format(input_file=input_file, base_url=base_url))
+
     for finding in fixable_findings:
         fix = finding.fix
         method = "PATCH"
@@ -951,47 +991,38 @@ def fix_script(
         payload_json = orjson.dumps(fix.payload, option=orjson.OPT_INDENT_2).decode(
             "utf-8"
         )
-        # Escape for heredoc
-        payload_escaped = payload_json.replace("'", "'\"'\"'")
-
-        script_lines.extend(
-            [
-                f"# {finding.id}: {finding.title}",
-            ]
-        )
-
-        if finding.index_uid:
-            script_lines.append(f"# Index: {finding.index_uid}")
-
-        script_lines.extend(
-            [
-                f'echo "Applying fix: {finding.id} - {finding.title}"',
-                f'curl -s -X {method} "$MEILISEARCH_URL{endpoint}" \\',
-                "  -H 'Content-Type: application/json' \\",
-                '  -H "Authorization: Bearer $API_KEY" \\',
-                f"  --data-binary '{payload_escaped}'",
-                "echo",
-                "",
-            ]
+        # Escape for the single-quoted --data-binary argument; most payloads
+        # contain no single quote, so skip the copy in that case.
+        if "'" in payload_json:
+            payload_json = payload_json.replace("'", "'\"'\"'")
+
+        script.write(
+            FIX_SCRIPT_STEP.format(
+                id=finding.id,
+                title=finding.title,
+                index_line=f"# Index: {finding.index_uid}\n"
+                if finding.index_uid
+                else "",
+                method=method,
+                endpoint=endpoint,
+                payload=payload_json,
+            )
         )
 
-    script_lines.extend(
-        [
-            'echo "All fixes applied successfully!"',
-            "",
-        ]
-    )
+    script.write('echo "All fixes applied successfully!"\n')
 
-    script_content = "\n".join(script_lines)
+    script_content = script.getvalue()
 
     if output:
         output.write_text(script_content)
         # Make executable
         output.chmod(0o755)
-        console.print(f"[green]Fix script saved to:[/green] {output}")
-        console.print(f"[dim]Run with: ./{output}[/dim]")
+        err_console.print(f"[green]Fix script saved to:[/green] {output}")
+        err_console.print(f"[dim]Run with: ./{output}[/dim]")
     else:
-        console.print(script_content)
+        # Write the script verbatim; Rich would parse markup and highlight it
+        sys.stdout.write(script_content)
+        sys.stdout.flush()
 
 
 @app.command()
@@ -1029,30 +1060,28 @@ def compare(
     import orjson
 
     from meiliscan.analyzers.historical import HistoricalAnalyzer
-    from meiliscan.models.report import AnalysisReport
+    from meiliscan.models.report import ComparisonInput
 
     # Validate input files
     if not old_report.exists():
-        console.print(f"[red]Error:[/red] Old report file not found: {old_report}")
+        err_console.print(f"[red]Error:[/red] Old report file not found: {old_report}")
         raise typer.Exit(1)
 
     if not new_report.exists():
-        console.print(f"[red]Error:[/red] New report file not found: {new_report}")
+        err_console.print(f"[red]Error:[/red] New report file not found: {new_report}")
         raise typer.Exit(1)
 
-    # Load reports
+    # Load reports, skipping sample documents the comparison does not use
     try:
-        old_data = orjson.loads(old_report.read_bytes())
-        old = AnalysisReport.from_dict(old_data)
+        old = ComparisonInput.model_validate_json(old_report.read_bytes())
     except Exception as e:
-        console.print(f"[red]Error:[/red] Failed to parse old report: {e}")
+        err_console.print(f"[red]Error:[/red] Failed to parse old report: {e}")
         raise typer.Exit(1)
 
     try:
-        new_data = orjson.loads(new_report.read_bytes())
-        new = AnalysisReport.from_dict(new_data)
+        new = ComparisonInput.model_validate_json(new_report.read_bytes())
     except Exception as e:
-        console.print(f"[red]Error:[/red] Failed to parse new report: {e}")
+        err_console.print(f"[red]Error:[/red] Failed to parse new report: {e}")
         raise typer.Exit(1)
 
     # Run comparison
@@ -1317,21 +1346,7 @@ def serve(
         probe_search = False
 
     # Parse sample_documents option
-    if sample_documents.lower() == "all":
-        sample_docs_value: int | None = None
-    else:
-        try:
-            sample_docs_value = int(sample_documents)
-            if sample_docs_value < 1:
-                console.print(
-                    "[red]Error:[/red] --sample-documents must be a positive integer or 'all'."
-                )
-                raise typer.Exit(1)
-        except ValueError:
-            console.print(
-                "[red]Error:[/red] --sample-documents must be a positive integer or 'all'."
-            )
-            raise typer.Exit(1)
+    sample_docs_value = _parse_sample_documents(sample_documents)
 
     console.print(
         Panel.fit(
@@ -1,7 +1,21 @@
 """Collectors module initialization."""
 
+# Collectors are imported lazily so that live-instance usage does not load
+# the dump parser and vice versa
+
 from meiliscan.collectors.base import BaseCollector
-from meiliscan.collectors.dump_parser import DumpParser
-from meiliscan.collectors.live_instance import LiveInstanceCollector
 
 __all__ = ["BaseCollector", "DumpParser", "LiveInstanceCollector"]
+
+
+def __getattr__(name: str):
+    """Lazy import mechanism for collector implementations."""
+    if name == "DumpParser":
+        from meiliscan.collectors.dump_parser import DumpParser
+
+        return DumpParser
+    if name == "LiveInstanceCollector":
+        from meiliscan.collectors.live_instance import LiveInstanceCollector
+
+        return LiveInstanceCollector
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,7 @@
 """Base collector interface."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 from meiliscan.models.index import IndexData
@@ -42,16 +43,16 @@ class BaseCollector(ABC):
         """Get global statistics."""
         pass
 
-    async def get_tasks(self, limit: int = 1000) -> list[dict]:
+    async def get_tasks(self, limit: int = 1000) -> Sequence[dict]:
         """Get task history.
 
         Args:
             limit: Maximum number of tasks to retrieve
 
         Returns:
-            List of task dictionaries. Empty by default.
+            Sequence of task dictionaries. An empty tuple by default.
         """
-        return []
+        return ()
 
     @abstractmethod
     async def close(self) -> None:
@@ -1,18 +1,27 @@
 """Dump file parser for MeiliSearch dumps."""
 
 import asyncio
+import io
 import json
 import tarfile
 import tempfile
+from collections.abc import Iterable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import orjson
+
 from meiliscan.collectors.base import BaseCollector
 from meiliscan.models.index import IndexData, IndexSettings, IndexStats
 
 if TYPE_CHECKING:
     from meiliscan.core.progress import ProgressCallback
 
+# Dumps (and extracted documents.jsonl files) up to this size are read into
+# memory in a single call; larger ones are streamed from disk to keep memory
+# usage bounded.
+MAX_IN_MEMORY_DUMP_SIZE = 256 * 1024 * 1024
+
 
 class DumpParser(BaseCollector):
     """Parser for MeiliSearch dump files.
@@ -65,7 +74,7 @@ class DumpParser(BaseCollector):
             temp_path = Path(self._temp_dir.name)
 
             # Extract the dump
-            with tarfile.open(self.dump_path, "r:gz") as tar:
+            with self._open_archive() as tar:
                 tar.extractall(temp_path)
 
             # Dump extraction and parsing are mostly synchronous and can block the
@@ -123,6 +132,14 @@ class DumpParser(BaseCollector):
         except (tarfile.TarError, json.JSONDecodeError, OSError):
             return False
 
+    def _open_archive(self) -> tarfile.TarFile:
+        """Open the dump archive, reading small dumps into memory in one go."""
+        if self.dump_path.stat().st_size <= MAX_IN_MEMORY_DUMP_SIZE:
+            return tarfile.open(
+                fileobj=io.BytesIO(self.dump_path.read_bytes()), mode="r:gz"
+            )
+        return tarfile.open(self.dump_path, "r:gz")
+
     async def _load_indexes(
         self, progress_cb: "ProgressCallback | None" = None
     ) -> list[IndexData]:
@@ -183,13 +200,21 @@ class DumpParser(BaseCollector):
             doc_count = 0
 
             if documents_path.exists():
-                with open(documents_path, "r") as f:
-                    for i, line in enumerate(f):
+                # Blocking reads like the rest of this method; the loop below
+                # yields to the event loop every 2000 documents
+                with open(documents_path, "rb") as f:  # noqa: ASYNC230
+                    # Small files are read and split in one call; larger ones
+                    # are streamed line by line to keep memory usage bounded
+                    lines: Iterable[bytes] = f
+                    if documents_path.stat().st_size <= MAX_IN_MEMORY_DUMP_SIZE:
+                        lines = f.read().splitlines()
+
+                    for i, line in enumerate(lines):
                         if i % 2000 == 0:
                             await asyncio.sleep(0)
 
                         doc_count += 1
-                        doc = json.loads(line)
+                        doc = orjson.loads(line)
 
                         # Track field distribution
                         for field in doc.keys():
@@ -1,5 +1,6 @@
 """Live MeiliSearch instance collector."""
 
+import asyncio
 from typing import TYPE_CHECKING, Any, cast
 
 import httpx
@@ -11,6 +12,9 @@ from meiliscan.models.task import Task, TasksResponse, TasksSummary
 if TYPE_CHECKING:
     from meiliscan.core.progress import ProgressCallback
 
+# Maximum number of indexes fetched concurrently from a live instance
+MAX_CONCURRENT_INDEX_FETCHES = 8
+
 
 class LiveInstanceCollector(BaseCollector):
     """Collector for live MeiliSearch instances."""
@@ -155,86 +159,104 @@ class LiveInstanceCollector(BaseCollector):
             total=total_indexes,
         )
 
-        indexes: list[IndexData] = []
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_INDEX_FETCHES)
+        started = 0
+
+        async def fetch(idx_info: dict[str, Any]) -> IndexData:
+            nonlocal started
+            async with semaphore:
+                started += 1
+                emit_collect(
+                    progress_cb,
+                    f"Fetching index {idx_info['uid']} ({started}/{total_indexes})...",
+                    current=started,
+                    total=total_indexes,
+                )
+                return await self._fetch_index(idx_info)
+
+        return list(
+            await asyncio.gather(*(fetch(idx_info) for idx_info in indexes_list))
+        )
 
-        for i, idx_info in enumerate(indexes_list, start=1):
-            uid = idx_info["uid"]
+    async def _fetch_index(self, idx_info: dict[str, Any]) -> IndexData:
+        """Fetch settings, stats and sample documents for a single index.
 
-            emit_collect(
-                progress_cb,
-                f"Fetching index {uid} ({i}/{total_indexes})...",
-                current=i,
-                total=total_indexes,
-            )
+        Args:
+            idx_info: Index entry as returned by the /indexes endpoint
+
+        Returns:
+            The populated index data
+        """
+        if not self._client:
+            raise RuntimeError("Collector not connected. Call connect() first.")
+
+        uid = idx_info["uid"]
+
+        # Get settings and stats for this index
+        settings_response, stats_response = await asyncio.gather(
+            self._client.get(f"/indexes/{uid}/settings"),
+            self._client.get(f"/indexes/{uid}/stats"),
+        )
+        settings_response.raise_for_status()
+        settings_data = settings_response.json()
+        stats_response.raise_for_status()
+        stats_data = stats_response.json()
 
-            # Get settings for this index
-            settings_response = await self._client.get(f"/indexes/{uid}/settings")
-            settings_response.raise_for_status()
-            settings_data = settings_response.json()
-
-            # Get stats for this index
-            stats_response = await self._client.get(f"/indexes/{uid}/stats")
-            stats_response.raise_for_status()
-            stats_data = stats_response.json()
-
-            # Get sample documents (or all if sample_docs is None)
-            sample_docs: list[dict[str, Any]] = []
-            try:
-                if self.sample_docs is None:
-                    # Fetch all documents with pagination
-                    offset = 0
-                    batch_size = 1000  # MeiliSearch default max limit
-                    while True:
-                        docs_response = await self._client.get(
-                            f"/indexes/{uid}/documents",
-                            params={"limit": batch_size, "offset": offset},
-                        )
-                        docs_response.raise_for_status()
-                        docs_data = docs_response.json()
-
-                        if isinstance(docs_data, dict) and "results" in docs_data:
-                            batch = cast(list[dict[str, Any]], docs_data["results"])
-                        elif isinstance(docs_data, list):
-                            batch = cast(list[dict[str, Any]], docs_data)
-                        else:
-                            break
-
-                        if not batch:
-                            break
-
-                        sample_docs.extend(batch)
-                        offset += len(batch)
-
-                        # Check if we've fetched all documents
-                        if len(batch) < batch_size:
-                            break
-                else:
-                    # Fetch limited sample
+        # Get sample documents (or all if sample_docs is None)
+        sample_docs: list[dict[str, Any]] = []
+        try:
+            if self.sample_docs is None:
+                # Fetch all documents with pagination
+                offset = 0
+                batch_size = 1000  # MeiliSearch default max limit
+                while True:
                     docs_response = await self._client.get(
                         f"/indexes/{uid}/documents",
-                        params={"limit": self.sample_docs},
+                        params={"limit": batch_size, "offset": offset},
                     )
                     docs_response.raise_for_status()
                     docs_data = docs_response.json()
+
                     if isinstance(docs_data, dict) and "results" in docs_data:
-                        sample_docs = cast(list[dict[str, Any]], docs_data["results"])
+                        batch = cast(list[dict[str, Any]], docs_data["results"])
                     elif isinstance(docs_data, list):
-                        sample_docs = cast(list[dict[str, Any]], docs_data)
-            except httpx.HTTPError:
-                pass
-
-            index = IndexData(
-                uid=uid,
-                primaryKey=idx_info.get("primaryKey"),
-                createdAt=idx_info.get("createdAt"),
-                updatedAt=idx_info.get("updatedAt"),
-                settings=IndexSettings(**settings_data),
-                stats=IndexStats(**stats_data),
-                sample_documents=sample_docs,
-            )
-            indexes.append(index)
+                        batch = cast(list[dict[str, Any]], docs_data)
+                    else:
+                        break
+
+                    if not batch:
+                        break
 
-        return indexes
+                    sample_docs.extend(batch)
+                    offset += len(batch)
+
+                    # Check if we've fetched all documents
+                    if len(batch) < batch_size:
+                        break
+            else:
+                # Fetch limited sample
+                docs_response = await self._client.get(
+                    f"/indexes/{uid}/documents",
+                    params={"limit": self.sample_docs},
+                )
+                docs_response.raise_for_status()
+                docs_data = docs_response.json()
+                if isinstance(docs_data, dict) and "results" in docs_data:
+                    sample_docs = cast(list[dict[str, Any]], docs_data["results"])
+                elif isinstance(docs_data, list):
+                    sample_docs = cast(list[dict[str, Any]], docs_data)
+        except httpx.HTTPError:
+            pass
+
+        return IndexData(
+            uid=uid,
+            primaryKey=idx_info.get("primaryKey"),
+            createdAt=idx_info.get("createdAt"),
+            updatedAt=idx_info.get("updatedAt"),
+            settings=IndexSettings(**settings_data),
+            stats=IndexStats(**stats_data),
+            sample_documents=sample_docs,
+        )
 
     async def get_tasks(self, limit: int = 1000) -> list[dict]:
         """Get recent task history.
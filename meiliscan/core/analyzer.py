@@ -1,6 +1,11 @@
 """Main analyzer that coordinates analysis across multiple analyzers."""
 
-from typing import Any
+import logging
+import os
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, TypeVar
 
 from meiliscan.analyzers.base import BaseAnalyzer
 from meiliscan.analyzers.best_practices import BestPracticesAnalyzer
@@ -12,6 +17,10 @@ from meiliscan.models.finding import Finding
 from meiliscan.models.index import IndexData
 from meiliscan.models.instance_config import InstanceLaunchConfig
 
+AnalyzerT = TypeVar("AnalyzerT", bound=BaseAnalyzer)
+
+logger = logging.getLogger(__name__)
+
 
 class Analyzer:
     """Main analyzer that runs multiple analysis passes."""
@@ -34,68 +43,133 @@ class Analyzer:
             self._analyzers = analyzers
 
         # Analyzers for global checks
-        self._performance_analyzer = PerformanceAnalyzer()
-        self._best_practices_analyzer = BestPracticesAnalyzer()
+        self._performance_analyzer = self._find_analyzer(PerformanceAnalyzer)
+        self._best_practices_analyzer = self._find_analyzer(BestPracticesAnalyzer)
         self._instance_config_analyzer = InstanceConfigAnalyzer()
 
-    def analyze_index(
+    def _find_analyzer(self, analyzer_cls: type[AnalyzerT]) -> AnalyzerT:
+        """Get the configured analyzer of a type, or a standalone instance.
+
+        Reusing the per-index instance for global checks avoids keeping two
+        copies of the same analyzer; a custom analyzer list without one still
+        gets a standalone instance so global checks always run.
+
+        Args:
+            analyzer_cls: The analyzer class to look for
+
+        Returns:
+            The configured analyzer instance, or a new one
+        """
+        for analyzer in self._analyzers:
+            if isinstance(analyzer, analyzer_cls):
+                return analyzer
+        return analyzer_cls()
+
+    def iter_index_findings(
         self, index: IndexData, detect_sensitive: bool = False
-    ) -> list[Finding]:
-        """Analyze a single index with all configured analyzers.
+    ) -> Iterator[Finding]:
+        """Lazily yield findings for a single index from all configured analyzers.
 
         Args:
             index: The index to analyze
             detect_sensitive: Whether to detect PII/sensitive fields in documents
 
-        Returns:
-            List of all findings from all analyzers
+        Yields:
+            Findings from each analyzer in turn
         """
-        findings: list[Finding] = []
-
         for analyzer in self._analyzers:
             try:
                 # Pass detect_sensitive to DocumentAnalyzer if supported
                 if isinstance(analyzer, DocumentAnalyzer):
-                    analyzer_findings = analyzer.analyze(
+                    yield from analyzer.analyze(
                         index, detect_sensitive=detect_sensitive
                     )
                 else:
-                    analyzer_findings = analyzer.analyze(index)
-                findings.extend(analyzer_findings)
+                    yield from analyzer.analyze(index)
             except Exception as e:
                 # Log error but continue with other analyzers
-                print(
-                    f"Warning: Analyzer {analyzer.name} failed on index {index.uid}: {e}"
+                logger.warning(
+                    "Analyzer %s failed on index %s: %s", analyzer.name, index.uid, e
                 )
 
-        return findings
+    def analyze_index(
+        self, index: IndexData, detect_sensitive: bool = False
+    ) -> list[Finding]:
+        """Analyze a single index with all configured analyzers.
+
+        Args:
+            index: The index to analyze
+            detect_sensitive: Whether to detect PII/sensitive fields in documents
+
+        Returns:
+            List of all findings from all analyzers
+        """
+        return list(self.iter_index_findings(index, detect_sensitive=detect_sensitive))
+
+    def iter_analyze_all(
+        self,
+        indexes: list[IndexData],
+        detect_sensitive: bool = False,
+        parallel: bool = False,
+    ) -> Iterator[tuple[IndexData, list[Finding]]]:
+        """Lazily analyze all indexes, yielding results in index order.
+
+        Indexes are independent of each other, so with ``parallel`` set and
+        more than one index they are analyzed in a process pool. Starting the
+        pool costs more than analyzing a handful of small indexes, so this is
+        opt-in. Each task pickles this ``Analyzer`` along with the index, so
+        every configured analyzer must be picklable.
+
+        Args:
+            indexes: List of indexes to analyze
+            detect_sensitive: Whether to detect PII/sensitive fields
+            parallel: Whether to analyze indexes in worker processes
+
+        Yields:
+            Each index with its findings, as soon as they are available
+        """
+        if not parallel or len(indexes) < 2:
+            for index in indexes:
+                yield (
+                    index,
+                    self.analyze_index(index, detect_sensitive=detect_sensitive),
+                )
+            return
+
+        analyze = partial(self.analyze_index, detect_sensitive=detect_sensitive)
+        max_workers = min(len(indexes), os.cpu_count() or 1)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            yield from zip(indexes, executor.map(analyze, indexes))
 
     def analyze_all(
-        self, indexes: list[IndexData], detect_sensitive: bool = False
+        self,
+        indexes: list[IndexData],
+        detect_sensitive: bool = False,
+        parallel: bool = False,
     ) -> dict[str, list[Finding]]:
         """Analyze all indexes.
 
         Args:
             indexes: List of indexes to analyze
             detect_sensitive: Whether to detect PII/sensitive fields
+            parallel: Whether to analyze indexes in worker processes
 
         Returns:
             Dictionary mapping index UID to findings
         """
-        results: dict[str, list[Finding]] = {}
-
-        for index in indexes:
-            results[index.uid] = self.analyze_index(
-                index, detect_sensitive=detect_sensitive
+        return {
+            index.uid: findings
+            for index, findings in self.iter_analyze_all(
+                indexes, detect_sensitive=detect_sensitive, parallel=parallel
             )
-
-        return results
+        }
 
     def analyze_global(
         self,
         indexes: list[IndexData],
         global_stats: dict[str, Any],
-        tasks: list[dict[str, Any]] | None = None,
+        tasks: Sequence[dict[str, Any]] | None = None,
         instance_version: str | None = None,
         instance_config: InstanceLaunchConfig | None = None,
     ) -> list[Finding]:
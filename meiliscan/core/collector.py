@@ -1,9 +1,10 @@
 """Data collector that orchestrates collection from various sources."""
 
+import asyncio
+from collections.abc import Sequence
 from pathlib import Path
 
 from meiliscan.collectors.base import BaseCollector
-from meiliscan.collectors.dump_parser import DumpParser
 from meiliscan.collectors.live_instance import LiveInstanceCollector
 from meiliscan.core.progress import ProgressCallback, emit_collect
 from meiliscan.models.index import IndexData
@@ -22,7 +23,7 @@ class DataCollector:
         self._indexes: list[IndexData] = []
         self._global_stats: dict = {}
         self._version: str | None = None
-        self._tasks: list[dict] = []
+        self._tasks: Sequence[dict] = ()
 
     @classmethod
     def from_url(
@@ -63,6 +64,8 @@ class DataCollector:
         Returns:
             Configured DataCollector
         """
+        from meiliscan.collectors.dump_parser import DumpParser
+
         collector = DumpParser(dump_path=dump_path, max_sample_docs=max_sample_docs)
         return cls(collector)
 
@@ -78,20 +81,21 @@ class DataCollector:
         if not await self._collector.connect(progress_cb):
             return False
 
-        emit_collect(progress_cb, "Fetching version...")
-        self._version = await self._collector.get_version()
-
-        emit_collect(progress_cb, "Fetching global stats...")
-        self._global_stats = await self._collector.get_stats()
-
-        self._indexes = await self._collector.get_indexes(progress_cb)
+        # Version, global stats and indexes are independent, so fetch them
+        # concurrently rather than paying for each round trip in turn
+        emit_collect(progress_cb, "Fetching version and global stats...")
+        self._version, self._global_stats, self._indexes = await asyncio.gather(
+            self._collector.get_version(),
+            self._collector.get_stats(),
+            self._collector.get_indexes(progress_cb),
+        )
 
         # Get tasks if available
         emit_collect(progress_cb, "Fetching tasks...")
         try:
             self._tasks = await self._collector.get_tasks()
         except Exception:
-            self._tasks = []
+            self._tasks = ()
 
         emit_collect(
             progress_cb,
@@ -118,11 +122,11 @@ class DataCollector:
         return self._global_stats
 
     @property
-    def tasks(self) -> list[dict]:
+    def tasks(self) -> Sequence[dict]:
         """Get task history."""
         return self._tasks
 
-    async def get_tasks(self, limit: int = 1000) -> list[dict]:
+    async def get_tasks(self, limit: int = 1000) -> Sequence[dict]:
         """Get tasks from the underlying collector.
 
         Args:
@@ -2,13 +2,11 @@
 
 from typing import Any
 
-from datetime import datetime
-
 from meiliscan.core.analyzer import Analyzer
 from meiliscan.core.collector import DataCollector
 from meiliscan.core.progress import ProgressCallback, emit_analyze
 from meiliscan.core.scorer import HealthScorer
-from meiliscan.models.finding import FindingSeverity
+from meiliscan.models.finding import Finding, FindingSeverity
 from meiliscan.models.report import ActionPlan, AnalysisReport, SourceInfo
 
 
@@ -33,6 +31,7 @@ class Reporter:
                 - probe_search: Whether search probes were run
                 - _probe_findings: List of findings from search probes
                 - detect_sensitive: Whether to detect PII fields
+                - parallel: Whether to analyze indexes in worker processes
         """
         self._collector = collector
         self._analyzer = analyzer or Analyzer()
@@ -60,7 +59,6 @@ class Reporter:
                 url=source_url,
                 meilisearch_version=self._collector.version,
             ),
-            generated_at=datetime.utcnow(),
         )
 
         # Add global stats
@@ -80,7 +78,15 @@ class Reporter:
             total=total_indexes,
         )
 
-        for i, index in enumerate(indexes, start=1):
+        # Findings are merged and progress is reported as each index's
+        # results arrive
+        results = self._analyzer.iter_analyze_all(
+            indexes,
+            detect_sensitive=detect_sensitive,
+            parallel=self._analysis_options.get("parallel", False),
+        )
+
+        for i, (index, findings) in enumerate(results, start=1):
             emit_analyze(
                 progress_cb,
                 f"Analyzing index: {index.uid}",
@@ -90,13 +96,7 @@ class Reporter:
             )
 
             report.add_index(index)
-
-            # Run analysis
-            findings = self._analyzer.analyze_index(
-                index, detect_sensitive=detect_sensitive
-            )
-            for finding in findings:
-                report.add_finding(finding)
+            report.add_findings(index.uid, findings)
 
         # Run global analysis
         emit_analyze(
@@ -127,47 +127,42 @@ class Reporter:
             current=total_indexes,
             total=total_indexes,
         )
+        all_findings = report.get_all_findings()
         report.calculate_summary()
-        self._scorer.score_report(report)
+        self._scorer.score_report(report, all_findings)
 
         # Generate action plan
-        report.action_plan = self._generate_action_plan(report)
+        report.action_plan = self._generate_action_plan(report, all_findings)
 
         emit_analyze(
             progress_cb,
-            f"Analysis complete: {len(report.get_all_findings())} findings",
+            f"Analysis complete: {len(all_findings)} findings",
             current=total_indexes,
             total=total_indexes,
         )
 
         return report
 
-    def _generate_action_plan(self, report: AnalysisReport) -> ActionPlan:
+    def _generate_action_plan(
+        self, report: AnalysisReport, findings: list[Finding]
+    ) -> ActionPlan:
         """Generate prioritized action plan from findings.
 
         Args:
             report: The analysis report
+            findings: All findings of the report
 
         Returns:
             Action plan with prioritized findings
         """
-        all_findings = report.get_all_findings()
-
-        # Sort findings by severity (critical first)
-        severity_order = {
-            FindingSeverity.CRITICAL: 0,
-            FindingSeverity.WARNING: 1,
-            FindingSeverity.SUGGESTION: 2,
-            FindingSeverity.INFO: 3,
-        }
-
-        sorted_findings = sorted(
-            all_findings,
-            key=lambda f: (severity_order.get(f.severity, 4), f.id),
-        )
-
+        # Order non-info findings by severity (critical first), then ID
         priority_order = [
-            f.id for f in sorted_findings if f.severity != FindingSeverity.INFO
+            finding_id
+            for _, finding_id in sorted(
+                (f.severity.rank, f.id)
+                for f in findings
+                if f.severity != FindingSeverity.INFO
+            )
         ]
 
         # Estimate impact based on findings
@@ -40,17 +40,21 @@ class HealthScorer:
         score = max(0, self.max_score - total_penalty)
         return score
 
-    def score_report(self, report: AnalysisReport) -> int:
+    def score_report(
+        self, report: AnalysisReport, findings: list[Finding] | None = None
+    ) -> int:
         """Calculate and set the health score for a report.
 
         Args:
             report: The analysis report to score
+            findings: All findings of the report, if already gathered
 
         Returns:
             The calculated health score
         """
-        all_findings = report.get_all_findings()
-        score = self.calculate_score(all_findings)
+        if findings is None:
+            findings = report.get_all_findings()
+        score = self.calculate_score(findings)
         report.summary.health_score = score
         return score
 
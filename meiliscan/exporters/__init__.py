@@ -1,10 +1,9 @@
 """Exporters module initialization."""
 
-from meiliscan.exporters.agent_exporter import AgentExporter
+# Exporters are imported lazily so that using one format does not pay the
+# import cost of all the others
+
 from meiliscan.exporters.base import BaseExporter
-from meiliscan.exporters.json_exporter import JsonExporter
-from meiliscan.exporters.markdown_exporter import MarkdownExporter
-from meiliscan.exporters.sarif_exporter import SarifExporter
 
 __all__ = [
     "AgentExporter",
@@ -13,3 +12,24 @@ __all__ = [
     "MarkdownExporter",
     "SarifExporter",
 ]
+
+
+def __getattr__(name: str):
+    """Lazy import mechanism for exporter implementations."""
+    if name == "AgentExporter":
+        from meiliscan.exporters.agent_exporter import AgentExporter
+
+        return AgentExporter
+    if name == "JsonExporter":
+        from meiliscan.exporters.json_exporter import JsonExporter
+
+        return JsonExporter
+    if name == "MarkdownExporter":
+        from meiliscan.exporters.markdown_exporter import MarkdownExporter
+
+        return MarkdownExporter
+    if name == "SarifExporter":
+        from meiliscan.exporters.sarif_exporter import SarifExporter
+
+        return SarifExporter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,6 +5,7 @@ AI coding agents (Claude, GPT, etc.). It includes clear sections,
 actionable fix commands, and prioritized issues.
 """
 
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
@@ -14,13 +15,8 @@ from meiliscan.exporters.base import BaseExporter
 from meiliscan.models.finding import Finding, FindingSeverity
 from meiliscan.models.report import AnalysisReport
 
-# Severity priority for sorting (lower = higher priority)
-SEVERITY_PRIORITY = {
-    FindingSeverity.CRITICAL: 0,
-    FindingSeverity.WARNING: 1,
-    FindingSeverity.SUGGESTION: 2,
-    FindingSeverity.INFO: 3,
-}
+# Sort key ordering findings by severity (critical first)
+_by_severity = attrgetter("severity.rank")
 
 
 class AgentExporter(BaseExporter):
@@ -145,7 +141,7 @@ class AgentExporter(BaseExporter):
         content = "\n".join(lines)
 
         if output_path:
-            output_path.write_text(content)
+            output_path.write_bytes(content.encode("utf-8"))
 
         return content
 
@@ -360,11 +356,7 @@ class AgentExporter(BaseExporter):
             top_issue = "None"
             if index_data.findings:
                 # Sort by severity and take first
-                sorted_findings = sorted(
-                    index_data.findings,
-                    key=lambda f: SEVERITY_PRIORITY.get(f.severity, 99),
-                )
-                top = sorted_findings[0]
+                top = min(index_data.findings, key=_by_severity)
                 top_issue = f"{top.id}: {top.title[:30]}..."
 
             lines.append(
@@ -381,7 +373,7 @@ class AgentExporter(BaseExporter):
         for index_data in report.indexes.values():
             all_findings.extend(index_data.findings)
 
-        return sorted(all_findings, key=lambda f: SEVERITY_PRIORITY.get(f.severity, 99))
+        return sorted(all_findings, key=_by_severity)
 
     def _get_health_status(self, score: int) -> str:
         """Get health status description from score."""
@@ -11,13 +11,24 @@ from meiliscan.models.report import AnalysisReport
 class JsonExporter(BaseExporter):
     """Export reports to JSON format."""
 
-    def __init__(self, pretty: bool = True):
+    def __init__(
+        self, pretty: bool = True, return_str: bool = True, sort_keys: bool = False
+    ):
         """Initialize the JSON exporter.
 
         Args:
             pretty: Whether to format output with indentation
+            return_str: Whether export() should decode and return the JSON.
+                When False, the JSON is only written to ``output_path`` and
+                an empty string is returned.
+            sort_keys: Whether to sort object keys, e.g. for stable diffs
         """
         self.pretty = pretty
+        self.return_str = return_str
+        self.sort_keys = sort_keys
+        self._opts = (orjson.OPT_INDENT_2 if pretty else 0) | (
+            orjson.OPT_SORT_KEYS if sort_keys else 0
+        )
 
     @property
     def format_name(self) -> str:
@@ -35,18 +46,13 @@ class JsonExporter(BaseExporter):
             output_path: Optional path to write the JSON to
 
         Returns:
-            The JSON string
+            The JSON string, or an empty string if ``return_str`` is False
         """
         data = report.to_dict()
 
-        opts = orjson.OPT_SORT_KEYS
-        if self.pretty:
-            opts |= orjson.OPT_INDENT_2
-
-        json_bytes = orjson.dumps(data, option=opts)
-        json_str = json_bytes.decode("utf-8")
+        json_bytes = orjson.dumps(data, option=self._opts)
 
         if output_path:
-            output_path.write_text(json_str)
+            output_path.write_bytes(json_bytes)
 
-        return json_str
+        return json_bytes.decode("utf-8") if self.return_str else ""
@@ -1,12 +1,67 @@
 """Markdown exporter for analysis reports."""
 
-import json
+import io
+from operator import attrgetter
 from pathlib import Path
 
+import orjson
+
 from meiliscan.exporters.base import BaseExporter
 from meiliscan.models.finding import FindingSeverity
 from meiliscan.models.report import AnalysisReport
 
+# Sort key ordering findings by severity (critical first)
+_by_severity = attrgetter("severity.rank")
+
+
+def _dumps(value: object) -> str:
+    """Serialize a value as indented JSON for embedding in Markdown."""
+    return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+
+GLOBAL_FINDING_TEMPLATE = """\
+### {icon} {id}: {title}
+
+**Severity:** {severity}
+**Category:** {category}
+
+{description}
+
+**Impact:** {impact}
+
+"""
+
+INDEX_FINDING_TEMPLATE = """\
+#### {icon} {id}: {title}
+
+**Severity:** {severity} | **Category:** {category}
+
+{description}
+
+**Impact:** {impact}
+
+"""
+
+JSON_VALUE_TEMPLATE = """\
+**{label}:**
+```json
+{value}
+```
+
+"""
+
+FIX_TEMPLATE = """\
+**Fix:**
+```bash
+# {endpoint}
+curl -X PATCH '<your-meilisearch-url>{path}' \\
+  -H 'Content-Type: application/json' \\
+  -H 'Authorization: Bearer <your-api-key>' \\
+  --data-binary '{payload}'
+```
+
+"""
+
 
 class MarkdownExporter(BaseExporter):
     """Export reports to Markdown format."""
@@ -36,185 +91,143 @@ class MarkdownExporter(BaseExporter):
         Returns:
             The Markdown string
         """
-        lines: list[str] = []
+        buf = io.StringIO()
+        write = buf.write
 
         # Header
-        lines.append("# MeiliSearch Analysis Report")
-        lines.append("")
-        lines.append(
-            f"**Generated:** {report.generated_at.strftime('%Y-%m-%d %H:%M:%S UTC')}"
-        )
-        lines.append(f"**Source:** {report.source.type}")
+        write("# MeiliSearch Analysis Report\n\n")
+        write(f"**Generated:** {report.generated_at_display}\n")
+        write(f"**Source:** {report.source.type}\n")
         if report.source.url:
-            lines.append(f"**URL:** {report.source.url}")
+            write(f"**URL:** {report.source.url}\n")
         if report.source.meilisearch_version:
-            lines.append(
-                f"**MeiliSearch Version:** {report.source.meilisearch_version}"
-            )
-        lines.append("")
+            write(f"**MeiliSearch Version:** {report.source.meilisearch_version}\n")
+        write("\n")
 
         # Summary
-        lines.append("## Summary")
-        lines.append("")
-        lines.append("| Metric | Value |")
-        lines.append("|--------|-------|")
-        lines.append(f"| Total Indexes | {report.summary.total_indexes} |")
-        lines.append(f"| Total Documents | {report.summary.total_documents:,} |")
-        lines.append(f"| Health Score | {report.summary.health_score}/100 |")
-        lines.append(f"| Critical Issues | {report.summary.critical_issues} |")
-        lines.append(f"| Warnings | {report.summary.warnings} |")
-        lines.append(f"| Suggestions | {report.summary.suggestions} |")
-        lines.append("")
+        summary = report.summary
+        write("## Summary\n\n")
+        write("| Metric | Value |\n")
+        write("|--------|-------|\n")
+        write(f"| Total Indexes | {summary.total_indexes} |\n")
+        write(f"| Total Documents | {summary.total_documents:,} |\n")
+        write(f"| Health Score | {summary.health_score}/100 |\n")
+        write(f"| Critical Issues | {summary.critical_issues} |\n")
+        write(f"| Warnings | {summary.warnings} |\n")
+        write(f"| Suggestions | {summary.suggestions} |\n\n")
 
         # Health Score Bar
-        filled = int(report.summary.health_score / 5)
+        filled = int(summary.health_score / 5)
         empty = 20 - filled
         score_bar = "█" * filled + "░" * empty
-        lines.append(f"**Health:** `{score_bar}` {report.summary.health_score}/100")
-        lines.append("")
+        write(f"**Health:** `{score_bar}` {summary.health_score}/100\n\n")
 
         # Global Findings
         if report.global_findings:
-            lines.append("## Global Findings")
-            lines.append("")
-            for finding in sorted(
-                report.global_findings,
-                key=lambda f: (
-                    0
-                    if f.severity == FindingSeverity.CRITICAL
-                    else 1
-                    if f.severity == FindingSeverity.WARNING
-                    else 2
-                    if f.severity == FindingSeverity.SUGGESTION
-                    else 3
-                ),
-            ):
-                icon = self.SEVERITY_ICONS.get(finding.severity, "⚪")
-                lines.append(f"### {icon} {finding.id}: {finding.title}")
-                lines.append("")
-                lines.append(f"**Severity:** {finding.severity.value}")
-                lines.append(f"**Category:** {finding.category.value}")
-                lines.append("")
-                lines.append(finding.description)
-                lines.append("")
-                lines.append(f"**Impact:** {finding.impact}")
-                lines.append("")
+            write("## Global Findings\n\n")
+            for finding in sorted(report.global_findings, key=_by_severity):
+                write(
+                    GLOBAL_FINDING_TEMPLATE.format(
+                        icon=self.SEVERITY_ICONS.get(finding.severity, "⚪"),
+                        id=finding.id,
+                        title=finding.title,
+                        severity=finding.severity.value,
+                        category=finding.category.value,
+                        description=finding.description,
+                        impact=finding.impact,
+                    )
+                )
                 if finding.current_value is not None:
-                    lines.append(f"**Current Value:** `{finding.current_value}`")
+                    write(f"**Current Value:** `{finding.current_value}`\n")
                 if finding.recommended_value is not None:
-                    lines.append(f"**Recommended:** `{finding.recommended_value}`")
-                lines.append("")
-                lines.append("---")
-                lines.append("")
+                    write(f"**Recommended:** `{finding.recommended_value}`\n")
+                write("\n---\n\n")
 
         # Index Findings
         for index_uid, index_analysis in report.indexes.items():
-            lines.append(f"## Index: `{index_uid}`")
-            lines.append("")
+            write(f"## Index: `{index_uid}`\n\n")
 
             # Index metadata
             metadata = index_analysis.metadata
-            lines.append("### Metadata")
-            lines.append("")
-            lines.append("| Property | Value |")
-            lines.append("|----------|-------|")
-            lines.append(f"| Primary Key | {metadata.get('primary_key', 'N/A')} |")
-            lines.append(f"| Document Count | {metadata.get('document_count', 0):,} |")
-            lines.append("")
+            write("### Metadata\n\n")
+            write("| Property | Value |\n")
+            write("|----------|-------|\n")
+            write(f"| Primary Key | {metadata.get('primary_key', 'N/A')} |\n")
+            write(f"| Document Count | {metadata.get('document_count', 0):,} |\n\n")
 
             # Index findings
-            if index_analysis.findings:
-                lines.append("### Findings")
-                lines.append("")
-                for finding in sorted(
-                    index_analysis.findings,
-                    key=lambda f: (
-                        0
-                        if f.severity == FindingSeverity.CRITICAL
-                        else 1
-                        if f.severity == FindingSeverity.WARNING
-                        else 2
-                        if f.severity == FindingSeverity.SUGGESTION
-                        else 3
-                    ),
-                ):
-                    icon = self.SEVERITY_ICONS.get(finding.severity, "⚪")
-                    lines.append(f"#### {icon} {finding.id}: {finding.title}")
-                    lines.append("")
-                    lines.append(
-                        f"**Severity:** {finding.severity.value} | **Category:** {finding.category.value}"
+            if not index_analysis.findings:
+                write("*No findings for this index.*\n\n")
+                continue
+
+            write("### Findings\n\n")
+            for finding in sorted(index_analysis.findings, key=_by_severity):
+                write(
+                    INDEX_FINDING_TEMPLATE.format(
+                        icon=self.SEVERITY_ICONS.get(finding.severity, "⚪"),
+                        id=finding.id,
+                        title=finding.title,
+                        severity=finding.severity.value,
+                        category=finding.category.value,
+                        description=finding.description,
+                        impact=finding.impact,
+                    )
+                )
+
+                if finding.current_value is not None:
+                    write(
+                        JSON_VALUE_TEMPLATE.format(
+                            label="Current Value",
+                            value=_dumps(finding.current_value),
+                        )
                     )
-                    lines.append("")
-                    lines.append(finding.description)
-                    lines.append("")
-                    lines.append(f"**Impact:** {finding.impact}")
-                    lines.append("")
-
-                    if finding.current_value is not None:
-                        lines.append("**Current Value:**")
-                        lines.append("```json")
-                        lines.append(json.dumps(finding.current_value, indent=2))
-                        lines.append("```")
-                        lines.append("")
-
-                    if finding.recommended_value is not None:
-                        lines.append("**Recommended:**")
-                        lines.append("```json")
-                        lines.append(json.dumps(finding.recommended_value, indent=2))
-                        lines.append("```")
-                        lines.append("")
-
-                    if finding.fix:
-                        lines.append("**Fix:**")
-                        lines.append("```bash")
-                        lines.append(f"# {finding.fix.endpoint}")
-                        lines.append(
-                            f"curl -X PATCH '<your-meilisearch-url>{finding.fix.endpoint.split(' ')[1]}' \\"
+
+                if finding.recommended_value is not None:
+                    write(
+                        JSON_VALUE_TEMPLATE.format(
+                            label="Recommended",
+                            value=_dumps(finding.recommended_value),
+                        )
+                    )
+
+                if finding.fix:
+                    write(
+                        FIX_TEMPLATE.format(
+                            endpoint=finding.fix.endpoint,
+                            path=finding.fix.endpoint.split(" ")[1],
+                            payload=_dumps(finding.fix.payload),
                         )
-                        lines.append("  -H 'Content-Type: application/json' \\")
-                        lines.append("  -H 'Authorization: Bearer <your-api-key>' \\")
-                        payload_json = json.dumps(finding.fix.payload, indent=2)
-                        lines.append(f"  --data-binary '{payload_json}'")
-                        lines.append("```")
-                        lines.append("")
-
-                    if finding.references:
-                        lines.append("**References:**")
-                        for ref in finding.references:
-                            lines.append(f"- [{ref}]({ref})")
-                        lines.append("")
-
-                    lines.append("---")
-                    lines.append("")
-            else:
-                lines.append("*No findings for this index.*")
-                lines.append("")
+                    )
+
+                if finding.references:
+                    write("**References:**\n")
+                    for ref in finding.references:
+                        write(f"- [{ref}]({ref})\n")
+                    write("\n")
+
+                write("---\n\n")
 
         # Action Plan
         if report.action_plan.priority_order:
-            lines.append("## Recommended Action Plan")
-            lines.append("")
-            lines.append("Fix issues in this order:")
-            lines.append("")
+            write("## Recommended Action Plan\n\n")
+            write("Fix issues in this order:\n\n")
             for i, finding_id in enumerate(report.action_plan.priority_order[:10], 1):
-                lines.append(f"{i}. **{finding_id}**")
-            lines.append("")
+                write(f"{i}. **{finding_id}**\n")
+            write("\n")
 
             if report.action_plan.estimated_impact:
-                lines.append("### Estimated Impact")
-                lines.append("")
+                write("### Estimated Impact\n\n")
                 for metric, value in report.action_plan.estimated_impact.items():
-                    lines.append(f"- **{metric.replace('_', ' ').title()}:** {value}")
-                lines.append("")
+                    write(f"- **{metric.replace('_', ' ').title()}:** {value}\n")
+                write("\n")
 
         # Footer
-        lines.append("---")
-        lines.append("")
-        lines.append(f"*Generated by Meiliscan v{report.version}*")
+        write("---\n\n")
+        write(f"*Generated by Meiliscan v{report.version}*")
 
-        content = "\n".join(lines)
+        content = buf.getvalue()
 
         if output_path:
-            output_path.write_text(content)
+            output_path.write_bytes(content.encode("utf-8"))
 
         return content
@@ -57,12 +57,11 @@ class SarifExporter(BaseExporter):
         sarif_output = self._build_sarif(report)
 
         json_bytes = orjson.dumps(sarif_output, option=orjson.OPT_INDENT_2)
-        json_str = json_bytes.decode("utf-8")
 
         if output_path:
-            output_path.write_text(json_str)
+            output_path.write_bytes(json_bytes)
 
-        return json_str
+        return json_bytes.decode("utf-8")
 
     def _build_sarif(self, report: AnalysisReport) -> dict[str, Any]:
         """Build the complete SARIF document structure."""
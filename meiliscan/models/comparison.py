@@ -6,7 +6,7 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
-from meiliscan.models.finding import Finding, FindingSeverity
+from meiliscan.models.finding import Finding, FindingSeverity, utc_now
 
 
 class ChangeType(str, Enum):
@@ -133,7 +133,7 @@ class ComparisonReport(BaseModel):
     """Complete comparison between two analysis reports."""
 
     version: str = Field(default="1.0.0")
-    generated_at: datetime = Field(default_factory=datetime.utcnow)
+    generated_at: datetime = Field(default_factory=utc_now)
 
     # Source reports
     old_source: dict[str, Any] = Field(..., description="Old report source info")
@@ -1,12 +1,21 @@
 """Finding model representing analysis findings/issues."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 
+def utc_now() -> datetime:
+    """Get the current UTC time as a naive datetime.
+
+    Equivalent to the deprecated ``datetime.utcnow()``; timestamps stay naive
+    so they remain comparable with those in previously saved reports.
+    """
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
 class FindingSeverity(str, Enum):
     """Severity levels for findings."""
 
@@ -15,6 +24,15 @@ class FindingSeverity(str, Enum):
     SUGGESTION = "suggestion"
     INFO = "info"
 
+    @property
+    def rank(self) -> int:
+        """Sort rank of this severity (0 = most severe)."""
+        return _SEVERITY_RANKS[self]
+
+
+# Severity sort ranks, most severe first
+_SEVERITY_RANKS = {severity: rank for rank, severity in enumerate(FindingSeverity)}
+
 
 class FindingCategory(str, Enum):
     """Categories for findings."""
@@ -56,7 +74,7 @@ class Finding(BaseModel):
     recommended_value: Any = Field(default=None, description="Recommended value")
     fix: FindingFix | None = Field(default=None, description="Suggested fix")
     references: list[str] = Field(default_factory=list, description="Reference URLs")
-    detected_at: datetime = Field(default_factory=datetime.utcnow)
+    detected_at: datetime = Field(default_factory=utc_now)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert finding to dictionary for export."""
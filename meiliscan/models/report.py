@@ -1,13 +1,18 @@
 """Report models for analysis output."""
 
+from collections import Counter
+from collections.abc import Iterable
 from datetime import datetime
+from operator import attrgetter
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
-from meiliscan.models.finding import Finding
+from meiliscan.models.finding import Finding, FindingSeverity, utc_now
 from meiliscan.models.index import IndexData
 
+_get_severity = attrgetter("severity")
+
 
 class SourceInfo(BaseModel):
     """Information about the analysis source."""
@@ -36,13 +41,18 @@ class AnalysisSummary(BaseModel):
     info_count: int = Field(default=0, description="Number of info items")
 
 
-class IndexAnalysis(BaseModel):
-    """Analysis results for a single index."""
+class IndexAnalysisSummary(BaseModel):
+    """Analysis results for a single index, without sample documents."""
 
     metadata: dict[str, Any] = Field(default_factory=dict)
     settings: dict[str, Any] = Field(default_factory=dict)
     statistics: dict[str, Any] = Field(default_factory=dict)
     findings: list[Finding] = Field(default_factory=list)
+
+
+class IndexAnalysis(IndexAnalysisSummary):
+    """Analysis results for a single index."""
+
     sample_documents: list[dict[str, Any]] = Field(default_factory=list)
 
 
@@ -62,7 +72,7 @@ class AnalysisReport(BaseModel):
 
     schema_version: str = Field(default="1.0.0", alias="$schema_version")
     version: str = Field(default="1.0.0", description="Report format version")
-    generated_at: datetime = Field(default_factory=datetime.utcnow)
+    generated_at: datetime = Field(default_factory=utc_now)
     source: SourceInfo = Field(..., description="Source information")
     summary: AnalysisSummary = Field(default_factory=AnalysisSummary)
     indexes: dict[str, IndexAnalysis] = Field(default_factory=dict)
@@ -70,13 +80,19 @@ class AnalysisReport(BaseModel):
     action_plan: ActionPlan = Field(default_factory=ActionPlan)
 
     # Internal storage not exported
-    _raw_indexes: dict[str, IndexData] = {}
+    _raw_indexes: dict[str, IndexData] = PrivateAttr(default_factory=dict)
 
     model_config = {"populate_by_name": True}
 
+    @property
+    def generated_at_display(self) -> str:
+        """Get the generation time formatted for display."""
+        return self.generated_at.strftime("%Y-%m-%d %H:%M:%S UTC")
+
     def add_index(self, index: IndexData) -> None:
         """Add an index to the report."""
         self._raw_indexes[index.uid] = index
+        settings = index.settings
         self.indexes[index.uid] = IndexAnalysis(
             metadata={
                 "primary_key": index.primary_key,
@@ -89,7 +105,11 @@ class AnalysisReport(BaseModel):
                 "document_count": index.document_count,
             },
             settings={
-                "current": index.settings.model_dump(by_alias=True, exclude_none=True),
+                # Serialize via the compiled serializer, skipping model_dump's
+                # argument handling
+                "current": settings.__pydantic_serializer__.to_python(
+                    settings, by_alias=True, exclude_none=True
+                ),
             },
             statistics={
                 "field_distribution": index.stats.field_distribution,
@@ -106,29 +126,39 @@ class AnalysisReport(BaseModel):
         else:
             self.global_findings.append(finding)
 
+    def add_findings(self, index_uid: str | None, findings: Iterable[Finding]) -> None:
+        """Add a batch of findings for one index in a single step.
+
+        Args:
+            index_uid: The index the findings belong to, or None for global
+                findings. Findings for an unknown index are stored as global.
+            findings: The findings to add
+        """
+        if index_uid and index_uid in self.indexes:
+            self.indexes[index_uid].findings.extend(findings)
+        else:
+            self.global_findings.extend(findings)
+
     def calculate_summary(self) -> None:
         """Calculate summary statistics from findings."""
-        all_findings: list[Finding] = list(self.global_findings)
+        # One pass over every finding list, counted in C by Counter
+        severity_counts = Counter(map(_get_severity, self.global_findings))
         for index_analysis in self.indexes.values():
-            all_findings.extend(index_analysis.findings)
+            severity_counts.update(map(_get_severity, index_analysis.findings))
 
-        self.summary.total_indexes = len(self.indexes)
-        self.summary.total_documents = sum(
-            idx.metadata.get("document_count", 0) for idx in self.indexes.values()
-        )
-        self.summary.critical_issues = sum(
-            1 for f in all_findings if f.severity.value == "critical"
-        )
-        self.summary.warnings = sum(
-            1 for f in all_findings if f.severity.value == "warning"
-        )
-        self.summary.suggestions = sum(
-            1 for f in all_findings if f.severity.value == "suggestion"
-        )
-        self.summary.info_count = sum(
-            1 for f in all_findings if f.severity.value == "info"
+        total_documents = sum(
+            index_analysis.metadata.get("document_count", 0)
+            for index_analysis in self.indexes.values()
         )
 
+        summary = self.summary
+        summary.total_indexes = len(self.indexes)
+        summary.total_documents = total_documents
+        summary.critical_issues = severity_counts[FindingSeverity.CRITICAL]
+        summary.warnings = severity_counts[FindingSeverity.WARNING]
+        summary.suggestions = severity_counts[FindingSeverity.SUGGESTION]
+        summary.info_count = severity_counts[FindingSeverity.INFO]
+
     def get_all_findings(self) -> list[Finding]:
         """Get all findings from the report."""
         findings: list[Finding] = list(self.global_findings)
@@ -156,8 +186,16 @@ class AnalysisReport(BaseModel):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert report to dictionary for export."""
-        return self.model_dump(
-            mode="json", by_alias=True, exclude_none=True, exclude={"_raw_indexes"}
+        # Call the compiled serializer directly; private attributes such as
+        # _raw_indexes are never serialized, so no exclude set is needed
+        return self.__pydantic_serializer__.to_python(
+            self, mode="json", by_alias=True, exclude_none=True
+        )
+
+    def to_json(self) -> bytes:
+        """Serialize the report straight to JSON bytes for export."""
+        return self.__pydantic_serializer__.to_json(
+            self, by_alias=True, exclude_none=True
         )
 
     @classmethod
@@ -171,3 +209,26 @@ class AnalysisReport(BaseModel):
             AnalysisReport instance
         """
         return cls.model_validate(data)
+
+
+class ComparisonInput(BaseModel):
+    """A saved report loaded only for historical comparison.
+
+    Holds just the parts of an ``AnalysisReport`` that a comparison reads.
+    Sample documents are not among them, so indexes are validated as
+    ``IndexAnalysisSummary`` and the (potentially large)
+    ``sample_documents`` arrays are skipped while parsing.
+    """
+
+    generated_at: datetime = Field(default_factory=utc_now)
+    source: SourceInfo = Field(..., description="Source information")
+    summary: AnalysisSummary = Field(default_factory=AnalysisSummary)
+    indexes: dict[str, IndexAnalysisSummary] = Field(default_factory=dict)
+    global_findings: list[Finding] = Field(default_factory=list)
+
+    def get_all_findings(self) -> list[Finding]:
+        """Get all findings from the report."""
+        findings: list[Finding] = list(self.global_findings)
+        for index_analysis in self.indexes.values():
+            findings.extend(index_analysis.findings)
+        return findings
@@ -1,6 +1,7 @@
 """FastAPI application for the web dashboard."""
 
 import asyncio
+import os
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Literal
@@ -8,6 +9,7 @@ from typing import Literal
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
 
 from meiliscan.core.collector import DataCollector
 from meiliscan.core.progress import ProgressEvent
@@ -17,12 +19,17 @@ from meiliscan.models.report import AnalysisReport
 # Analysis status type
 AnalysisStatus = Literal["idle", "running", "done", "error"]
 
+# Set to "1" to re-check template sources on every render while developing
+TEMPLATE_RELOAD_ENV = "MEILISCAN_TEMPLATE_RELOAD"
+
 
 class AppState:
     """Application state container."""
 
     def __init__(self):
         self.report: AnalysisReport | None = None
+        # Serialized report, stored once when an analysis run completes
+        self.report_json: bytes | None = None
         self.collector: DataCollector | None = None
         self.meili_url: str | None = None
         self.meili_api_key: str | None = None
@@ -59,26 +66,41 @@ class AppState:
 # Template filters - defined before create_app so they're available at registration time
 
 
+SEVERITY_COLORS = {
+    "critical": "red",
+    "warning": "yellow",
+    "suggestion": "blue",
+    "info": "gray",
+}
+
+SEVERITY_ICONS = {
+    "critical": "🔴",
+    "warning": "🟡",
+    "suggestion": "🔵",
+    "info": "⚪",
+}
+
+TREND_ICONS = {
+    "up": "&#8593;",
+    "down": "&#8595;",
+    "stable": "&#8596;",
+}
+
+TREND_COLORS = {
+    "up": "green",
+    "down": "red",
+    "stable": "blue",
+}
+
+
 def severity_color(severity: str) -> str:
     """Get CSS color class for severity level."""
-    colors = {
-        "critical": "red",
-        "warning": "yellow",
-        "suggestion": "blue",
-        "info": "gray",
-    }
-    return colors.get(severity.lower(), "gray")
+    return SEVERITY_COLORS.get(severity.lower(), "gray")
 
 
 def severity_icon(severity: str) -> str:
     """Get icon for severity level."""
-    icons = {
-        "critical": "🔴",
-        "warning": "🟡",
-        "suggestion": "🔵",
-        "info": "⚪",
-    }
-    return icons.get(severity.lower(), "⚪")
+    return SEVERITY_ICONS.get(severity.lower(), "⚪")
 
 
 def format_number(value: int | float) -> str:
@@ -90,24 +112,14 @@ def format_number(value: int | float) -> str:
 
 def trend_icon(trend: str) -> str:
     """Get icon for trend direction."""
-    icons = {
-        "up": "&#8593;",
-        "down": "&#8595;",
-        "stable": "&#8596;",
-    }
-    trend_str = trend.lower() if hasattr(trend, "lower") else str(trend)
-    return icons.get(trend_str, "&#8596;")
+    trend_str = trend.lower() if isinstance(trend, str) else str(trend).lower()
+    return TREND_ICONS.get(trend_str, "&#8596;")
 
 
 def trend_color(trend: str) -> str:
     """Get CSS color class for trend direction."""
-    colors = {
-        "up": "green",
-        "down": "red",
-        "stable": "blue",
-    }
-    trend_str = trend.lower() if hasattr(trend, "lower") else str(trend)
-    return colors.get(trend_str, "gray")
+    trend_str = trend.lower() if isinstance(trend, str) else str(trend).lower()
+    return TREND_COLORS.get(trend_str, "gray")
 
 
 # Severity order for sorting (lower number = higher priority)
@@ -187,6 +199,10 @@ def create_app(
     # Set up templates
     templates_path = Path(__file__).parent / "templates"
     templates = Jinja2Templates(directory=templates_path)
+    # Templates ship with the package, so compiled bytecode is cached on disk
+    # (in a per-user temp directory) and sources are not re-checked per render
+    templates.env.bytecode_cache = FileSystemBytecodeCache()
+    templates.env.auto_reload = os.environ.get(TEMPLATE_RELOAD_ENV) == "1"
 
     # Add custom template filters
     templates.env.filters["severity_color"] = severity_color
@@ -291,6 +307,7 @@ async def run_analysis(state: AppState) -> None:
         state.report = reporter.generate_report(
             source_url=state.meili_url, progress_cb=progress_cb
         )
+        state.report_json = state.report.to_json()
 
         state.analysis_status = "done"
         await state.emit_progress(None)  # Signal completion
@@ -2,38 +2,91 @@
 
 import asyncio
 import json
+from operator import attrgetter
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+import orjson
 from fastapi import BackgroundTasks, FastAPI, File, Form, Request, UploadFile
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, Response
+from pydantic import ValidationError
 from sse_starlette.sse import EventSourceResponse
 
-from meiliscan.analyzers.historical import HistoricalAnalyzer
 from meiliscan.exporters.agent_exporter import AgentExporter
 from meiliscan.exporters.json_exporter import JsonExporter
 from meiliscan.exporters.markdown_exporter import MarkdownExporter
 from meiliscan.exporters.sarif_exporter import SarifExporter
-from meiliscan.models.report import AnalysisReport
+from meiliscan.models.finding import Finding, FindingCategory, FindingSeverity
+from meiliscan.models.report import ComparisonInput
 from meiliscan.web.app import AppState, run_analysis
 
+if TYPE_CHECKING:
+    from meiliscan.analyzers.historical import HistoricalAnalyzer
+
 # Valid export formats
 EXPORT_FORMATS = ("json", "markdown", "sarif", "agent")
 
-# Severity order for sorting (lower number = higher priority)
-SEVERITY_ORDER = {
-    "critical": 0,
-    "warning": 1,
-    "suggestion": 2,
-    "info": 3,
-}
+# Chunk size used when streaming uploaded dumps to disk
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Enum members by lowercase value, for resolving query parameters once
+SEVERITY_BY_NAME = {s.value.lower(): s for s in FindingSeverity}
+CATEGORY_BY_NAME = {c.value.lower(): c for c in FindingCategory}
+
+# Sort key reading the precomputed rank off each severity member
+_by_severity = attrgetter("severity.rank")
+
+
+def is_invalid_json(error: ValidationError) -> bool:
+    """Check whether a validation error was caused by malformed JSON."""
+    return any(e["type"] == "json_invalid" for e in error.errors())
+
+
+def filter_findings(
+    findings: list[Finding],
+    severity: str | None = None,
+    category: str | None = None,
+    index: str | None = None,
+) -> list[Finding]:
+    """Filter findings by severity, category and index in a single pass.
+
+    Args:
+        findings: The findings to filter
+        severity: Optional severity name (case-insensitive)
+        category: Optional category name (case-insensitive)
+        index: Optional index UID
+
+    Returns:
+        The findings matching every given filter
+    """
+    severity_member = SEVERITY_BY_NAME.get(severity.lower()) if severity else None
+    category_member = CATEGORY_BY_NAME.get(category.lower()) if category else None
+    return [
+        f
+        for f in findings
+        if (not severity or f.severity is severity_member)
+        and (not category or f.category is category_member)
+        and (not index or f.index_uid == index)
+    ]
 
 
 def sort_findings_by_severity(findings: list) -> list:
     """Sort findings by severity (critical first, then warning, suggestion, info)."""
-    return sorted(
-        findings,
-        key=lambda f: SEVERITY_ORDER.get(f.severity.value.lower(), 4),
-    )
+    return sorted(findings, key=_by_severity)
+
+
+def get_historical_analyzer(app: FastAPI) -> "HistoricalAnalyzer":
+    """Get the app's shared HistoricalAnalyzer, creating it on first use.
+
+    The analyzer is stateless, so one instance serves every comparison. It is
+    imported lazily so workers that never compare reports don't load it.
+    """
+    analyzer = getattr(app.state, "historical_analyzer", None)
+    if analyzer is None:
+        from meiliscan.analyzers.historical import HistoricalAnalyzer
+
+        analyzer = app.state.historical_analyzer = HistoricalAnalyzer()
+    return analyzer
 
 
 def register_routes(app: FastAPI) -> None:
@@ -117,39 +170,22 @@ def register_routes(app: FastAPI) -> None:
         if state.report:
             all_findings = state.report.get_all_findings()
 
-        # Filter findings
-        filtered = all_findings
-        if severity:
-            filtered = [
-                f for f in filtered if f.severity.value.lower() == severity.lower()
-            ]
-        if category:
-            filtered = [
-                f for f in filtered if f.category.value.lower() == category.lower()
-            ]
-        if index:
-            filtered = [f for f in filtered if f.index_uid == index]
-
-        # Sort by severity (critical first)
-        filtered = sort_findings_by_severity(filtered)
-
-        # Get unique categories and indexes for filters
-        categories = sorted(set(f.category.value for f in all_findings))
-        indexes = sorted(set(f.index_uid for f in all_findings if f.index_uid))
-
-        # Count findings by severity for display
-        severity_counts = {
-            "critical": sum(
-                1 for f in all_findings if f.severity.value.lower() == "critical"
-            ),
-            "warning": sum(
-                1 for f in all_findings if f.severity.value.lower() == "warning"
-            ),
-            "suggestion": sum(
-                1 for f in all_findings if f.severity.value.lower() == "suggestion"
-            ),
-            "info": sum(1 for f in all_findings if f.severity.value.lower() == "info"),
-        }
+        # Filter findings and sort by severity (critical first)
+        filtered = sort_findings_by_severity(
+            filter_findings(all_findings, severity, category, index)
+        )
+
+        # Collect filter options and severity counts in a single pass
+        categories_seen: set[FindingCategory] = set()
+        index_uids: set[str] = set()
+        severity_counts = dict.fromkeys(SEVERITY_BY_NAME, 0)
+        for f in all_findings:
+            categories_seen.add(f.category)
+            if f.index_uid:
+                index_uids.add(f.index_uid)
+            severity_counts[f.severity.value] += 1
+        categories = sorted(c.value for c in categories_seen)
+        indexes = sorted(index_uids)
 
         return templates.TemplateResponse(
             "findings.html",
@@ -182,21 +218,10 @@ def register_routes(app: FastAPI) -> None:
         if state.report:
             all_findings = state.report.get_all_findings()
 
-        # Filter findings
-        filtered = all_findings
-        if severity:
-            filtered = [
-                f for f in filtered if f.severity.value.lower() == severity.lower()
-            ]
-        if category:
-            filtered = [
-                f for f in filtered if f.category.value.lower() == category.lower()
-            ]
-        if index:
-            filtered = [f for f in filtered if f.index_uid == index]
-
-        # Sort by severity (critical first)
-        filtered = sort_findings_by_severity(filtered)
+        # Filter findings and sort by severity (critical first)
+        filtered = sort_findings_by_severity(
+            filter_findings(all_findings, severity, category, index)
+        )
 
         return templates.TemplateResponse(
             "components/findings_list.html",
@@ -217,8 +242,7 @@ def register_routes(app: FastAPI) -> None:
 
         finding = None
         if state.report:
-            all_findings = state.report.get_all_findings()
-            finding = next((f for f in all_findings if f.id == finding_id), None)
+            finding = state.report.get_finding_by_id(finding_id)
 
         return templates.TemplateResponse(
             "components/finding_detail.html",
@@ -555,10 +579,10 @@ def register_routes(app: FastAPI) -> None:
 
         state: AppState = request.app.state.analyzer_state
 
-        # Save uploaded file to temp location
+        # Stream uploaded file to temp location without holding it in memory
         with tempfile.NamedTemporaryFile(delete=False, suffix=".dump") as tmp:
-            content = await file.read()
-            tmp.write(content)
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                tmp.write(chunk)
             tmp_path = Path(tmp.name)
 
         # Update connection info
@@ -618,6 +642,7 @@ def register_routes(app: FastAPI) -> None:
 
         # Reset all state
         state.report = None
+        state.report_json = None
         state.collector = None
         state.meili_url = None
         state.meili_api_key = None
@@ -626,31 +651,41 @@ def register_routes(app: FastAPI) -> None:
         return RedirectResponse(url="/", status_code=303)
 
     @app.get("/api/report")
-    async def api_report(request: Request) -> dict:
+    async def api_report(request: Request) -> Response:
         """Get the full report as JSON."""
         state: AppState = request.app.state.analyzer_state
 
         if not state.report:
-            return {"error": "No analysis data available"}
+            return JSONResponse({"error": "No analysis data available"})
 
-        return state.report.to_dict()
+        # Reuse the bytes serialized when the analysis run completed
+        content = state.report_json
+        if content is None:
+            content = state.report.to_json()
+        return Response(content=content, media_type="application/json")
 
     @app.get("/api/health")
-    async def api_health(request: Request) -> dict:
+    async def api_health(request: Request) -> Response:
         """Get health summary."""
         state: AppState = request.app.state.analyzer_state
 
         if not state.report:
-            return {"status": "no_data"}
+            return JSONResponse({"status": "no_data"})
 
-        return {
-            "status": "ok",
-            "health_score": state.report.summary.health_score,
-            "total_indexes": state.report.summary.total_indexes,
-            "total_documents": state.report.summary.total_documents,
-            "critical_issues": state.report.summary.critical_issues,
-            "warnings": state.report.summary.warnings,
-        }
+        summary = state.report.summary
+        return Response(
+            content=orjson.dumps(
+                {
+                    "status": "ok",
+                    "health_score": summary.health_score,
+                    "total_indexes": summary.total_indexes,
+                    "total_documents": summary.total_documents,
+                    "critical_issues": summary.critical_issues,
+                    "warnings": summary.warnings,
+                }
+            ),
+            media_type="application/json",
+        )
 
     @app.get("/api/export")
     async def api_export(request: Request, format: str = "json") -> Response:
@@ -744,22 +779,23 @@ def register_routes(app: FastAPI) -> None:
         comparison = None
 
         try:
-            # Parse old report
-            old_content = await old_report_file.read()
-            old_data = json.loads(old_content.decode("utf-8"))
-            old_report = AnalysisReport.model_validate(old_data)
-
-            # Parse new report
-            new_content = await new_report_file.read()
-            new_data = json.loads(new_content.decode("utf-8"))
-            new_report = AnalysisReport.model_validate(new_data)
+            # Parse and validate both reports directly from the raw bytes
+            old_report = ComparisonInput.model_validate_json(
+                await old_report_file.read()
+            )
+            new_report = ComparisonInput.model_validate_json(
+                await new_report_file.read()
+            )
 
             # Run comparison
-            analyzer = HistoricalAnalyzer()
+            analyzer = get_historical_analyzer(request.app)
             comparison = analyzer.compare(old_report, new_report)
 
-        except json.JSONDecodeError as e:
-            error = f"Invalid JSON in one of the uploaded files: {e}"
+        except ValidationError as e:
+            if is_invalid_json(e):
+                error = f"Invalid JSON in one of the uploaded files: {e}"
+            else:
+                error = f"Error comparing reports: {e}"
         except Exception as e:
             error = f"Error comparing reports: {e}"
 
@@ -780,21 +816,22 @@ def register_routes(app: FastAPI) -> None:
     ) -> dict:
         """Compare two reports and return JSON result."""
         try:
-            old_content = await old_report_file.read()
-            old_data = json.loads(old_content.decode("utf-8"))
-            old_report = AnalysisReport.model_validate(old_data)
-
-            new_content = await new_report_file.read()
-            new_data = json.loads(new_content.decode("utf-8"))
-            new_report = AnalysisReport.model_validate(new_data)
+            old_report = ComparisonInput.model_validate_json(
+                await old_report_file.read()
+            )
+            new_report = ComparisonInput.model_validate_json(
+                await new_report_file.read()
+            )
 
-            analyzer = HistoricalAnalyzer()
+            analyzer = get_historical_analyzer(request.app)
             comparison = analyzer.compare(old_report, new_report)
 
             return comparison.to_dict()
 
-        except json.JSONDecodeError as e:
-            return {"error": f"Invalid JSON: {e}"}
+        except ValidationError as e:
+            if is_invalid_json(e):
+                return {"error": f"Invalid JSON: {e}"}
+            return {"error": str(e)}
         except Exception as e:
             return {"error": str(e)}
 
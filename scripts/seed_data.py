@@ -21,6 +21,9 @@ Usage:
     # Seed only a specific index with a custom document count
     python scripts/seed_data.py dump --output test-dump.dump --index products --documents 50000
 
+    # Generate the same random content on every run (timestamps still vary)
+    python scripts/seed_data.py dump --output test-dump.dump --rng-seed 42
+
     # Seed a live MeiliSearch instance
     python scripts/seed_data.py seed --url http://localhost:7700
 
@@ -35,13 +38,22 @@ Usage:
 """
 
 import argparse
-import json
+import io
+import itertools
+import os
 import random
 import sys
 import tarfile
 import tempfile
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
+from typing import IO
+
+import orjson
 
 # Sample data for generating realistic documents
 PRODUCT_NAMES = [
@@ -195,6 +207,52 @@ ARTICLE_CONTENT_SNIPPETS = [
     "Faceted navigation allows users to filter results by category...",
 ]
 
+# Long text bodies for large-document (D001) and long-text (D008) cases.
+# Built once here: strings this long are not constant-folded by the compiler,
+# so repeating them inline would rebuild them for every document.
+LONG_PRODUCT_DESCRIPTION = "This is an extremely detailed product description. " * 200
+LONG_USER_MANUAL_EXCERPT = "Installation instructions and safety guidelines. " * 150
+LONG_ARTICLE_CONTENT = "This is a very detailed article. " * 1000
+LONG_SECTION_CONTENT = "In-depth analysis and explanation of this topic. " * 100
+LONG_ARTICLE_FULL_CONTENT = (
+    "Comprehensive guide covering all aspects of this topic. " * 300
+)
+
+# Fixed lists used by the large-array and large-document cases. Documents
+# are only serialized, never mutated, so rows share these instead of
+# rebuilding identical lists each time.
+PRODUCT_TAGS = [f"tag-{j}" for j in range(100)]
+ARTICLE_CODE_EXAMPLES = [
+    f"# Example {e}\n" + "print('code sample')\n" * 20 for e in range(5)
+]
+ARTICLE_REFERENCES = [
+    {"title": f"Reference {r}", "url": f"https://example.com/ref/{r}"}
+    for r in range(20)
+]
+
+# Preformatted product and user IDs that other indexes reference, so rows
+# pick from them instead of formatting a new ID each time
+PRODUCT_REF_IDS = [f"PROD-{n:05d}" for n in range(1, 501)]
+USER_REF_IDS = [f"USR-{n:06d}" for n in range(1, 201)]
+
+# gzip level for mock dumps; mostly repetitive JSON compresses well even at
+# the fastest level, and tarfile's default (9) dominates dump creation time
+DUMP_COMPRESSION_LEVEL = 1
+
+# Write buffer for the dump file, so the compressed stream reaches the disk
+# in large chunks rather than one small write per compressor flush
+DUMP_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Task status polling interval bounds (seconds) when seeding an instance
+TASK_POLL_INITIAL_INTERVAL = 0.05
+TASK_POLL_MAX_INTERVAL = 2.0
+
+# Maximum number of task uids checked per /tasks poll
+TASK_POLL_BATCH_SIZE = 100
+
+# Document batches are posted as NDJSON, which MeiliSearch accepts natively
+NDJSON_HEADERS = {"Content-Type": "application/x-ndjson"}
+
 # Size presets for dump generation
 # Note: "large" preset includes all 40+ indexes for testing pagination
 SIZE_PRESETS = {
@@ -285,25 +343,40 @@ SIZE_PRESETS = {
 }
 
 
-def generate_products(count: int = 500) -> list[dict]:
+def _isoformat_offsets(now: datetime, unit: str, count: int) -> list[str]:
+    """Precompute ISO timestamps going back from ``now`` in whole units.
+
+    Entry ``n`` is ``(now - timedelta(**{unit: n})).isoformat()``, so a
+    generator can index the list with its random offset instead of building
+    and formatting a datetime for every row.
+    """
+    step = timedelta(**{unit: 1})
+    return [(now - n * step).isoformat() for n in range(count + 1)]
+
+
+def generate_products(count: int = 500) -> Iterator[dict]:
     """Generate sample product documents with intentional issues."""
-    products = []
+    now = datetime.now()
+    days_ago = _isoformat_offsets(now, "days", 365)
+    # Draw the categorical fields for all rows at once
+    names = random.choices(PRODUCT_NAMES, k=count)
+    description_names = random.choices(PRODUCT_NAMES, k=count)
+    categories = random.choices(PRODUCT_CATEGORIES, k=count)
+    brands = random.choices(PRODUCT_BRANDS, k=count)
     for i in range(count):
         product = {
             "id": i + 1,
             "product_id": f"PROD-{i + 1:05d}",  # ID field that shouldn't be searchable
             "sku": f"SKU{random.randint(10000, 99999)}",
-            "name": random.choice(PRODUCT_NAMES),
-            "description": f"High-quality {random.choice(PRODUCT_NAMES).lower()} for everyday use.",
-            "category": random.choice(PRODUCT_CATEGORIES),
-            "brand": random.choice(PRODUCT_BRANDS),
+            "name": names[i],
+            "description": f"High-quality {description_names[i].lower()} for everyday use.",
+            "category": categories[i],
+            "brand": brands[i],
             "price": round(random.uniform(9.99, 999.99), 2),
             "stock": random.randint(0, 1000),
             "rating": round(random.uniform(1.0, 5.0), 1),
             "reviews_count": random.randint(0, 500),
-            "created_at": (
-                datetime.now() - timedelta(days=random.randint(1, 365))
-            ).isoformat(),
+            "created_at": days_ago[random.randint(1, 365)],
         }
 
         # Add some inconsistencies (D002 - inconsistent schema)
@@ -329,7 +402,7 @@ def generate_products(count: int = 500) -> list[dict]:
             }
         if random.random() < 0.1:
             # Large arrays (D004)
-            product["tags"] = [f"tag-{j}" for j in range(random.randint(50, 100))]
+            product["tags"] = PRODUCT_TAGS[: random.randint(50, 100)]
 
         # D001: Large documents - add verbose product descriptions (~15KB+)
         if random.random() < 0.08:
@@ -344,46 +417,56 @@ def generate_products(count: int = 500) -> list[dict]:
                     }
                 )
             product["detailed_specifications"] = specs
-            product["full_description"] = (
-                "This is an extremely detailed product description. " * 200
-            )
-            product["user_manual_excerpt"] = (
-                "Installation instructions and safety guidelines. " * 150
-            )
+            product["full_description"] = LONG_PRODUCT_DESCRIPTION
+            product["user_manual_excerpt"] = LONG_USER_MANUAL_EXCERPT
 
-        products.append(product)
+        yield product
 
-    return products
 
-
-def generate_users(count: int = 200) -> list[dict]:
+def generate_users(count: int = 200) -> Iterator[dict]:
     """Generate sample user documents."""
-    users = []
+    now = datetime.now()
+    # Draw the categorical fields for all rows at once
+    first_names = random.choices(USER_FIRST_NAMES, k=count)
+    last_names = random.choices(USER_LAST_NAMES, k=count)
+    countries = random.choices(["US", "UK", "DE", "FR", "JP", "AU"], k=count)
+    active_flags = random.choices([True, False], k=count)
     for i in range(count):
         user = {
             "id": i + 1,
             "user_id": f"USR-{i + 1:06d}",
             "email": f"user{i + 1}@example.com",
-            "first_name": random.choice(USER_FIRST_NAMES),
-            "last_name": random.choice(USER_LAST_NAMES),
+            "first_name": first_names[i],
+            "last_name": last_names[i],
             "age": random.randint(18, 80),
-            "country": random.choice(["US", "UK", "DE", "FR", "JP", "AU"]),
-            "signup_date": (
-                datetime.now() - timedelta(days=random.randint(1, 1000))
-            ).isoformat(),
-            "is_active": random.choice([True, False]),
+            "country": countries[i],
+            "signup_date": (now - timedelta(days=random.randint(1, 1000))).isoformat(),
+            "is_active": active_flags[i],
             "orders_count": random.randint(0, 100),
         }
-        users.append(user)
-
-    return users
+        yield user
 
 
-def generate_articles(count: int = 100) -> list[dict]:
+def generate_articles(count: int = 100) -> Iterator[dict]:
     """Generate sample article documents with intentional issues."""
-    articles = []
+    now = datetime.now()
+    # Draw the categorical fields for all rows at once
+    snippets = random.choices(ARTICLE_CONTENT_SNIPPETS, k=count)
+    titles = random.choices(ARTICLE_TITLES, k=count)
+    first_names = random.choices(USER_FIRST_NAMES, k=count)
+    last_names = random.choices(USER_LAST_NAMES, k=count)
+    # Only depends on the generation time, so it is shared by every
+    # large article
+    revision_history = [
+        {
+            "version": f"1.{v}",
+            "date": (now - timedelta(days=v * 30)).isoformat(),
+            "changes": "Updated content and fixed issues. " * 10,
+        }
+        for v in range(15)
+    ]
     for i in range(count):
-        content = random.choice(ARTICLE_CONTENT_SNIPPETS)
+        content = snippets[i]
         # Some articles have HTML (D005)
         if random.random() < 0.2:
             content = f"<div class='article'><h1>{random.choice(ARTICLE_TITLES)}</h1><p>{content}</p></div>"
@@ -391,19 +474,17 @@ def generate_articles(count: int = 100) -> list[dict]:
         article = {
             "id": i + 1,
             "article_id": f"ART-{i + 1:04d}",
-            "title": random.choice(ARTICLE_TITLES),
+            "title": titles[i],
             "content": content,
-            "author": f"{random.choice(USER_FIRST_NAMES)} {random.choice(USER_LAST_NAMES)}",
-            "published_at": (
-                datetime.now() - timedelta(days=random.randint(1, 500))
-            ).isoformat(),
+            "author": f"{first_names[i]} {last_names[i]}",
+            "published_at": (now - timedelta(days=random.randint(1, 500))).isoformat(),
             "views": random.randint(0, 10000),
             "likes": random.randint(0, 500),
         }
 
         # Very long text (D008)
         if random.random() < 0.1:
-            article["content"] = "This is a very detailed article. " * 1000
+            article["content"] = LONG_ARTICLE_CONTENT
 
         # D001: Large documents - create comprehensive articles (~20KB+)
         if random.random() < 0.1:
@@ -413,64 +494,41 @@ def generate_articles(count: int = 100) -> list[dict]:
                 sections.append(
                     {
                         "heading": f"Section {s + 1}: {random.choice(ARTICLE_TITLES)}",
-                        "content": "In-depth analysis and explanation of this topic. "
-                        * 100,
-                        "code_examples": [
-                            f"# Example {e}\n" + "print('code sample')\n" * 20
-                            for e in range(5)
-                        ],
+                        "content": LONG_SECTION_CONTENT,
+                        "code_examples": ARTICLE_CODE_EXAMPLES,
                     }
                 )
             article["sections"] = sections
-            article["full_content"] = (
-                "Comprehensive guide covering all aspects of this topic. " * 300
-            )
-            article["references"] = [
-                {"title": f"Reference {r}", "url": f"https://example.com/ref/{r}"}
-                for r in range(20)
-            ]
-            article["revision_history"] = [
-                {
-                    "version": f"1.{v}",
-                    "date": (datetime.now() - timedelta(days=v * 30)).isoformat(),
-                    "changes": "Updated content and fixed issues. " * 10,
-                }
-                for v in range(15)
-            ]
+            article["full_content"] = LONG_ARTICLE_FULL_CONTENT
+            article["references"] = ARTICLE_REFERENCES
+            article["revision_history"] = revision_history
 
-        articles.append(article)
+        yield article
 
-    return articles
 
-
-def generate_orders(count: int = 1000) -> list[dict]:
+def generate_orders(count: int = 1000) -> Iterator[dict]:
     """Generate sample order documents - large index for testing."""
-    orders = []
+    now = datetime.now()
+    days_ago = _isoformat_offsets(now, "days", 365)
+    # Draw the categorical fields for all rows at once
+    statuses = random.choices(
+        ["pending", "processing", "shipped", "delivered", "cancelled"], k=count
+    )
     for i in range(count):
         order = {
             "id": i + 1,
             "order_id": f"ORD-{i + 1:08d}",
-            "user_id": f"USR-{random.randint(1, 200):06d}",
-            "product_ids": [
-                f"PROD-{random.randint(1, 500):05d}"
-                for _ in range(random.randint(1, 5))
-            ],
+            "user_id": random.choice(USER_REF_IDS),
+            "product_ids": random.choices(PRODUCT_REF_IDS, k=random.randint(1, 5)),
             "total": round(random.uniform(10.0, 2000.0), 2),
-            "status": random.choice(
-                ["pending", "processing", "shipped", "delivered", "cancelled"]
-            ),
-            "created_at": (
-                datetime.now() - timedelta(days=random.randint(1, 365))
-            ).isoformat(),
+            "status": statuses[i],
+            "created_at": days_ago[random.randint(1, 365)],
         }
-        orders.append(order)
-
-    return orders
+        yield order
 
 
-def generate_locations(count: int = 50) -> list[dict]:
+def generate_locations(count: int = 50) -> Iterator[dict]:
     """Generate sample location documents for D011, D012, D013 testing."""
-    locations = []
 
     # Sample cities with coordinates
     cities = [
@@ -494,8 +552,15 @@ def generate_locations(count: int = 50) -> list[dict]:
         ("Sydney", -33.8688, 151.2093),
     ]
 
+    now = datetime.now()
+    today = now.date()
+    # Draw the categorical fields for all rows at once
+    picked_cities = random.choices(cities, k=count)
+    location_types = random.choices(
+        ["store", "warehouse", "office", "restaurant"], k=count
+    )
     for i in range(count):
-        city_name, base_lat, base_lng = random.choice(cities)
+        city_name, base_lat, base_lng = picked_cities[i]
         # Add small random offset
         lat = base_lat + random.uniform(-0.1, 0.1)
         lng = base_lng + random.uniform(-0.1, 0.1)
@@ -503,16 +568,14 @@ def generate_locations(count: int = 50) -> list[dict]:
         location = {
             "id": i + 1,
             "name": f"{city_name} Location #{i + 1}",
-            "type": random.choice(["store", "warehouse", "office", "restaurant"]),
+            "type": location_types[i],
             # D012: Geo coordinates as separate lat/lng fields (should trigger suggestion)
             "lat": round(lat, 6),
             "lng": round(lng, 6),
             # D013: Date strings (should trigger suggestion for sorting)
-            "opened_at": (
-                datetime.now() - timedelta(days=random.randint(30, 1000))
-            ).strftime("%Y-%m-%d"),
+            "opened_at": (today - timedelta(days=random.randint(30, 1000))).isoformat(),
             "last_inspection": (
-                datetime.now() - timedelta(days=random.randint(1, 180))
+                now - timedelta(days=random.randint(1, 180))
             ).isoformat(),
             # D011: Arrays of objects (should trigger warning if filterable)
             "operating_hours": [
@@ -536,16 +599,19 @@ def generate_locations(count: int = 50) -> list[dict]:
                 {"name": f"Support {i}", "email": f"support{i}@example.com"},
             ]
 
-        locations.append(location)
-
-    return locations
+        yield location
 
 
-def generate_events(count: int = 100) -> list[dict]:
+def generate_events(count: int = 100) -> Iterator[dict]:
     """Generate sample event documents for D012 (nested geo) and D013 testing."""
-    events = []
 
     event_types = ["conference", "meetup", "workshop", "concert", "exhibition"]
+    now = datetime.now()
+    today = now.date()
+    # Draw the categorical fields for all rows at once
+    title_types = random.choices(event_types, k=count)
+    description_types = random.choices(event_types, k=count)
+    types = random.choices(event_types, k=count)
 
     for i in range(count):
         lat = round(random.uniform(25.0, 50.0), 6)
@@ -553,9 +619,9 @@ def generate_events(count: int = 100) -> list[dict]:
 
         event = {
             "id": i + 1,
-            "title": f"Event #{i + 1}: {random.choice(event_types).title()}",
-            "description": f"Join us for this amazing {random.choice(event_types)}!",
-            "type": random.choice(event_types),
+            "title": f"Event #{i + 1}: {title_types[i].title()}",
+            "description": f"Join us for this amazing {description_types[i]}!",
+            "type": types[i],
             # D012: Nested location object (should trigger suggestion)
             "venue": {
                 "name": f"Venue {i + 1}",
@@ -566,14 +632,10 @@ def generate_events(count: int = 100) -> list[dict]:
                 },
             },
             # D013: Multiple date string formats
-            "event_date": (
-                datetime.now() + timedelta(days=random.randint(1, 180))
-            ).strftime("%Y-%m-%d"),
-            "start_time": (
-                datetime.now() + timedelta(days=random.randint(1, 180))
-            ).isoformat(),
+            "event_date": (today + timedelta(days=random.randint(1, 180))).isoformat(),
+            "start_time": (now + timedelta(days=random.randint(1, 180))).isoformat(),
             "registration_deadline": (
-                datetime.now() + timedelta(days=random.randint(1, 30))
+                now + timedelta(days=random.randint(1, 30))
             ).strftime("%m/%d/%Y"),  # US format
             "capacity": random.randint(50, 500),
             "registered": random.randint(10, 200),
@@ -591,41 +653,38 @@ def generate_events(count: int = 100) -> list[dict]:
                 for j in range(random.randint(1, 5))
             ]
 
-        events.append(event)
+        yield event
 
-    return events
 
-
-def generate_reviews(count: int = 300) -> list[dict]:
+def generate_reviews(count: int = 300) -> Iterator[dict]:
     """Generate sample review documents."""
-    reviews = []
     sentiments = ["positive", "neutral", "negative"]
+    now = datetime.now()
+    days_ago = _isoformat_offsets(now, "days", 365)
+    # Draw the categorical fields for all rows at once
+    sentiments_drawn = random.choices(sentiments, k=count)
+    verified_flags = random.choices([True, False], k=count)
 
     for i in range(count):
         review = {
             "id": i + 1,
             "review_id": f"REV-{i + 1:06d}",
-            "product_id": f"PROD-{random.randint(1, 500):05d}",
-            "user_id": f"USR-{random.randint(1, 200):06d}",
+            "product_id": random.choice(PRODUCT_REF_IDS),
+            "user_id": random.choice(USER_REF_IDS),
             "title": f"Review for product {random.randint(1, 500)}",
             "content": f"This is a {'great' if random.random() > 0.3 else 'disappointing'} product. "
             * random.randint(1, 5),
             "rating": random.randint(1, 5),
-            "sentiment": random.choice(sentiments),
+            "sentiment": sentiments_drawn[i],
             "helpful_votes": random.randint(0, 100),
-            "verified_purchase": random.choice([True, False]),
-            "created_at": (
-                datetime.now() - timedelta(days=random.randint(1, 365))
-            ).isoformat(),
+            "verified_purchase": verified_flags[i],
+            "created_at": days_ago[random.randint(1, 365)],
         }
-        reviews.append(review)
-
-    return reviews
+        yield review
 
 
-def generate_categories(count: int = 50) -> list[dict]:
+def generate_categories(count: int = 50) -> Iterator[dict]:
     """Generate sample category documents."""
-    categories = []
     parent_categories = ["Electronics", "Clothing", "Home", "Sports", "Books", "Food"]
 
     for i in range(count):
@@ -641,15 +700,13 @@ def generate_categories(count: int = 50) -> list[dict]:
             "product_count": random.randint(0, 500),
             "is_active": random.choice([True, True, True, False]),  # 75% active
         }
-        categories.append(category)
+        yield category
 
-    return categories
 
-
-def generate_tags(count: int = 100) -> list[dict]:
+def generate_tags(count: int = 100) -> Iterator[dict]:
     """Generate sample tag documents."""
-    tags = []
     tag_types = ["product", "article", "user", "system"]
+    now = datetime.now()
 
     for i in range(count):
         tag = {
@@ -659,126 +716,111 @@ def generate_tags(count: int = 100) -> list[dict]:
             "display_name": f"Tag {i + 1}",
             "type": random.choice(tag_types),
             "usage_count": random.randint(0, 1000),
-            "created_at": (
-                datetime.now() - timedelta(days=random.randint(1, 500))
-            ).isoformat(),
+            "created_at": (now - timedelta(days=random.randint(1, 500))).isoformat(),
         }
-        tags.append(tag)
+        yield tag
 
-    return tags
 
-
-def generate_logs(count: int = 500) -> list[dict]:
+def generate_logs(count: int = 500) -> Iterator[dict]:
     """Generate sample log documents."""
-    logs = []
     log_levels = ["debug", "info", "warning", "error", "critical"]
     services = ["api", "worker", "scheduler", "indexer", "search"]
+    now = datetime.now()
+    hours_ago = _isoformat_offsets(now, "hours", 168)
+    # Draw the categorical fields for all rows at once
+    levels = random.choices(log_levels, k=count)
+    services_drawn = random.choices(services, k=count)
 
     for i in range(count):
         log = {
             "id": i + 1,
             "log_id": f"LOG-{i + 1:08d}",
-            "timestamp": (
-                datetime.now() - timedelta(hours=random.randint(1, 168))
-            ).isoformat(),
-            "level": random.choice(log_levels),
-            "service": random.choice(services),
+            "timestamp": hours_ago[random.randint(1, 168)],
+            "level": levels[i],
+            "service": services_drawn[i],
             "message": f"Log message {i + 1}: {'Operation completed successfully' if random.random() > 0.2 else 'Error occurred during processing'}",
             "request_id": f"req-{random.randint(10000, 99999)}",
-            "user_id": f"USR-{random.randint(1, 200):06d}"
-            if random.random() > 0.3
-            else None,
+            "user_id": random.choice(USER_REF_IDS) if random.random() > 0.3 else None,
             "duration_ms": random.randint(1, 5000),
         }
-        logs.append(log)
-
-    return logs
+        yield log
 
 
-def generate_notifications(count: int = 200) -> list[dict]:
+def generate_notifications(count: int = 200) -> Iterator[dict]:
     """Generate sample notification documents."""
-    notifications = []
     notification_types = ["email", "push", "sms", "in_app"]
     statuses = ["pending", "sent", "delivered", "failed", "read"]
+    now = datetime.now()
+    # Draw the categorical fields for all rows at once
+    types = random.choices(notification_types, k=count)
+    statuses_drawn = random.choices(statuses, k=count)
 
     for i in range(count):
         notification = {
             "id": i + 1,
             "notification_id": f"NOTIF-{i + 1:06d}",
-            "user_id": f"USR-{random.randint(1, 200):06d}",
-            "type": random.choice(notification_types),
+            "user_id": random.choice(USER_REF_IDS),
+            "type": types[i],
             "title": f"Notification {i + 1}",
             "message": f"This is notification message {i + 1}",
-            "status": random.choice(statuses),
-            "created_at": (
-                datetime.now() - timedelta(hours=random.randint(1, 72))
-            ).isoformat(),
-            "sent_at": (
-                datetime.now() - timedelta(hours=random.randint(0, 71))
-            ).isoformat()
+            "status": statuses_drawn[i],
+            "created_at": (now - timedelta(hours=random.randint(1, 72))).isoformat(),
+            "sent_at": (now - timedelta(hours=random.randint(0, 71))).isoformat()
             if random.random() > 0.2
             else None,
         }
-        notifications.append(notification)
+        yield notification
 
-    return notifications
 
-
-def generate_inventory(count: int = 400) -> list[dict]:
+def generate_inventory(count: int = 400) -> Iterator[dict]:
     """Generate sample inventory documents."""
-    inventory = []
     warehouses = ["WH-EAST", "WH-WEST", "WH-CENTRAL", "WH-SOUTH"]
+    now = datetime.now()
 
     for i in range(count):
         item = {
             "id": i + 1,
             "inventory_id": f"INV-{i + 1:06d}",
-            "product_id": f"PROD-{random.randint(1, 500):05d}",
+            "product_id": random.choice(PRODUCT_REF_IDS),
             "warehouse": random.choice(warehouses),
             "quantity": random.randint(0, 1000),
             "reserved": random.randint(0, 50),
             "reorder_point": random.randint(10, 100),
-            "last_restocked": (
-                datetime.now() - timedelta(days=random.randint(1, 60))
-            ).isoformat(),
+            "last_restocked": (now - timedelta(days=random.randint(1, 60))).isoformat(),
         }
-        inventory.append(item)
+        yield item
 
-    return inventory
 
-
-def generate_analytics(count: int = 1000) -> list[dict]:
+def generate_analytics(count: int = 1000) -> Iterator[dict]:
     """Generate sample analytics/metrics documents."""
-    analytics = []
     metrics = ["page_view", "click", "conversion", "signup", "purchase"]
     sources = ["organic", "paid", "social", "email", "direct"]
+    now = datetime.now()
+    hours_ago = _isoformat_offsets(now, "hours", 168)
+    # Draw the categorical fields for all rows at once
+    metrics_drawn = random.choices(metrics, k=count)
+    sources_drawn = random.choices(sources, k=count)
 
     for i in range(count):
         record = {
             "id": i + 1,
             "event_id": f"EVT-{i + 1:08d}",
-            "metric": random.choice(metrics),
-            "source": random.choice(sources),
+            "metric": metrics_drawn[i],
+            "source": sources_drawn[i],
             "value": random.randint(1, 100),
             "session_id": f"sess-{random.randint(100000, 999999)}",
-            "user_id": f"USR-{random.randint(1, 200):06d}"
-            if random.random() > 0.4
-            else None,
-            "timestamp": (
-                datetime.now() - timedelta(hours=random.randint(1, 168))
-            ).isoformat(),
+            "user_id": random.choice(USER_REF_IDS) if random.random() > 0.4 else None,
+            "timestamp": hours_ago[random.randint(1, 168)],
             "page": f"/page-{random.randint(1, 50)}",
             # Add IP address for PII detection testing
             "ip_address": random.choice(SAMPLE_IP_ADDRESSES)
             if random.random() > 0.5
             else None,
         }
-        analytics.append(record)
-
-    return analytics
+        yield record
 
 
-def generate_customers(count: int = 500) -> list[dict]:
+def generate_customers(count: int = 500) -> Iterator[dict]:
     """Generate sample customer documents with PII data for sensitive data detection testing.
 
     This index intentionally contains various forms of PII to test the --detect-sensitive flag:
@@ -790,7 +832,6 @@ def generate_customers(count: int = 500) -> list[dict]:
     - Date of birth
     - IP addresses
     """
-    customers = []
     countries = ["US", "UK", "DE", "FR", "JP", "AU", "CA", "NL", "SE", "NO"]
     membership_tiers = ["bronze", "silver", "gold", "platinum"]
 
@@ -815,10 +856,22 @@ def generate_customers(count: int = 500) -> list[dict]:
         "Tokyo",
         "Sydney",
     ]
+    now = datetime.now()
+    today = now.date()
+    # Draw the categorical fields for all rows at once
+    first_names = random.choices(USER_FIRST_NAMES, k=count)
+    last_names = random.choices(USER_LAST_NAMES, k=count)
+    phones = random.choices(SAMPLE_PHONES, k=count)
+    streets = random.choices(street_names, k=count)
+    cities_drawn = random.choices(cities, k=count)
+    countries_drawn = random.choices(countries, k=count)
+    tiers = random.choices(membership_tiers, k=count)
+    verified_flags = random.choices([True, True, True, False], k=count)
+    consent_flags = random.choices([True, False], k=count)
 
     for i in range(count):
-        first_name = random.choice(USER_FIRST_NAMES)
-        last_name = random.choice(USER_LAST_NAMES)
+        first_name = first_names[i]
+        last_name = last_names[i]
 
         customer = {
             "id": i + 1,
@@ -830,35 +883,32 @@ def generate_customers(count: int = 500) -> list[dict]:
             # PII: Email
             "email": f"{first_name.lower()}.{last_name.lower()}{random.randint(1, 99)}@example.com",
             # PII: Phone number
-            "phone": random.choice(SAMPLE_PHONES),
+            "phone": phones[i],
             # PII: Physical address
             "address": {
-                "street": f"{random.randint(100, 9999)} {random.choice(street_names)}",
-                "city": random.choice(cities),
+                "street": f"{random.randint(100, 9999)} {streets[i]}",
+                "city": cities_drawn[i],
                 "state": f"ST-{random.randint(1, 50)}",
                 "zip_code": f"{random.randint(10000, 99999)}",
-                "country": random.choice(countries),
+                "country": countries_drawn[i],
             },
             # PII: Date of birth
             "date_of_birth": (
-                datetime.now()
-                - timedelta(days=random.randint(6570, 25550))  # 18-70 years old
-            ).strftime("%Y-%m-%d"),
+                today - timedelta(days=random.randint(6570, 25550))  # 18-70 years old
+            ).isoformat(),
             # Membership info
-            "membership_tier": random.choice(membership_tiers),
+            "membership_tier": tiers[i],
             "loyalty_points": random.randint(0, 50000),
-            "signup_date": (
-                datetime.now() - timedelta(days=random.randint(1, 1000))
-            ).isoformat(),
+            "signup_date": (now - timedelta(days=random.randint(1, 1000))).isoformat(),
             "last_purchase_date": (
-                datetime.now() - timedelta(days=random.randint(1, 180))
+                now - timedelta(days=random.randint(1, 180))
             ).isoformat()
             if random.random() > 0.2
             else None,
             "total_spent": round(random.uniform(0, 10000.0), 2),
             "orders_count": random.randint(0, 100),
-            "is_verified": random.choice([True, True, True, False]),
-            "marketing_consent": random.choice([True, False]),
+            "is_verified": verified_flags[i],
+            "marketing_consent": consent_flags[i],
         }
 
         # Add SSN-like field for some customers (testing sensitive detection)
@@ -875,12 +925,10 @@ def generate_customers(count: int = 500) -> list[dict]:
         if random.random() < 0.3:
             customer["last_login_ip"] = random.choice(SAMPLE_IP_ADDRESSES)
 
-        customers.append(customer)
-
-    return customers
+        yield customer
 
 
-def generate_employees(count: int = 50) -> list[dict]:
+def generate_employees(count: int = 50) -> Iterator[dict]:
     """Generate sample employee documents with HR-related PII.
 
     This index contains employment-related sensitive data:
@@ -890,7 +938,6 @@ def generate_employees(count: int = 50) -> list[dict]:
     - Emergency contacts
     - Bank account info patterns
     """
-    employees = []
     departments = [
         "Engineering",
         "Sales",
@@ -916,10 +963,25 @@ def generate_employees(count: int = 50) -> list[dict]:
         "Legal Counsel",
     ]
     employment_types = ["full-time", "part-time", "contractor", "intern"]
+    now = datetime.now()
+    today = now.date()
+    # Draw the categorical fields for all rows at once
+    first_names = random.choices(USER_FIRST_NAMES, k=count)
+    last_names = random.choices(USER_LAST_NAMES, k=count)
+    phones = random.choices(SAMPLE_PHONES, k=count)
+    ssns = random.choices(SAMPLE_SSN_LIKE, k=count)
+    departments_drawn = random.choices(departments, k=count)
+    titles = random.choices(job_titles, k=count)
+    types = random.choices(employment_types, k=count)
+    contact_first_names = random.choices(USER_FIRST_NAMES, k=count)
+    contact_last_names = random.choices(USER_LAST_NAMES, k=count)
+    relationships = random.choices(["spouse", "parent", "sibling", "friend"], k=count)
+    contact_phones = random.choices(SAMPLE_PHONES, k=count)
+    active_flags = random.choices([True, True, True, True, False], k=count)
 
     for i in range(count):
-        first_name = random.choice(USER_FIRST_NAMES)
-        last_name = random.choice(USER_LAST_NAMES)
+        first_name = first_names[i]
+        last_name = last_names[i]
 
         employee = {
             "id": i + 1,
@@ -934,9 +996,9 @@ def generate_employees(count: int = 50) -> list[dict]:
             "personal_email": f"{first_name.lower()}{random.randint(1, 99)}@gmail.com",
             # PII: Phone numbers
             "work_phone": f"+1-555-{random.randint(100, 999)}-{random.randint(1000, 9999)}",
-            "personal_phone": random.choice(SAMPLE_PHONES),
+            "personal_phone": phones[i],
             # PII: SSN
-            "ssn": random.choice(SAMPLE_SSN_LIKE),
+            "ssn": ssns[i],
             # PII: Salary
             "salary": random.randint(40000, 250000),
             "salary_currency": "USD",
@@ -944,36 +1006,29 @@ def generate_employees(count: int = 50) -> list[dict]:
             "bank_routing": f"{random.randint(100000000, 999999999)}",
             "bank_account_last4": f"****{random.randint(1000, 9999)}",
             # Employment info
-            "department": random.choice(departments),
-            "job_title": random.choice(job_titles),
-            "employment_type": random.choice(employment_types),
+            "department": departments_drawn[i],
+            "job_title": titles[i],
+            "employment_type": types[i],
             "manager_id": f"EMP-{random.randint(1, max(1, i)):05d}" if i > 5 else None,
-            "hire_date": (
-                datetime.now() - timedelta(days=random.randint(30, 3650))
-            ).strftime("%Y-%m-%d"),
+            "hire_date": (today - timedelta(days=random.randint(30, 3650))).isoformat(),
             # PII: Date of birth
             "date_of_birth": (
-                datetime.now()
-                - timedelta(days=random.randint(7300, 23725))  # 20-65 years old
-            ).strftime("%Y-%m-%d"),
+                today - timedelta(days=random.randint(7300, 23725))  # 20-65 years old
+            ).isoformat(),
             # PII: Emergency contact
             "emergency_contact": {
-                "name": f"{random.choice(USER_FIRST_NAMES)} {random.choice(USER_LAST_NAMES)}",
-                "relationship": random.choice(
-                    ["spouse", "parent", "sibling", "friend"]
-                ),
-                "phone": random.choice(SAMPLE_PHONES),
+                "name": f"{contact_first_names[i]} {contact_last_names[i]}",
+                "relationship": relationships[i],
+                "phone": contact_phones[i],
             },
-            "is_active": random.choice([True, True, True, True, False]),
+            "is_active": active_flags[i],
             "vacation_days_remaining": random.randint(0, 25),
         }
 
-        employees.append(employee)
-
-    return employees
+        yield employee
 
 
-def generate_support_tickets(count: int = 200) -> list[dict]:
+def generate_support_tickets(count: int = 200) -> Iterator[dict]:
     """Generate sample support ticket documents.
 
     This index tests:
@@ -982,7 +1037,6 @@ def generate_support_tickets(count: int = 200) -> list[dict]:
     - Nested conversation threads
     - PII in ticket content (customer info mentioned)
     """
-    tickets = []
     statuses = [
         "open",
         "in_progress",
@@ -1003,6 +1057,8 @@ def generate_support_tickets(count: int = 200) -> list[dict]:
     ]
     channels = ["email", "chat", "phone", "web_form", "social_media"]
 
+    # Templates are filled with str.format in a single pass; templates
+    # without a placeholder ignore the values drawn for them
     issue_templates = [
         "I can't log into my account since yesterday",
         "My order #{order_id} hasn't arrived yet",
@@ -1023,9 +1079,10 @@ def generate_support_tickets(count: int = 200) -> list[dict]:
         "This has been resolved. Please let us know if you need anything else.",
         "We apologize for the inconvenience. Here's what we can do...",
     ]
+    now = datetime.now()
 
     for i in range(count):
-        created_at = datetime.now() - timedelta(days=random.randint(1, 180))
+        created_at = now - timedelta(days=random.randint(1, 180))
         status = random.choice(statuses)
 
         # Generate conversation thread
@@ -1043,12 +1100,12 @@ def generate_support_tickets(count: int = 200) -> list[dict]:
                     else f"AGENT-{random.randint(1, 20):03d}",
                     "content": random.choice(
                         issue_templates if is_customer else response_templates
-                    )
-                    .replace("{order_id}", str(random.randint(10000, 99999)))
-                    .replace("{days}", str(random.randint(1, 30)))
-                    .replace(
-                        "{feature}",
-                        random.choice(["search", "export", "import", "dashboard"]),
+                    ).format(
+                        order_id=random.randint(10000, 99999),
+                        days=random.randint(1, 30),
+                        feature=random.choice(
+                            ["search", "export", "import", "dashboard"]
+                        ),
                     ),
                     "timestamp": message_time.isoformat(),
                 }
@@ -1057,10 +1114,11 @@ def generate_support_tickets(count: int = 200) -> list[dict]:
         ticket = {
             "id": i + 1,
             "ticket_id": f"TKT-{i + 1:06d}",
-            "subject": random.choice(issue_templates)
-            .replace("{order_id}", str(random.randint(10000, 99999)))
-            .replace("{days}", str(random.randint(1, 30)))
-            .replace("{feature}", random.choice(["search", "export", "dashboard"])),
+            "subject": random.choice(issue_templates).format(
+                order_id=random.randint(10000, 99999),
+                days=random.randint(1, 30),
+                feature=random.choice(["search", "export", "dashboard"]),
+            ),
             "description": "Detailed description of the issue. "
             * random.randint(2, 10),
             "status": status,
@@ -1096,19 +1154,16 @@ def generate_support_tickets(count: int = 200) -> list[dict]:
             else None,
         }
 
-        tickets.append(ticket)
+        yield ticket
 
-    return tickets
 
-
-def generate_knowledge_base(count: int = 20) -> list[dict]:
+def generate_knowledge_base(count: int = 20) -> Iterator[dict]:
     """Generate sample knowledge base documents that are intentionally large (D001).
 
     This index is designed to trigger the large document detection (D001) by
     containing documentation-style content that exceeds the recommended 10KB average.
     Each document is approximately 15-50KB to ensure detection.
     """
-    kb_articles = []
 
     doc_types = [
         "API Reference",
@@ -1140,6 +1195,7 @@ def generate_knowledge_base(count: int = 20) -> list[dict]:
         "Sorting",
         "Faceted Search",
     ]
+    now = datetime.now()
 
     for i in range(count):
         doc_type = random.choice(doc_types)
@@ -1194,7 +1250,7 @@ def generate_knowledge_base(count: int = 20) -> list[dict]:
             changelog.append(
                 {
                     "version": f"{random.randint(1, 5)}.{v}.{random.randint(0, 10)}",
-                    "date": (datetime.now() - timedelta(days=v * 14)).isoformat(),
+                    "date": (now - timedelta(days=v * 14)).isoformat(),
                     "changes": [
                         f"- Updated {topic} functionality with new features and improvements. "
                         f"This change affects how users interact with the system. " * 3
@@ -1260,11 +1316,9 @@ def generate_knowledge_base(count: int = 20) -> list[dict]:
                     for _ in range(random.randint(2, 5))
                 ],
                 "created_at": (
-                    datetime.now() - timedelta(days=random.randint(30, 365))
-                ).isoformat(),
-                "updated_at": (
-                    datetime.now() - timedelta(days=random.randint(1, 30))
+                    now - timedelta(days=random.randint(30, 365))
                 ).isoformat(),
+                "updated_at": (now - timedelta(days=random.randint(1, 30))).isoformat(),
                 "word_count": random.randint(5000, 15000),
                 "reading_time_minutes": random.randint(15, 45),
             },
@@ -1291,9 +1345,7 @@ def generate_knowledge_base(count: int = 20) -> list[dict]:
             "helpful_votes": random.randint(10, 500),
         }
 
-        kb_articles.append(kb_article)
-
-    return kb_articles
+        yield kb_article
 
 
 # ============================================================================
@@ -1301,7 +1353,7 @@ def generate_knowledge_base(count: int = 20) -> list[dict]:
 # ============================================================================
 
 
-def generate_projects(count: int = 100) -> list[dict]:
+def generate_projects(count: int = 100) -> Iterator[dict]:
     """Generate sample project management documents."""
     statuses = [
         "planning",
@@ -1312,73 +1364,56 @@ def generate_projects(count: int = 100) -> list[dict]:
         "cancelled",
     ]
     priorities = ["critical", "high", "medium", "low"]
-    projects = []
+    now = datetime.now()
     for i in range(count):
-        projects.append(
-            {
-                "id": i + 1,
-                "project_id": f"PRJ-{i + 1:05d}",
-                "name": f"Project {random.choice(['Alpha', 'Beta', 'Gamma', 'Delta', 'Epsilon'])} {i + 1}",
-                "description": f"A project focusing on {random.choice(['development', 'research', 'marketing', 'infrastructure'])}.",
-                "status": random.choice(statuses),
-                "priority": random.choice(priorities),
-                "budget": round(random.uniform(10000, 500000), 2),
-                "team_size": random.randint(2, 20),
-                "start_date": (
-                    datetime.now() - timedelta(days=random.randint(30, 365))
-                ).isoformat(),
-                "deadline": (
-                    datetime.now() + timedelta(days=random.randint(30, 180))
-                ).isoformat(),
-            }
-        )
-    return projects
+        yield {
+            "id": i + 1,
+            "project_id": f"PRJ-{i + 1:05d}",
+            "name": f"Project {random.choice(['Alpha', 'Beta', 'Gamma', 'Delta', 'Epsilon'])} {i + 1}",
+            "description": f"A project focusing on {random.choice(['development', 'research', 'marketing', 'infrastructure'])}.",
+            "status": random.choice(statuses),
+            "priority": random.choice(priorities),
+            "budget": round(random.uniform(10000, 500000), 2),
+            "team_size": random.randint(2, 20),
+            "start_date": (now - timedelta(days=random.randint(30, 365))).isoformat(),
+            "deadline": (now + timedelta(days=random.randint(30, 180))).isoformat(),
+        }
 
 
-def generate_tasks(count: int = 200) -> list[dict]:
+def generate_tasks(count: int = 200) -> Iterator[dict]:
     """Generate sample task documents."""
     statuses = ["todo", "in_progress", "blocked", "done"]
-    projects = []
+    now = datetime.now()
     for i in range(count):
-        projects.append(
-            {
-                "id": i + 1,
-                "task_id": f"TASK-{i + 1:05d}",
-                "title": f"Task: {random.choice(['Implement', 'Review', 'Test', 'Deploy', 'Document'])} feature {i + 1}",
-                "description": "Detailed task description with implementation notes.",
-                "status": random.choice(statuses),
-                "assignee": f"{random.choice(USER_FIRST_NAMES)} {random.choice(USER_LAST_NAMES)}",
-                "project_id": f"PRJ-{random.randint(1, 50):05d}",
-                "estimated_hours": random.randint(1, 40),
-                "created_at": (
-                    datetime.now() - timedelta(days=random.randint(1, 60))
-                ).isoformat(),
-            }
-        )
-    return projects
+        yield {
+            "id": i + 1,
+            "task_id": f"TASK-{i + 1:05d}",
+            "title": f"Task: {random.choice(['Implement', 'Review', 'Test', 'Deploy', 'Document'])} feature {i + 1}",
+            "description": "Detailed task description with implementation notes.",
+            "status": random.choice(statuses),
+            "assignee": f"{random.choice(USER_FIRST_NAMES)} {random.choice(USER_LAST_NAMES)}",
+            "project_id": f"PRJ-{random.randint(1, 50):05d}",
+            "estimated_hours": random.randint(1, 40),
+            "created_at": (now - timedelta(days=random.randint(1, 60))).isoformat(),
+        }
 
 
-def generate_comments(count: int = 300) -> list[dict]:
+def generate_comments(count: int = 300) -> Iterator[dict]:
     """Generate sample comment documents."""
-    comments = []
+    now = datetime.now()
     for i in range(count):
-        comments.append(
-            {
-                "id": i + 1,
-                "content": f"This is a comment about the topic. {random.choice(['Great work!', 'Needs revision.', 'Approved.', 'Please clarify.'])}",
-                "author_id": random.randint(1, 100),
-                "author_name": f"{random.choice(USER_FIRST_NAMES)} {random.choice(USER_LAST_NAMES)}",
-                "entity_type": random.choice(["task", "project", "article", "review"]),
-                "entity_id": random.randint(1, 500),
-                "created_at": (
-                    datetime.now() - timedelta(hours=random.randint(1, 720))
-                ).isoformat(),
-            }
-        )
-    return comments
+        yield {
+            "id": i + 1,
+            "content": f"This is a comment about the topic. {random.choice(['Great work!', 'Needs revision.', 'Approved.', 'Please clarify.'])}",
+            "author_id": random.randint(1, 100),
+            "author_name": f"{random.choice(USER_FIRST_NAMES)} {random.choice(USER_LAST_NAMES)}",
+            "entity_type": random.choice(["task", "project", "article", "review"]),
+            "entity_id": random.randint(1, 500),
+            "created_at": (now - timedelta(hours=random.randint(1, 720))).isoformat(),
+        }
 
 
-def generate_files(count: int = 150) -> list[dict]:
+def generate_files(count: int = 150) -> Iterator[dict]:
     """Generate sample file metadata documents."""
     extensions = [".pdf", ".docx", ".xlsx", ".png", ".jpg", ".mp4", ".zip"]
     mime_types = {
@@ -1390,160 +1425,126 @@ def generate_files(count: int = 150) -> list[dict]:
         ".mp4": "video/mp4",
         ".zip": "application/zip",
     }
-    files = []
+    now = datetime.now()
     for i in range(count):
         ext = random.choice(extensions)
-        files.append(
-            {
-                "id": i + 1,
-                "filename": f"file_{i + 1}{ext}",
-                "path": f"/uploads/{random.choice(['docs', 'images', 'videos', 'archives'])}/file_{i + 1}{ext}",
-                "size_bytes": random.randint(1024, 100 * 1024 * 1024),
-                "mime_type": mime_types[ext],
-                "uploaded_by": f"{random.choice(USER_FIRST_NAMES)} {random.choice(USER_LAST_NAMES)}",
-                "uploaded_at": (
-                    datetime.now() - timedelta(days=random.randint(1, 180))
-                ).isoformat(),
-            }
-        )
-    return files
+        yield {
+            "id": i + 1,
+            "filename": f"file_{i + 1}{ext}",
+            "path": f"/uploads/{random.choice(['docs', 'images', 'videos', 'archives'])}/file_{i + 1}{ext}",
+            "size_bytes": random.randint(1024, 100 * 1024 * 1024),
+            "mime_type": mime_types[ext],
+            "uploaded_by": f"{random.choice(USER_FIRST_NAMES)} {random.choice(USER_LAST_NAMES)}",
+            "uploaded_at": (now - timedelta(days=random.randint(1, 180))).isoformat(),
+        }
 
 
-def generate_messages(count: int = 500) -> list[dict]:
+def generate_messages(count: int = 500) -> Iterator[dict]:
     """Generate sample message/chat documents."""
-    messages = []
     channels = ["general", "engineering", "marketing", "support", "random"]
+    now = datetime.now()
     for i in range(count):
-        messages.append(
-            {
-                "id": i + 1,
-                "content": f"Message content {i + 1}. "
-                + random.choice(
-                    [
-                        "Let's discuss this in the meeting.",
-                        "I've updated the document.",
-                        "Can someone review this PR?",
-                        "The deployment was successful.",
-                        "We need to address this issue.",
-                    ]
-                ),
-                "sender_id": random.randint(1, 100),
-                "sender_name": f"{random.choice(USER_FIRST_NAMES)} {random.choice(USER_LAST_NAMES)}",
-                "channel": random.choice(channels),
-                "thread_id": f"thread-{random.randint(1, 100)}"
-                if random.random() < 0.3
-                else None,
-                "sent_at": (
-                    datetime.now() - timedelta(minutes=random.randint(1, 10080))
-                ).isoformat(),
-            }
-        )
-    return messages
+        yield {
+            "id": i + 1,
+            "content": f"Message content {i + 1}. "
+            + random.choice(
+                [
+                    "Let's discuss this in the meeting.",
+                    "I've updated the document.",
+                    "Can someone review this PR?",
+                    "The deployment was successful.",
+                    "We need to address this issue.",
+                ]
+            ),
+            "sender_id": random.randint(1, 100),
+            "sender_name": f"{random.choice(USER_FIRST_NAMES)} {random.choice(USER_LAST_NAMES)}",
+            "channel": random.choice(channels),
+            "thread_id": f"thread-{random.randint(1, 100)}"
+            if random.random() < 0.3
+            else None,
+            "sent_at": (now - timedelta(minutes=random.randint(1, 10080))).isoformat(),
+        }
 
 
-def generate_payments(count: int = 400) -> list[dict]:
+def generate_payments(count: int = 400) -> Iterator[dict]:
     """Generate sample payment transaction documents."""
     statuses = ["pending", "completed", "failed", "refunded"]
     methods = ["credit_card", "debit_card", "paypal", "bank_transfer", "crypto"]
-    payments = []
+    now = datetime.now()
     for i in range(count):
-        payments.append(
-            {
-                "id": i + 1,
-                "transaction_id": f"TXN-{i + 1:08d}",
-                "amount": round(random.uniform(5, 5000), 2),
-                "currency": random.choice(["USD", "EUR", "GBP", "JPY"]),
-                "status": random.choice(statuses),
-                "method": random.choice(methods),
-                "customer_id": random.randint(1, 500),
-                "order_id": f"ORD-{random.randint(1, 1000):05d}",
-                "processed_at": (
-                    datetime.now() - timedelta(hours=random.randint(1, 720))
-                ).isoformat(),
-            }
-        )
-    return payments
+        yield {
+            "id": i + 1,
+            "transaction_id": f"TXN-{i + 1:08d}",
+            "amount": round(random.uniform(5, 5000), 2),
+            "currency": random.choice(["USD", "EUR", "GBP", "JPY"]),
+            "status": random.choice(statuses),
+            "method": random.choice(methods),
+            "customer_id": random.randint(1, 500),
+            "order_id": f"ORD-{random.randint(1, 1000):05d}",
+            "processed_at": (now - timedelta(hours=random.randint(1, 720))).isoformat(),
+        }
 
 
-def generate_subscriptions(count: int = 100) -> list[dict]:
+def generate_subscriptions(count: int = 100) -> Iterator[dict]:
     """Generate sample subscription documents."""
     plans = ["free", "starter", "professional", "enterprise"]
     statuses = ["active", "cancelled", "past_due", "trialing"]
-    subscriptions = []
+    now = datetime.now()
     for i in range(count):
-        subscriptions.append(
-            {
-                "id": i + 1,
-                "subscription_id": f"SUB-{i + 1:06d}",
-                "customer_id": random.randint(1, 500),
-                "plan": random.choice(plans),
-                "status": random.choice(statuses),
-                "monthly_amount": round(random.uniform(0, 500), 2),
-                "started_at": (
-                    datetime.now() - timedelta(days=random.randint(30, 730))
-                ).isoformat(),
-                "next_billing_date": (
-                    datetime.now() + timedelta(days=random.randint(1, 30))
-                ).isoformat(),
-            }
-        )
-    return subscriptions
+        yield {
+            "id": i + 1,
+            "subscription_id": f"SUB-{i + 1:06d}",
+            "customer_id": random.randint(1, 500),
+            "plan": random.choice(plans),
+            "status": random.choice(statuses),
+            "monthly_amount": round(random.uniform(0, 500), 2),
+            "started_at": (now - timedelta(days=random.randint(30, 730))).isoformat(),
+            "next_billing_date": (
+                now + timedelta(days=random.randint(1, 30))
+            ).isoformat(),
+        }
 
 
-def generate_invoices(count: int = 300) -> list[dict]:
+def generate_invoices(count: int = 300) -> Iterator[dict]:
     """Generate sample invoice documents."""
     statuses = ["draft", "sent", "paid", "overdue", "void"]
-    invoices = []
+    now = datetime.now()
     for i in range(count):
-        invoices.append(
-            {
-                "id": i + 1,
-                "invoice_number": f"INV-{datetime.now().year}-{i + 1:05d}",
-                "customer_id": random.randint(1, 500),
-                "customer_name": f"{random.choice(USER_FIRST_NAMES)} {random.choice(USER_LAST_NAMES)}",
-                "amount": round(random.uniform(100, 10000), 2),
-                "tax_amount": round(random.uniform(10, 1000), 2),
-                "status": random.choice(statuses),
-                "due_date": (
-                    datetime.now() + timedelta(days=random.randint(-30, 60))
-                ).isoformat(),
-                "created_at": (
-                    datetime.now() - timedelta(days=random.randint(1, 90))
-                ).isoformat(),
-            }
-        )
-    return invoices
+        yield {
+            "id": i + 1,
+            "invoice_number": f"INV-{now.year}-{i + 1:05d}",
+            "customer_id": random.randint(1, 500),
+            "customer_name": f"{random.choice(USER_FIRST_NAMES)} {random.choice(USER_LAST_NAMES)}",
+            "amount": round(random.uniform(100, 10000), 2),
+            "tax_amount": round(random.uniform(10, 1000), 2),
+            "status": random.choice(statuses),
+            "due_date": (now + timedelta(days=random.randint(-30, 60))).isoformat(),
+            "created_at": (now - timedelta(days=random.randint(1, 90))).isoformat(),
+        }
 
 
-def generate_campaigns(count: int = 50) -> list[dict]:
+def generate_campaigns(count: int = 50) -> Iterator[dict]:
     """Generate sample marketing campaign documents."""
     types = ["email", "social", "ppc", "content", "influencer"]
     statuses = ["draft", "scheduled", "active", "paused", "completed"]
-    campaigns = []
+    now = datetime.now()
     for i in range(count):
-        campaigns.append(
-            {
-                "id": i + 1,
-                "campaign_name": f"Campaign {random.choice(['Summer', 'Winter', 'Spring', 'Fall', 'Holiday'])} {datetime.now().year} #{i + 1}",
-                "type": random.choice(types),
-                "status": random.choice(statuses),
-                "budget": round(random.uniform(1000, 50000), 2),
-                "spent": round(random.uniform(0, 25000), 2),
-                "impressions": random.randint(1000, 1000000),
-                "clicks": random.randint(100, 50000),
-                "conversions": random.randint(10, 5000),
-                "start_date": (
-                    datetime.now() - timedelta(days=random.randint(0, 60))
-                ).isoformat(),
-                "end_date": (
-                    datetime.now() + timedelta(days=random.randint(1, 90))
-                ).isoformat(),
-            }
-        )
-    return campaigns
+        yield {
+            "id": i + 1,
+            "campaign_name": f"Campaign {random.choice(['Summer', 'Winter', 'Spring', 'Fall', 'Holiday'])} {now.year} #{i + 1}",
+            "type": random.choice(types),
+            "status": random.choice(statuses),
+            "budget": round(random.uniform(1000, 50000), 2),
+            "spent": round(random.uniform(0, 25000), 2),
+            "impressions": random.randint(1000, 1000000),
+            "clicks": random.randint(100, 50000),
+            "conversions": random.randint(10, 5000),
+            "start_date": (now - timedelta(days=random.randint(0, 60))).isoformat(),
+            "end_date": (now + timedelta(days=random.randint(1, 90))).isoformat(),
+        }
 
 
-def generate_leads(count: int = 200) -> list[dict]:
+def generate_leads(count: int = 200) -> Iterator[dict]:
     """Generate sample sales lead documents."""
     sources = ["website", "referral", "social", "event", "cold_call", "advertisement"]
     statuses = [
@@ -1555,95 +1556,75 @@ def generate_leads(count: int = 200) -> list[dict]:
         "won",
         "lost",
     ]
-    leads = []
+    now = datetime.now()
     for i in range(count):
-        leads.append(
-            {
-                "id": i + 1,
-                "lead_id": f"LEAD-{i + 1:05d}",
-                "company_name": f"{random.choice(['Tech', 'Global', 'Prime', 'Nova', 'Apex'])} {random.choice(['Solutions', 'Industries', 'Corp', 'Systems'])}",
-                "contact_name": f"{random.choice(USER_FIRST_NAMES)} {random.choice(USER_LAST_NAMES)}",
-                "email": f"contact{i + 1}@example.com",
-                "source": random.choice(sources),
-                "status": random.choice(statuses),
-                "estimated_value": round(random.uniform(1000, 100000), 2),
-                "created_at": (
-                    datetime.now() - timedelta(days=random.randint(1, 180))
-                ).isoformat(),
-            }
-        )
-    return leads
+        yield {
+            "id": i + 1,
+            "lead_id": f"LEAD-{i + 1:05d}",
+            "company_name": f"{random.choice(['Tech', 'Global', 'Prime', 'Nova', 'Apex'])} {random.choice(['Solutions', 'Industries', 'Corp', 'Systems'])}",
+            "contact_name": f"{random.choice(USER_FIRST_NAMES)} {random.choice(USER_LAST_NAMES)}",
+            "email": f"contact{i + 1}@example.com",
+            "source": random.choice(sources),
+            "status": random.choice(statuses),
+            "estimated_value": round(random.uniform(1000, 100000), 2),
+            "created_at": (now - timedelta(days=random.randint(1, 180))).isoformat(),
+        }
 
 
-def generate_contracts(count: int = 80) -> list[dict]:
+def generate_contracts(count: int = 80) -> Iterator[dict]:
     """Generate sample contract documents."""
     types = ["service", "employment", "nda", "partnership", "licensing"]
     statuses = ["draft", "pending_signature", "active", "expired", "terminated"]
-    contracts = []
+    now = datetime.now()
     for i in range(count):
-        contracts.append(
-            {
-                "id": i + 1,
-                "contract_id": f"CTR-{i + 1:05d}",
-                "title": f"{random.choice(types).title()} Agreement #{i + 1}",
-                "type": random.choice(types),
-                "status": random.choice(statuses),
-                "party_a": f"Company A - {i + 1}",
-                "party_b": f"Company B - {random.randint(1, 50)}",
-                "value": round(random.uniform(5000, 500000), 2),
-                "start_date": (
-                    datetime.now() - timedelta(days=random.randint(0, 365))
-                ).isoformat(),
-                "end_date": (
-                    datetime.now() + timedelta(days=random.randint(30, 730))
-                ).isoformat(),
-            }
-        )
-    return contracts
+        yield {
+            "id": i + 1,
+            "contract_id": f"CTR-{i + 1:05d}",
+            "title": f"{random.choice(types).title()} Agreement #{i + 1}",
+            "type": random.choice(types),
+            "status": random.choice(statuses),
+            "party_a": f"Company A - {i + 1}",
+            "party_b": f"Company B - {random.randint(1, 50)}",
+            "value": round(random.uniform(5000, 500000), 2),
+            "start_date": (now - timedelta(days=random.randint(0, 365))).isoformat(),
+            "end_date": (now + timedelta(days=random.randint(30, 730))).isoformat(),
+        }
 
 
-def generate_vendors(count: int = 60) -> list[dict]:
+def generate_vendors(count: int = 60) -> Iterator[dict]:
     """Generate sample vendor documents."""
     categories = ["technology", "supplies", "services", "logistics", "consulting"]
-    vendors = []
     for i in range(count):
-        vendors.append(
-            {
-                "id": i + 1,
-                "vendor_id": f"VND-{i + 1:04d}",
-                "name": f"{random.choice(['Alpha', 'Beta', 'Gamma', 'Delta'])} {random.choice(['Supplies', 'Tech', 'Services', 'Solutions'])} Inc.",
-                "category": random.choice(categories),
-                "contact_email": f"vendor{i + 1}@example.com",
-                "phone": f"+1-555-{random.randint(100, 999)}-{random.randint(1000, 9999)}",
-                "rating": round(random.uniform(1, 5), 1),
-                "total_orders": random.randint(1, 500),
-                "active": random.choice([True, True, True, False]),
-            }
-        )
-    return vendors
+        yield {
+            "id": i + 1,
+            "vendor_id": f"VND-{i + 1:04d}",
+            "name": f"{random.choice(['Alpha', 'Beta', 'Gamma', 'Delta'])} {random.choice(['Supplies', 'Tech', 'Services', 'Solutions'])} Inc.",
+            "category": random.choice(categories),
+            "contact_email": f"vendor{i + 1}@example.com",
+            "phone": f"+1-555-{random.randint(100, 999)}-{random.randint(1000, 9999)}",
+            "rating": round(random.uniform(1, 5), 1),
+            "total_orders": random.randint(1, 500),
+            "active": random.choice([True, True, True, False]),
+        }
 
 
-def generate_warehouses(count: int = 20) -> list[dict]:
+def generate_warehouses(count: int = 20) -> Iterator[dict]:
     """Generate sample warehouse documents."""
-    warehouses = []
     regions = ["North", "South", "East", "West", "Central"]
     for i in range(count):
-        warehouses.append(
-            {
-                "id": i + 1,
-                "warehouse_code": f"WH-{random.choice(regions)[:1]}{i + 1:02d}",
-                "name": f"{random.choice(regions)} Distribution Center {i + 1}",
-                "region": random.choice(regions),
-                "capacity_sqft": random.randint(10000, 500000),
-                "current_utilization": round(random.uniform(0.3, 0.95), 2),
-                "address": f"{random.randint(100, 9999)} Industrial Blvd, City {i + 1}",
-                "manager": f"{random.choice(USER_FIRST_NAMES)} {random.choice(USER_LAST_NAMES)}",
-            }
-        )
-    return warehouses
+        yield {
+            "id": i + 1,
+            "warehouse_code": f"WH-{random.choice(regions)[:1]}{i + 1:02d}",
+            "name": f"{random.choice(regions)} Distribution Center {i + 1}",
+            "region": random.choice(regions),
+            "capacity_sqft": random.randint(10000, 500000),
+            "current_utilization": round(random.uniform(0.3, 0.95), 2),
+            "address": f"{random.randint(100, 9999)} Industrial Blvd, City {i + 1}",
+            "manager": f"{random.choice(USER_FIRST_NAMES)} {random.choice(USER_LAST_NAMES)}",
+        }
 
 
-def generate_shipments(count: int = 350) -> list[dict]:
+def generate_shipments(count: int = 350) -> Iterator[dict]:
     """Generate sample shipment documents."""
     statuses = [
         "pending",
@@ -1655,45 +1636,40 @@ def generate_shipments(count: int = 350) -> list[dict]:
         "returned",
     ]
     carriers = ["FedEx", "UPS", "USPS", "DHL", "Amazon Logistics"]
-    shipments = []
+    now = datetime.now()
     for i in range(count):
-        shipments.append(
-            {
-                "id": i + 1,
-                "tracking_number": f"TRK{random.randint(100000000, 999999999)}",
-                "order_id": f"ORD-{random.randint(1, 1000):05d}",
-                "status": random.choice(statuses),
-                "carrier": random.choice(carriers),
-                "weight_kg": round(random.uniform(0.1, 50), 2),
-                "origin_warehouse": f"WH-{random.choice(['N', 'S', 'E', 'W', 'C'])}{random.randint(1, 20):02d}",
-                "destination_city": random.choice(
-                    [
-                        "New York",
-                        "Los Angeles",
-                        "Chicago",
-                        "Houston",
-                        "Phoenix",
-                        "Philadelphia",
-                        "San Antonio",
-                        "San Diego",
-                        "Dallas",
-                        "San Jose",
-                    ]
-                ),
-                "shipped_at": (
-                    datetime.now() - timedelta(days=random.randint(0, 14))
-                ).isoformat()
-                if random.random() > 0.2
-                else None,
-                "estimated_delivery": (
-                    datetime.now() + timedelta(days=random.randint(1, 7))
-                ).isoformat(),
-            }
-        )
-    return shipments
+        yield {
+            "id": i + 1,
+            "tracking_number": f"TRK{random.randint(100000000, 999999999)}",
+            "order_id": f"ORD-{random.randint(1, 1000):05d}",
+            "status": random.choice(statuses),
+            "carrier": random.choice(carriers),
+            "weight_kg": round(random.uniform(0.1, 50), 2),
+            "origin_warehouse": f"WH-{random.choice(['N', 'S', 'E', 'W', 'C'])}{random.randint(1, 20):02d}",
+            "destination_city": random.choice(
+                [
+                    "New York",
+                    "Los Angeles",
+                    "Chicago",
+                    "Houston",
+                    "Phoenix",
+                    "Philadelphia",
+                    "San Antonio",
+                    "San Diego",
+                    "Dallas",
+                    "San Jose",
+                ]
+            ),
+            "shipped_at": (now - timedelta(days=random.randint(0, 14))).isoformat()
+            if random.random() > 0.2
+            else None,
+            "estimated_delivery": (
+                now + timedelta(days=random.randint(1, 7))
+            ).isoformat(),
+        }
 
 
-def generate_returns(count: int = 100) -> list[dict]:
+def generate_returns(count: int = 100) -> Iterator[dict]:
     """Generate sample return request documents."""
     reasons = [
         "defective",
@@ -1703,183 +1679,142 @@ def generate_returns(count: int = 100) -> list[dict]:
         "damaged_shipping",
     ]
     statuses = ["requested", "approved", "rejected", "received", "refunded"]
-    returns = []
+    now = datetime.now()
     for i in range(count):
-        returns.append(
-            {
-                "id": i + 1,
-                "return_id": f"RET-{i + 1:05d}",
-                "order_id": f"ORD-{random.randint(1, 1000):05d}",
-                "reason": random.choice(reasons),
-                "status": random.choice(statuses),
-                "refund_amount": round(random.uniform(10, 500), 2),
-                "customer_notes": "Return request notes from customer.",
-                "created_at": (
-                    datetime.now() - timedelta(days=random.randint(1, 30))
-                ).isoformat(),
-            }
-        )
-    return returns
+        yield {
+            "id": i + 1,
+            "return_id": f"RET-{i + 1:05d}",
+            "order_id": f"ORD-{random.randint(1, 1000):05d}",
+            "reason": random.choice(reasons),
+            "status": random.choice(statuses),
+            "refund_amount": round(random.uniform(10, 500), 2),
+            "customer_notes": "Return request notes from customer.",
+            "created_at": (now - timedelta(days=random.randint(1, 30))).isoformat(),
+        }
 
 
-def generate_coupons(count: int = 40) -> list[dict]:
+def generate_coupons(count: int = 40) -> Iterator[dict]:
     """Generate sample coupon documents."""
     types = ["percentage", "fixed_amount", "free_shipping", "buy_one_get_one"]
-    coupons = []
+    now = datetime.now()
     for i in range(count):
-        coupons.append(
-            {
-                "id": i + 1,
-                "code": f"SAVE{random.randint(10, 50)}-{random.choice(['SUMMER', 'WINTER', 'FALL', 'SPRING', 'HOLIDAY'])}{i + 1}",
-                "type": random.choice(types),
-                "discount_value": random.randint(5, 50),
-                "min_purchase": round(random.uniform(0, 100), 2),
-                "max_uses": random.randint(100, 10000),
-                "current_uses": random.randint(0, 5000),
-                "valid_from": (
-                    datetime.now() - timedelta(days=random.randint(0, 30))
-                ).isoformat(),
-                "valid_until": (
-                    datetime.now() + timedelta(days=random.randint(1, 90))
-                ).isoformat(),
-                "active": random.choice([True, True, True, False]),
-            }
-        )
-    return coupons
+        yield {
+            "id": i + 1,
+            "code": f"SAVE{random.randint(10, 50)}-{random.choice(['SUMMER', 'WINTER', 'FALL', 'SPRING', 'HOLIDAY'])}{i + 1}",
+            "type": random.choice(types),
+            "discount_value": random.randint(5, 50),
+            "min_purchase": round(random.uniform(0, 100), 2),
+            "max_uses": random.randint(100, 10000),
+            "current_uses": random.randint(0, 5000),
+            "valid_from": (now - timedelta(days=random.randint(0, 30))).isoformat(),
+            "valid_until": (now + timedelta(days=random.randint(1, 90))).isoformat(),
+            "active": random.choice([True, True, True, False]),
+        }
 
 
-def generate_wishlists(count: int = 150) -> list[dict]:
+def generate_wishlists(count: int = 150) -> Iterator[dict]:
     """Generate sample wishlist documents."""
-    wishlists = []
+    now = datetime.now()
     for i in range(count):
-        wishlists.append(
-            {
-                "id": i + 1,
-                "user_id": random.randint(1, 200),
-                "name": random.choice(
-                    [
-                        "My Wishlist",
-                        "Birthday Gifts",
-                        "Holiday Ideas",
-                        "Later",
-                        "Favorites",
-                    ]
-                ),
-                "product_ids": [
-                    random.randint(1, 500) for _ in range(random.randint(1, 20))
-                ],
-                "is_public": random.choice([True, False]),
-                "created_at": (
-                    datetime.now() - timedelta(days=random.randint(1, 365))
-                ).isoformat(),
-                "updated_at": (
-                    datetime.now() - timedelta(days=random.randint(0, 30))
-                ).isoformat(),
-            }
-        )
-    return wishlists
+        yield {
+            "id": i + 1,
+            "user_id": random.randint(1, 200),
+            "name": random.choice(
+                [
+                    "My Wishlist",
+                    "Birthday Gifts",
+                    "Holiday Ideas",
+                    "Later",
+                    "Favorites",
+                ]
+            ),
+            "product_ids": [
+                random.randint(1, 500) for _ in range(random.randint(1, 20))
+            ],
+            "is_public": random.choice([True, False]),
+            "created_at": (now - timedelta(days=random.randint(1, 365))).isoformat(),
+            "updated_at": (now - timedelta(days=random.randint(0, 30))).isoformat(),
+        }
 
 
-def generate_faqs(count: int = 80) -> list[dict]:
+def generate_faqs(count: int = 80) -> Iterator[dict]:
     """Generate sample FAQ documents."""
     categories = ["billing", "shipping", "returns", "account", "products", "technical"]
-    faqs = []
+    now = datetime.now()
     for i in range(count):
-        faqs.append(
-            {
-                "id": i + 1,
-                "question": f"How do I {random.choice(['reset', 'update', 'cancel', 'track', 'contact'])} my {random.choice(['order', 'account', 'subscription', 'payment'])}?",
-                "answer": "Detailed answer with step-by-step instructions for the user.",
-                "category": random.choice(categories),
-                "helpful_count": random.randint(0, 500),
-                "view_count": random.randint(10, 5000),
-                "last_updated": (
-                    datetime.now() - timedelta(days=random.randint(1, 180))
-                ).isoformat(),
-            }
-        )
-    return faqs
+        yield {
+            "id": i + 1,
+            "question": f"How do I {random.choice(['reset', 'update', 'cancel', 'track', 'contact'])} my {random.choice(['order', 'account', 'subscription', 'payment'])}?",
+            "answer": "Detailed answer with step-by-step instructions for the user.",
+            "category": random.choice(categories),
+            "helpful_count": random.randint(0, 500),
+            "view_count": random.randint(10, 5000),
+            "last_updated": (now - timedelta(days=random.randint(1, 180))).isoformat(),
+        }
 
 
-def generate_announcements(count: int = 30) -> list[dict]:
+def generate_announcements(count: int = 30) -> Iterator[dict]:
     """Generate sample announcement documents."""
     types = ["feature", "maintenance", "security", "promotion", "general"]
-    announcements = []
+    now = datetime.now()
     for i in range(count):
-        announcements.append(
-            {
-                "id": i + 1,
-                "title": f"Important Announcement #{i + 1}",
-                "content": f"We are excited to announce {random.choice(['a new feature', 'scheduled maintenance', 'security updates', 'special promotion'])}.",
-                "type": random.choice(types),
-                "priority": random.choice(["low", "medium", "high", "critical"]),
-                "published_at": (
-                    datetime.now() - timedelta(days=random.randint(0, 90))
-                ).isoformat(),
-                "expires_at": (
-                    datetime.now() + timedelta(days=random.randint(1, 30))
-                ).isoformat()
-                if random.random() > 0.5
-                else None,
-                "is_pinned": random.choice([True, False, False, False]),
-            }
-        )
-    return announcements
+        yield {
+            "id": i + 1,
+            "title": f"Important Announcement #{i + 1}",
+            "content": f"We are excited to announce {random.choice(['a new feature', 'scheduled maintenance', 'security updates', 'special promotion'])}.",
+            "type": random.choice(types),
+            "priority": random.choice(["low", "medium", "high", "critical"]),
+            "published_at": (now - timedelta(days=random.randint(0, 90))).isoformat(),
+            "expires_at": (now + timedelta(days=random.randint(1, 30))).isoformat()
+            if random.random() > 0.5
+            else None,
+            "is_pinned": random.choice([True, False, False, False]),
+        }
 
 
-def generate_audit_logs(count: int = 1000) -> list[dict]:
+def generate_audit_logs(count: int = 1000) -> Iterator[dict]:
     """Generate sample audit log documents."""
     actions = ["create", "update", "delete", "login", "logout", "export", "import"]
     resources = ["user", "order", "product", "setting", "report", "api_key"]
-    logs = []
+    now = datetime.now()
     for i in range(count):
-        logs.append(
-            {
-                "id": i + 1,
-                "action": random.choice(actions),
-                "resource_type": random.choice(resources),
-                "resource_id": str(random.randint(1, 1000)),
-                "user_id": random.randint(1, 100),
-                "user_email": f"user{random.randint(1, 100)}@example.com",
-                "ip_address": f"192.168.{random.randint(1, 255)}.{random.randint(1, 255)}",
-                "user_agent": "Mozilla/5.0 (compatible)",
-                "timestamp": (
-                    datetime.now() - timedelta(minutes=random.randint(1, 43200))
-                ).isoformat(),
-            }
-        )
-    return logs
+        yield {
+            "id": i + 1,
+            "action": random.choice(actions),
+            "resource_type": random.choice(resources),
+            "resource_id": str(random.randint(1, 1000)),
+            "user_id": random.randint(1, 100),
+            "user_email": f"user{random.randint(1, 100)}@example.com",
+            "ip_address": f"192.168.{random.randint(1, 255)}.{random.randint(1, 255)}",
+            "user_agent": "Mozilla/5.0 (compatible)",
+            "timestamp": (
+                now - timedelta(minutes=random.randint(1, 43200))
+            ).isoformat(),
+        }
 
 
-def generate_api_keys(count: int = 25) -> list[dict]:
+def generate_api_keys(count: int = 25) -> Iterator[dict]:
     """Generate sample API key documents."""
     scopes = ["read", "write", "admin", "analytics", "search"]
-    keys = []
+    now = datetime.now()
     for i in range(count):
-        keys.append(
-            {
-                "id": i + 1,
-                "key_prefix": f"ms_{random.choice(['live', 'test'])}_{i + 1:04d}",
-                "name": f"API Key - {random.choice(['Production', 'Development', 'Testing', 'CI/CD'])} {i + 1}",
-                "scopes": random.sample(scopes, k=random.randint(1, 4)),
-                "created_by": random.randint(1, 50),
-                "last_used_at": (
-                    datetime.now() - timedelta(hours=random.randint(0, 720))
-                ).isoformat()
-                if random.random() > 0.3
-                else None,
-                "expires_at": (
-                    datetime.now() + timedelta(days=random.randint(30, 365))
-                ).isoformat()
-                if random.random() > 0.3
-                else None,
-                "is_active": random.choice([True, True, True, False]),
-            }
-        )
-    return keys
+        yield {
+            "id": i + 1,
+            "key_prefix": f"ms_{random.choice(['live', 'test'])}_{i + 1:04d}",
+            "name": f"API Key - {random.choice(['Production', 'Development', 'Testing', 'CI/CD'])} {i + 1}",
+            "scopes": random.sample(scopes, k=random.randint(1, 4)),
+            "created_by": random.randint(1, 50),
+            "last_used_at": (now - timedelta(hours=random.randint(0, 720))).isoformat()
+            if random.random() > 0.3
+            else None,
+            "expires_at": (now + timedelta(days=random.randint(30, 365))).isoformat()
+            if random.random() > 0.3
+            else None,
+            "is_active": random.choice([True, True, True, False]),
+        }
 
 
-def generate_webhooks(count: int = 20) -> list[dict]:
+def generate_webhooks(count: int = 20) -> Iterator[dict]:
     """Generate sample webhook configuration documents."""
     events = [
         "order.created",
@@ -1888,101 +1823,79 @@ def generate_webhooks(count: int = 20) -> list[dict]:
         "payment.completed",
         "inventory.low",
     ]
-    webhooks = []
+    now = datetime.now()
     for i in range(count):
-        webhooks.append(
-            {
-                "id": i + 1,
-                "name": f"Webhook #{i + 1}",
-                "url": f"https://example{i + 1}.com/webhook",
-                "events": random.sample(events, k=random.randint(1, 4)),
-                "secret": f"whsec_{i + 1:08d}",
-                "is_active": random.choice([True, True, False]),
-                "failure_count": random.randint(0, 10),
-                "last_triggered_at": (
-                    datetime.now() - timedelta(hours=random.randint(0, 168))
-                ).isoformat()
-                if random.random() > 0.2
-                else None,
-            }
-        )
-    return webhooks
+        yield {
+            "id": i + 1,
+            "name": f"Webhook #{i + 1}",
+            "url": f"https://example{i + 1}.com/webhook",
+            "events": random.sample(events, k=random.randint(1, 4)),
+            "secret": f"whsec_{i + 1:08d}",
+            "is_active": random.choice([True, True, False]),
+            "failure_count": random.randint(0, 10),
+            "last_triggered_at": (
+                now - timedelta(hours=random.randint(0, 168))
+            ).isoformat()
+            if random.random() > 0.2
+            else None,
+        }
 
 
-def generate_reports(count: int = 50) -> list[dict]:
+def generate_reports(count: int = 50) -> Iterator[dict]:
     """Generate sample report documents."""
     types = ["sales", "inventory", "traffic", "conversion", "financial"]
     frequencies = ["daily", "weekly", "monthly", "quarterly", "yearly"]
-    reports = []
+    now = datetime.now()
     for i in range(count):
-        reports.append(
-            {
-                "id": i + 1,
-                "report_name": f"{random.choice(types).title()} Report - {random.choice(frequencies).title()}",
-                "type": random.choice(types),
-                "frequency": random.choice(frequencies),
-                "created_by": random.randint(1, 50),
-                "last_run_at": (
-                    datetime.now() - timedelta(hours=random.randint(1, 720))
-                ).isoformat(),
-                "next_run_at": (
-                    datetime.now() + timedelta(hours=random.randint(1, 168))
-                ).isoformat(),
-                "recipients": [
-                    f"user{j}@example.com" for j in range(random.randint(1, 5))
-                ],
-                "is_scheduled": random.choice([True, True, False]),
-            }
-        )
-    return reports
+        yield {
+            "id": i + 1,
+            "report_name": f"{random.choice(types).title()} Report - {random.choice(frequencies).title()}",
+            "type": random.choice(types),
+            "frequency": random.choice(frequencies),
+            "created_by": random.randint(1, 50),
+            "last_run_at": (now - timedelta(hours=random.randint(1, 720))).isoformat(),
+            "next_run_at": (now + timedelta(hours=random.randint(1, 168))).isoformat(),
+            "recipients": [f"user{j}@example.com" for j in range(random.randint(1, 5))],
+            "is_scheduled": random.choice([True, True, False]),
+        }
 
 
-def generate_templates(count: int = 30) -> list[dict]:
+def generate_templates(count: int = 30) -> Iterator[dict]:
     """Generate sample template documents."""
     types = ["email", "notification", "invoice", "report", "contract"]
-    templates = []
+    now = datetime.now()
     for i in range(count):
-        templates.append(
-            {
-                "id": i + 1,
-                "name": f"{random.choice(types).title()} Template #{i + 1}",
-                "type": random.choice(types),
-                "subject": f"Template subject line {i + 1}",
-                "body": "Template body content with placeholders like {name} and {date}.",
-                "variables": ["name", "date", "amount", "company"],
-                "created_by": random.randint(1, 50),
-                "is_default": i < 5,
-                "last_modified": (
-                    datetime.now() - timedelta(days=random.randint(1, 180))
-                ).isoformat(),
-            }
-        )
-    return templates
+        yield {
+            "id": i + 1,
+            "name": f"{random.choice(types).title()} Template #{i + 1}",
+            "type": random.choice(types),
+            "subject": f"Template subject line {i + 1}",
+            "body": "Template body content with placeholders like {name} and {date}.",
+            "variables": ["name", "date", "amount", "company"],
+            "created_by": random.randint(1, 50),
+            "is_default": i < 5,
+            "last_modified": (now - timedelta(days=random.randint(1, 180))).isoformat(),
+        }
 
 
-def generate_integrations(count: int = 15) -> list[dict]:
+def generate_integrations(count: int = 15) -> Iterator[dict]:
     """Generate sample integration configuration documents."""
     types = ["crm", "erp", "email", "analytics", "payment", "shipping"]
     providers = ["Salesforce", "HubSpot", "Mailchimp", "Stripe", "Zapier", "Shopify"]
-    integrations = []
+    now = datetime.now()
     for i in range(count):
-        integrations.append(
-            {
-                "id": i + 1,
-                "name": f"{random.choice(providers)} Integration",
-                "type": random.choice(types),
-                "provider": random.choice(providers),
-                "status": random.choice(["active", "active", "inactive", "error"]),
-                "last_sync_at": (
-                    datetime.now() - timedelta(minutes=random.randint(5, 1440))
-                ).isoformat(),
-                "sync_frequency_minutes": random.choice([15, 30, 60, 360, 1440]),
-                "error_message": "Connection timeout"
-                if random.random() < 0.1
-                else None,
-            }
-        )
-    return integrations
+        yield {
+            "id": i + 1,
+            "name": f"{random.choice(providers)} Integration",
+            "type": random.choice(types),
+            "provider": random.choice(providers),
+            "status": random.choice(["active", "active", "inactive", "error"]),
+            "last_sync_at": (
+                now - timedelta(minutes=random.randint(5, 1440))
+            ).isoformat(),
+            "sync_frequency_minutes": random.choice([15, 30, 60, 360, 1440]),
+            "error_message": "Connection timeout" if random.random() < 0.1 else None,
+        }
 
 
 # Index configurations with intentional issues for the analyzer to detect
@@ -3044,11 +2957,128 @@ def _calculate_proportional_counts(total_documents: int) -> dict[str, int]:
     return counts
 
 
+def _add_tar_dir(tar: tarfile.TarFile, name: str, mtime: float) -> None:
+    """Add a directory entry to the dump archive."""
+    info = tarfile.TarInfo(name)
+    info.type = tarfile.DIRTYPE
+    info.mode = 0o755
+    info.mtime = mtime
+    tar.addfile(info)
+
+
+def _add_tar_file(
+    tar: tarfile.TarFile, name: str, payload: bytes | bytearray, mtime: float
+) -> None:
+    """Add an in-memory file to the dump archive."""
+    _add_tar_fileobj(tar, name, io.BytesIO(payload), len(payload), mtime)
+
+
+def _add_tar_fileobj(
+    tar: tarfile.TarFile, name: str, fileobj: IO[bytes], size: int, mtime: float
+) -> None:
+    """Add a file to the dump archive from an open file positioned at its start."""
+    info = tarfile.TarInfo(name)
+    info.size = size
+    info.mtime = mtime
+    tar.addfile(info, fileobj)
+
+
+def _seed_index_random(index_uid: str, rng_seed: int | None) -> None:
+    """Seed ``random`` for generating one index's documents.
+
+    Seeded runs derive the stream from ``rng_seed`` and the index UID, so an
+    index gets the same documents whether it is written to a dump (in any
+    worker) or posted to an instance. Unseeded runs reseed from the OS,
+    since forked dump workers inherit the parent's random state.
+    """
+    random.seed(None if rng_seed is None else f"{rng_seed}:{index_uid}")
+
+
+def _write_index_documents(
+    index_uid: str, doc_count: int, scratch_dir: str, rng_seed: int | None
+) -> Path:
+    """Generate one index's documents into a JSONL file in a worker process.
+
+    Returns:
+        Path of the written documents.jsonl file
+    """
+    _seed_index_random(index_uid, rng_seed)
+    path = Path(scratch_dir) / f"{index_uid}.jsonl"
+    with open(path, "wb") as f:
+        f.writelines(
+            orjson.dumps(doc, option=orjson.OPT_APPEND_NEWLINE)
+            for doc in INDEX_CONFIGS[index_uid]["documents"](doc_count)
+        )
+    return path
+
+
+def _generate_task_history(index_uids: Iterable[str]) -> Iterator[dict]:
+    """Generate the task history written to the dump's queue.json.
+
+    Settings updates follow document additions (for B001 detection), and a
+    few failed tasks are added at the end (for P001 detection).
+    """
+    base_time = datetime.now() - timedelta(hours=24)
+    task_id = 0
+
+    for index_uid in index_uids:
+        # Document addition task (earlier)
+        yield {
+            "uid": task_id,
+            "indexUid": index_uid,
+            "status": "succeeded",
+            "type": "documentAdditionOrUpdate",
+            "enqueuedAt": (base_time + timedelta(minutes=task_id)).isoformat(),
+            "startedAt": (
+                base_time + timedelta(minutes=task_id, seconds=1)
+            ).isoformat(),
+            "finishedAt": (
+                base_time + timedelta(minutes=task_id, seconds=5)
+            ).isoformat(),
+        }
+        task_id += 1
+
+        # Settings update task (later) - triggers B001
+        yield {
+            "uid": task_id,
+            "indexUid": index_uid,
+            "status": "succeeded",
+            "type": "settingsUpdate",
+            "enqueuedAt": (base_time + timedelta(minutes=task_id + 10)).isoformat(),
+            "startedAt": (
+                base_time + timedelta(minutes=task_id + 10, seconds=1)
+            ).isoformat(),
+            "finishedAt": (
+                base_time + timedelta(minutes=task_id + 10, seconds=2)
+            ).isoformat(),
+        }
+        task_id += 1
+
+    # Add some failed tasks (for P001 detection)
+    for i in range(5):
+        yield {
+            "uid": task_id,
+            "indexUid": "products",
+            "status": "failed",
+            "type": "documentAdditionOrUpdate",
+            "error": {"message": "Simulated error", "code": "internal"},
+            "enqueuedAt": (base_time + timedelta(minutes=task_id)).isoformat(),
+            "startedAt": (
+                base_time + timedelta(minutes=task_id, seconds=1)
+            ).isoformat(),
+            "finishedAt": (
+                base_time + timedelta(minutes=task_id, seconds=2)
+            ).isoformat(),
+        }
+        task_id += 1
+
+
 def create_dump_file(
     output_path: str | Path,
     size: str = "medium",
     total_documents: int | None = None,
     single_index: str | None = None,
+    rng_seed: int | None = None,
 ) -> None:
     """Create a mock MeiliSearch dump file.
 
@@ -3057,9 +3087,13 @@ def create_dump_file(
         size: Size preset - "small", "medium", or "large"
         total_documents: If specified, scale document counts to reach this total
         single_index: If specified, only create this index with total_documents count
+        rng_seed: If specified, generate the same random content on every run
+            (timestamps still follow the clock)
     """
     output_path = Path(output_path)
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    # One clock reading for the dump name and every timestamp in the dump
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d-%H%M%S")
     dump_name = f"dump-{timestamp}"
 
     # Determine which indexes to create and their document counts
@@ -3090,131 +3124,104 @@ def create_dump_file(
         }
         print(f"Using size preset: {size}")
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        dump_dir = Path(temp_dir) / dump_name
-        dump_dir.mkdir()
+    # Small files are built in memory and streamed straight into the archive;
+    # only generated documents pass through a scratch directory
+    max_workers = min(len(index_doc_counts), os.cpu_count() or 1)
+    with (
+        tempfile.TemporaryDirectory() as scratch_dir,
+        ProcessPoolExecutor(max_workers=max_workers) as executor,
+        open(output_path, "wb", buffering=DUMP_WRITE_BUFFER_SIZE) as output_file,
+        tarfile.open(
+            fileobj=output_file, mode="w:gz", compresslevel=DUMP_COMPRESSION_LEVEL
+        ) as tar,
+    ):
+        mtime = time.time()
+        _add_tar_dir(tar, dump_name, mtime)
 
         # Create metadata.json
         metadata = {
             "dumpVersion": "V6",
             "dbVersion": "1.12.0",
-            "dumpDate": datetime.now().isoformat(),
+            "dumpDate": now.isoformat(),
             "instanceUid": "test-instance-12345",
         }
-        (dump_dir / "metadata.json").write_text(json.dumps(metadata, indent=2))
+        _add_tar_file(
+            tar,
+            f"{dump_name}/metadata.json",
+            orjson.dumps(metadata, option=orjson.OPT_INDENT_2),
+            mtime,
+        )
 
         # Create keys.json (empty)
-        (dump_dir / "keys.json").write_text("[]")
+        _add_tar_file(tar, f"{dump_name}/keys.json", b"[]", mtime)
 
         # Create tasks directory
-        tasks_dir = dump_dir / "tasks"
-        tasks_dir.mkdir()
+        _add_tar_dir(tar, f"{dump_name}/tasks", mtime)
 
-        # Generate some task history (for B001 detection - settings after documents)
-        tasks = []
-        base_time = datetime.now() - timedelta(hours=24)
-        task_id = 0
-
-        for index_uid in index_doc_counts:
-            # Document addition task (earlier)
-            tasks.append(
-                {
-                    "uid": task_id,
-                    "indexUid": index_uid,
-                    "status": "succeeded",
-                    "type": "documentAdditionOrUpdate",
-                    "enqueuedAt": (base_time + timedelta(minutes=task_id)).isoformat(),
-                    "startedAt": (
-                        base_time + timedelta(minutes=task_id, seconds=1)
-                    ).isoformat(),
-                    "finishedAt": (
-                        base_time + timedelta(minutes=task_id, seconds=5)
-                    ).isoformat(),
-                }
-            )
-            task_id += 1
-
-            # Settings update task (later) - triggers B001
-            tasks.append(
-                {
-                    "uid": task_id,
-                    "indexUid": index_uid,
-                    "status": "succeeded",
-                    "type": "settingsUpdate",
-                    "enqueuedAt": (
-                        base_time + timedelta(minutes=task_id + 10)
-                    ).isoformat(),
-                    "startedAt": (
-                        base_time + timedelta(minutes=task_id + 10, seconds=1)
-                    ).isoformat(),
-                    "finishedAt": (
-                        base_time + timedelta(minutes=task_id + 10, seconds=2)
-                    ).isoformat(),
-                }
-            )
-            task_id += 1
-
-        # Add some failed tasks (for P001 detection)
-        for i in range(5):
-            tasks.append(
-                {
-                    "uid": task_id,
-                    "indexUid": "products",
-                    "status": "failed",
-                    "type": "documentAdditionOrUpdate",
-                    "error": {"message": "Simulated error", "code": "internal"},
-                    "enqueuedAt": (base_time + timedelta(minutes=task_id)).isoformat(),
-                    "startedAt": (
-                        base_time + timedelta(minutes=task_id, seconds=1)
-                    ).isoformat(),
-                    "finishedAt": (
-                        base_time + timedelta(minutes=task_id, seconds=2)
-                    ).isoformat(),
-                }
-            )
-            task_id += 1
-
-        (tasks_dir / "queue.json").write_text(json.dumps(tasks, indent=2))
+        # Generate some task history, written one task per line so the
+        # queue is never held as a single list
+        queue = bytearray(b"[")
+        for n, task in enumerate(_generate_task_history(index_doc_counts)):
+            queue += b",\n" if n else b"\n"
+            queue += orjson.dumps(task)
+        queue += b"\n]\n"
+        _add_tar_file(tar, f"{dump_name}/tasks/queue.json", queue, mtime)
 
         # Create indexes directory
-        indexes_dir = dump_dir / "indexes"
-        indexes_dir.mkdir()
+        _add_tar_dir(tar, f"{dump_name}/indexes", mtime)
 
+        # Indexes are independent, so their documents are generated in
+        # worker processes; the archive is still filled in index order
+        write_documents = partial(
+            _write_index_documents, scratch_dir=scratch_dir, rng_seed=rng_seed
+        )
+        documents_paths = executor.map(
+            write_documents, index_doc_counts, index_doc_counts.values()
+        )
+
+        created_at = (now - timedelta(days=30)).isoformat()
+        updated_at = now.isoformat()
         total_docs = 0
-        for index_uid in index_doc_counts:
+        for index_uid, documents_path in zip(index_doc_counts, documents_paths):
             config = INDEX_CONFIGS[index_uid]
-            index_dir = indexes_dir / index_uid
-            index_dir.mkdir()
+            index_dir = f"{dump_name}/indexes/{index_uid}"
+            _add_tar_dir(tar, index_dir, mtime)
 
             # Index metadata
             index_metadata = {
                 "uid": index_uid,
                 "primaryKey": config["primaryKey"],
-                "createdAt": (datetime.now() - timedelta(days=30)).isoformat(),
-                "updatedAt": datetime.now().isoformat(),
+                "createdAt": created_at,
+                "updatedAt": updated_at,
             }
-            (index_dir / "metadata.json").write_text(
-                json.dumps(index_metadata, indent=2)
+            _add_tar_file(
+                tar,
+                f"{index_dir}/metadata.json",
+                orjson.dumps(index_metadata, option=orjson.OPT_INDENT_2),
+                mtime,
             )
 
             # Settings
-            (index_dir / "settings.json").write_text(
-                json.dumps(config["settings"], indent=2)
+            _add_tar_file(
+                tar,
+                f"{index_dir}/settings.json",
+                orjson.dumps(config["settings"], option=orjson.OPT_INDENT_2),
+                mtime,
             )
 
-            # Documents (JSONL format)
+            # Documents (JSONL format), added as each worker's file is ready
             doc_count = index_doc_counts[index_uid]
-            docs = config["documents"](doc_count)
-            with open(index_dir / "documents.jsonl", "w") as f:
-                for doc in docs:
-                    f.write(json.dumps(doc) + "\n")
-
-            print(f"  Created index '{index_uid}' with {len(docs):,} documents")
-            total_docs += len(docs)
+            with open(documents_path, "rb") as f:
+                _add_tar_fileobj(
+                    tar,
+                    f"{index_dir}/documents.jsonl",
+                    f,
+                    os.fstat(f.fileno()).st_size,
+                    mtime,
+                )
 
-        # Create tar.gz archive
-        with tarfile.open(output_path, "w:gz") as tar:
-            tar.add(dump_dir, arcname=dump_name)
+            print(f"  Created index '{index_uid}' with {doc_count:,} documents")
+            total_docs += doc_count
 
     print(f"\nDump file created: {output_path}")
     print(f"  Total indexes: {len(index_doc_counts)}")
@@ -3227,6 +3234,7 @@ def seed_instance(
     api_key: str | None = None,
     total_documents: int | None = None,
     single_index: str | None = None,
+    rng_seed: int | None = None,
 ) -> None:
     """Seed a live MeiliSearch instance with test data.
 
@@ -3235,6 +3243,8 @@ def seed_instance(
         api_key: Optional API key for authentication
         total_documents: If specified, scale document counts to reach this total
         single_index: If specified, only create this index with total_documents count
+        rng_seed: If specified, generate the same random content as a dump
+            created with the same seed
     """
     try:
         import httpx
@@ -3311,8 +3321,10 @@ def seed_instance(
                 print(f"    Error creating index: {response.text}")
                 continue
 
-        # Wait for index creation
-        _wait_for_task(client, response)
+        # MeiliSearch processes an index's tasks in order, so the settings
+        # update and document batches are enqueued right away and awaited
+        # together once everything for this index has been submitted
+        pending = [response]
 
         # Update settings
         response = client.patch(
@@ -3321,14 +3333,19 @@ def seed_instance(
         )
         task_info = response.json()
         print(f"    Settings update task: {task_info.get('taskUid', 'N/A')}")
-        _wait_for_task(client, response)
+        pending.append(response)
 
-        # Add documents (in batches for large counts or large documents)
+        # Add documents (in batches for large counts or large documents).
+        # Documents are generated lazily, one batch at a time.
+        _seed_index_random(index_uid, rng_seed)
         docs = config["documents"](doc_count)
+        first_doc = next(docs, None)
+        if first_doc is not None:
+            docs = itertools.chain([first_doc], docs)
 
         # Estimate document size to determine batch size
         # For very large documents (like knowledge_base), use smaller batches
-        sample_size = len(json.dumps(docs[0])) if docs else 0
+        sample_size = len(orjson.dumps(first_doc)) if first_doc is not None else 0
         if sample_size > 50000:  # > 50KB per document
             batch_size = 50  # Small batches for large docs
         elif sample_size > 10000:  # > 10KB per document
@@ -3336,31 +3353,36 @@ def seed_instance(
         else:
             batch_size = 10000  # MeiliSearch handles this well
 
-        if len(docs) <= batch_size:
+        if doc_count <= batch_size:
             # Single batch
+            body, _ = _ndjson_body(docs)
             response = client.post(
                 f"/indexes/{index_uid}/documents",
-                json=docs,
+                content=body,
+                headers=NDJSON_HEADERS,
             )
             task_info = response.json()
             print(f"    Document addition task: {task_info.get('taskUid', 'N/A')}")
-            print(f"    Adding {len(docs):,} documents...")
-            _wait_for_task(client, response)
+            print(f"    Adding {doc_count:,} documents...")
+            pending.append(response)
         else:
             # Multiple batches
-            total_batches = (len(docs) + batch_size - 1) // batch_size
-            print(f"    Adding {len(docs):,} documents in {total_batches} batches...")
-            for batch_num, i in enumerate(range(0, len(docs), batch_size), 1):
-                batch = docs[i : i + batch_size]
+            total_batches = (doc_count + batch_size - 1) // batch_size
+            print(f"    Adding {doc_count:,} documents in {total_batches} batches...")
+            for batch_num in range(1, total_batches + 1):
+                body, batch_count = _ndjson_body(itertools.islice(docs, batch_size))
                 response = client.post(
                     f"/indexes/{index_uid}/documents",
-                    json=batch,
+                    content=body,
+                    headers=NDJSON_HEADERS,
                 )
                 task_info = response.json()
                 print(
-                    f"    Batch {batch_num}/{total_batches}: {len(batch):,} docs (task {task_info.get('taskUid', 'N/A')})"
+                    f"    Batch {batch_num}/{total_batches}: {batch_count:,} docs (task {task_info.get('taskUid', 'N/A')})"
                 )
-                _wait_for_task(client, response)
+                pending.append(response)
+
+        _wait_for_tasks(client, pending)
 
         print("    Done!")
 
@@ -3370,51 +3392,83 @@ def seed_instance(
     print(f"  meiliscan serve --url {url}")
 
 
-def _wait_for_task(client, response, max_retries: int = 5) -> None:
-    """Wait for a MeiliSearch task to complete.
+def _ndjson_body(docs: Iterable[dict]) -> tuple[bytes, int]:
+    """Serialize documents into a single NDJSON request body.
+
+    Each document is appended to one growing buffer as it is generated, so
+    a batch is never held as a list of dicts alongside its encoding.
+
+    Returns:
+        The request body and the number of documents in it
+    """
+    buf = bytearray()
+    count = 0
+    for count, doc in enumerate(docs, 1):
+        buf += orjson.dumps(doc, option=orjson.OPT_APPEND_NEWLINE)
+    return bytes(buf), count
+
+
+def _wait_for_tasks(client, responses, max_retries: int = 5) -> None:
+    """Wait for a set of MeiliSearch tasks to complete.
+
+    Outstanding tasks are polled together through the ``/tasks`` filter
+    endpoint, so each poll is one request however many tasks are pending.
 
     Args:
         client: httpx client
-        response: Response from task-creating request
+        responses: Responses from task-creating requests
         max_retries: Maximum number of retries on connection errors
     """
-    import time
-
     import httpx
 
-    if response.status_code not in [200, 201, 202]:
-        return
-
-    task_info = response.json()
-    task_uid = task_info.get("taskUid")
-    if not task_uid:
-        return
+    pending: list[int] = []
+    for response in responses:
+        if response.status_code not in [200, 201, 202]:
+            continue
+        task_uid = response.json().get("taskUid")
+        if task_uid is not None:
+            pending.append(task_uid)
 
     retries = 0
-    while True:
+    poll_interval = TASK_POLL_INITIAL_INTERVAL
+    while pending:
+        batch = pending[:TASK_POLL_BATCH_SIZE]
         try:
-            response = client.get(f"/tasks/{task_uid}")
+            response = client.get(
+                "/tasks",
+                params={
+                    "uids": ",".join(map(str, batch)),
+                    "statuses": "succeeded,failed,canceled",
+                    "limit": len(batch),
+                },
+            )
             if response.status_code != 200:
                 break
 
-            task = response.json()
-            status = task.get("status")
-            if status in ["succeeded", "failed", "canceled"]:
-                if status == "failed":
+            # Reset retries on successful poll
+            retries = 0
+            finished = set()
+            for task in response.json().get("results", []):
+                finished.add(task["uid"])
+                if task.get("status") == "failed":
                     print(
                         f"    Task failed: {task.get('error', {}).get('message', 'Unknown error')}"
                     )
-                break
+            if finished:
+                pending = [uid for uid in pending if uid not in finished]
+                poll_interval = TASK_POLL_INITIAL_INTERVAL
+                continue
 
-            # Reset retries on successful poll
-            retries = 0
-            time.sleep(0.5)
+            # Nothing finished yet: poll quickly at first since most tasks
+            # finish fast, then back off
+            time.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, TASK_POLL_MAX_INTERVAL)
 
         except httpx.ConnectError:
             retries += 1
             if retries >= max_retries:
                 print(
-                    f"    Connection lost after {max_retries} retries, task {task_uid} may still be processing"
+                    f"    Connection lost after {max_retries} retries, {len(pending)} task(s) may still be processing"
                 )
                 break
             print(f"    Connection error, retrying ({retries}/{max_retries})...")
@@ -3451,11 +3505,14 @@ def clean_instance(url: str, api_key: str | None = None) -> None:
         return
 
     print(f"Found {len(indexes)} indexes to delete:")
+    pending = []
     for idx in indexes:
         uid = idx["uid"]
         print(f"  Deleting '{uid}'...")
-        response = client.delete(f"/indexes/{uid}")
-        _wait_for_task(client, response)
+        pending.append(client.delete(f"/indexes/{uid}"))
+
+    # Deletions are enqueued together and awaited afterwards
+    _wait_for_tasks(client, pending)
 
     print("\nAll indexes deleted.")
 
@@ -3493,6 +3550,12 @@ def main():
         "-i",
         help="Generate only this specific index. Use with --documents to set count.",
     )
+    dump_parser.add_argument(
+        "--rng-seed",
+        type=int,
+        help="Seed the random generator so repeated runs produce the same random "
+        "content. Timestamps still follow the clock, so output is not byte-identical.",
+    )
 
     # Seed command
     seed_parser = subparsers.add_parser("seed", help="Seed a live MeiliSearch instance")
@@ -3519,6 +3582,12 @@ def main():
         "-i",
         help="Seed only this specific index. Use with --documents to set count.",
     )
+    seed_parser.add_argument(
+        "--rng-seed",
+        type=int,
+        help="Seed the random generator so repeated runs produce the same random "
+        "content. Timestamps still follow the clock, so output is not byte-identical.",
+    )
 
     # Clean command
     clean_parser = subparsers.add_parser(
@@ -3545,6 +3614,7 @@ def main():
             args.size,
             total_documents=args.documents,
             single_index=args.index,
+            rng_seed=args.rng_seed,
         )
     elif args.command == "seed":
         seed_instance(
@@ -3552,6 +3622,7 @@ def main():
             args.api_key,
             total_documents=args.documents,
             single_index=args.index,
+            rng_seed=args.rng_seed,
         )
     elif args.command == "clean":
         clean_instance(args.url, args.api_key)
@@ -0,0 +1,50 @@
+"""Tests for the main Analyzer."""
+
+import pytest
+
+from meiliscan.core.analyzer import Analyzer
+from meiliscan.models.index import IndexData, IndexSettings, IndexStats
+
+
+class TestAnalyzer:
+    """Tests for Analyzer."""
+
+    @pytest.fixture
+    def indexes(self) -> list[IndexData]:
+        """Create a few indexes that produce findings."""
+        return [
+            IndexData(
+                uid=f"index_{n}",
+                primaryKey="id",
+                settings=IndexSettings(),
+                stats=IndexStats(
+                    numberOfDocuments=100,
+                    fieldDistribution={"id": 100, "title": 100, "price": 100},
+                ),
+                sample_documents=[
+                    {"id": 1, "title": "First", "price": 10},
+                    {"id": 2, "title": "Second", "price": "20"},
+                ],
+            )
+            for n in range(3)
+        ]
+
+    def test_analyze_all_parallel_matches_serial(self, indexes):
+        """Test that worker processes produce the same findings as serial runs."""
+        analyzer = Analyzer()
+
+        serial = analyzer.analyze_all(indexes)
+        parallel = analyzer.analyze_all(indexes, parallel=True)
+
+        assert list(parallel) == [index.uid for index in indexes]
+        assert serial
+        for uid, findings in serial.items():
+            assert [f.model_dump(exclude={"detected_at"}) for f in findings] == [
+                f.model_dump(exclude={"detected_at"}) for f in parallel[uid]
+            ]
+
+    def test_iter_analyze_all_yields_in_index_order(self, indexes):
+        """Test that results are yielded in index order."""
+        results = list(Analyzer().iter_analyze_all(indexes))
+
+        assert [index.uid for index, _ in results] == [i.uid for i in indexes]
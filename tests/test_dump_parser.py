@@ -159,6 +159,46 @@ class TestDumpParser:
 
         await parser.close()
 
+    @pytest.mark.asyncio
+    async def test_connect_streams_large_dump(
+        self, mock_dump_file: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test dumps above the in-memory threshold are streamed from disk."""
+        from meiliscan.collectors import dump_parser
+
+        monkeypatch.setattr(dump_parser, "MAX_IN_MEMORY_DUMP_SIZE", 0)
+
+        parser = DumpParser(mock_dump_file)
+        result = await parser.connect()
+
+        assert result is True
+        indexes = await parser.get_indexes()
+        assert indexes[0].document_count == 3
+
+        await parser.close()
+
+    @pytest.mark.asyncio
+    async def test_large_documents_file_streamed(
+        self, mock_dump_file: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test documents.jsonl above the threshold is read line by line."""
+        from meiliscan.collectors import dump_parser
+
+        parser = DumpParser(mock_dump_file)
+        assert await parser.connect() is True
+        expected = (await parser.get_indexes())[0]
+        await parser.close()
+
+        monkeypatch.setattr(dump_parser, "MAX_IN_MEMORY_DUMP_SIZE", 0)
+        parser = DumpParser(mock_dump_file)
+        assert await parser.connect() is True
+        streamed = (await parser.get_indexes())[0]
+        await parser.close()
+
+        assert streamed.document_count == expected.document_count
+        assert streamed.sample_documents == expected.sample_documents
+        assert streamed.stats.field_distribution == expected.stats.field_distribution
+
     @pytest.mark.asyncio
     async def test_connect_nonexistent_file(self, tmp_path: Path):
         """Test connection fails with nonexistent file."""
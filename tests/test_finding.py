@@ -21,6 +21,14 @@ class TestFindingSeverity:
         assert FindingSeverity.SUGGESTION.value == "suggestion"
         assert FindingSeverity.INFO.value == "info"
 
+    def test_severity_rank_orders_most_severe_first(self):
+        """Test that severity ranks sort critical before info."""
+        assert FindingSeverity.CRITICAL.rank == 0
+        assert FindingSeverity.WARNING.rank == 1
+        assert FindingSeverity.SUGGESTION.rank == 2
+        assert FindingSeverity.INFO.rank == 3
+        assert FindingSeverity("warning").rank == 1
+
 
 class TestFindingCategory:
     """Tests for FindingCategory enum."""
@@ -9,6 +9,7 @@ from meiliscan.models.report import (
     ActionPlan,
     AnalysisReport,
     AnalysisSummary,
+    ComparisonInput,
     IndexAnalysis,
     SourceInfo,
 )
@@ -143,6 +144,28 @@ class TestAnalysisReport:
         assert len(sample_report.global_findings) == 1
         assert sample_report.global_findings[0].id == "MEILI-G001"
 
+    def test_add_findings_batch(self, sample_report):
+        """Test adding a batch of findings to an index or globally."""
+        sample_report.add_index(IndexData(uid="products"))
+        findings = [
+            Finding(
+                id=f"MEILI-S00{i}",
+                category=FindingCategory.SCHEMA,
+                severity=FindingSeverity.WARNING,
+                title="Test",
+                description="Test",
+                impact="Test",
+                index_uid="products",
+            )
+            for i in range(1, 4)
+        ]
+
+        sample_report.add_findings("products", findings)
+        sample_report.add_findings("missing", findings[:1])
+
+        assert sample_report.indexes["products"].findings == findings
+        assert sample_report.global_findings == findings[:1]
+
     def test_calculate_summary(self, sample_report):
         """Test summary calculation."""
         # Add indexes
@@ -194,6 +217,31 @@ class TestAnalysisReport:
         assert sample_report.summary.warnings == 1
         assert sample_report.summary.suggestions == 1
 
+    def test_calculate_summary_for_loaded_report(self, sample_report):
+        """Test that document totals are computed for loaded reports."""
+        sample_report.add_index(
+            IndexData(uid="products", stats=IndexStats(numberOfDocuments=1000))
+        )
+        loaded = AnalysisReport.from_dict(sample_report.to_dict())
+
+        loaded.calculate_summary()
+
+        assert loaded.summary.total_indexes == 1
+        assert loaded.summary.total_documents == 1000
+
+    def test_calculate_summary_after_index_replaced(self, sample_report):
+        """Test that document totals follow an index replaced in place."""
+        sample_report.add_index(
+            IndexData(uid="products", stats=IndexStats(numberOfDocuments=1000))
+        )
+        sample_report.indexes["products"] = IndexAnalysis(
+            metadata={"document_count": 10}
+        )
+
+        sample_report.calculate_summary()
+
+        assert sample_report.summary.total_documents == 10
+
     def test_get_all_findings(self, sample_report):
         """Test getting all findings."""
         index = IndexData(uid="test")
@@ -274,6 +322,23 @@ class TestAnalysisReport:
         finding = sample_report.get_finding_by_id("MEILI-X999")
         assert finding is None
 
+    def test_get_finding_by_id_after_in_place_change(self, sample_report):
+        """Test that findings appended to an index can be looked up."""
+        sample_report.add_index(IndexData(uid="products"))
+        assert sample_report.get_finding_by_id("MEILI-S001") is None
+
+        finding = Finding(
+            id="MEILI-S001",
+            category=FindingCategory.SCHEMA,
+            severity=FindingSeverity.WARNING,
+            title="Test",
+            description="Test",
+            impact="Test",
+            index_uid="products",
+        )
+        sample_report.indexes["products"].findings.append(finding)
+        assert sample_report.get_finding_by_id("MEILI-S001") is finding
+
     def test_to_dict(self, sample_report):
         """Test converting report to dictionary."""
         data = sample_report.to_dict()
@@ -285,6 +350,50 @@ class TestAnalysisReport:
         assert "action_plan" in data
         assert data["version"] == "1.0.0"
 
+    def test_generated_at_display_follows_reassignment(self, sample_report):
+        """Test that the display timestamp tracks generated_at."""
+        sample_report.generated_at = datetime(2024, 1, 2, 3, 4, 5)
+        assert sample_report.generated_at_display == "2024-01-02 03:04:05 UTC"
+
+        sample_report.generated_at = datetime(2025, 6, 7, 8, 9, 10)
+        assert sample_report.generated_at_display == "2025-06-07 08:09:10 UTC"
+
+    def test_to_dict_reflects_nested_edits(self, sample_report):
+        """Test that exports pick up edits made after an earlier export."""
+        sample_report.to_dict()
+        sample_report.summary.health_score = 42
+
+        assert sample_report.to_dict()["summary"]["health_score"] == 42
+
+    def test_get_all_findings_sees_in_place_changes(self, sample_report):
+        """Test that findings added by mutating indexes are returned."""
+        assert sample_report.get_all_findings() == []
+
+        finding = Finding(
+            id="MEILI-B001",
+            category=FindingCategory.BEST_PRACTICES,
+            severity=FindingSeverity.INFO,
+            title="Test",
+            description="Test",
+            impact="Test",
+            index_uid="products",
+        )
+        sample_report.indexes["products"] = IndexAnalysis(findings=[finding])
+        assert sample_report.get_all_findings() == [finding]
+
+        # The returned list is a fresh copy each time
+        sample_report.get_all_findings().clear()
+        assert sample_report.get_all_findings() == [finding]
+
+    def test_raw_indexes_private_per_instance(self, sample_report):
+        """Test that raw indexes are neither shared nor exported."""
+        other = AnalysisReport(source=SourceInfo(type="dump"))
+        sample_report.add_index(IndexData(uid="products"))
+
+        assert "products" in sample_report._raw_indexes
+        assert other._raw_indexes == {}
+        assert "_raw_indexes" not in sample_report.model_dump()
+
 
 class TestActionPlan:
     """Tests for ActionPlan model."""
@@ -393,3 +502,42 @@ class TestIndexAnalysisSampleDocuments:
         assert len(paginated) == 5
         assert paginated[0]["id"] == "5"  # Second page starts at index 5
         assert paginated[4]["id"] == "9"
+
+
+class TestComparisonInput:
+    """Tests for the lightweight comparison input model."""
+
+    def test_comparison_input_skips_sample_documents(self):
+        """Test that sample documents are dropped when loading for comparison."""
+        report = AnalysisReport(source=SourceInfo(type="dump"))
+        report.add_index(
+            IndexData(uid="products", sample_documents=[{"id": 1, "title": "A"}])
+        )
+
+        loaded = ComparisonInput.model_validate_json(report.to_json())
+
+        assert not isinstance(loaded, AnalysisReport)
+        assert "products" in loaded.indexes
+        assert not hasattr(loaded.indexes["products"], "sample_documents")
+
+    def test_comparison_input_keeps_findings(self):
+        """Test that findings and summary survive loading for comparison."""
+        report = AnalysisReport(source=SourceInfo(type="dump"))
+        report.add_index(IndexData(uid="products"))
+        report.add_finding(
+            Finding(
+                id="MEILI-S001",
+                category=FindingCategory.SCHEMA,
+                severity=FindingSeverity.CRITICAL,
+                title="Test",
+                description="Test",
+                impact="Test",
+                index_uid="products",
+            )
+        )
+        report.calculate_summary()
+
+        loaded = ComparisonInput.model_validate_json(report.to_json())
+
+        assert [f.id for f in loaded.get_all_findings()] == ["MEILI-S001"]
+        assert loaded.summary.critical_issues == 1
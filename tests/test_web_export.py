@@ -14,6 +14,7 @@ from meiliscan.models.report import (
     SourceInfo,
 )
 from meiliscan.web.app import AppState, create_app
+from meiliscan.web.routes import filter_findings
 
 
 @pytest.fixture
@@ -202,3 +203,59 @@ class TestExportWithoutReport:
         data = response.json()
         assert "error" in data
         assert "No analysis data available" in data["error"]
+
+
+class TestApiEndpoints:
+    """Tests for the JSON API endpoints."""
+
+    def test_api_report_matches_to_dict(self, client: TestClient, sample_report):
+        """Test /api/report returns the serialized report."""
+        response = client.get("/api/report")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == sample_report.to_dict()
+
+    def test_api_report_uses_stored_json(self, app_with_report):
+        """Test /api/report serves the bytes stored on the app state."""
+        state: AppState = app_with_report.state.analyzer_state
+        state.report_json = b'{"stored": true}'
+
+        response = TestClient(app_with_report).get("/api/report")
+
+        assert response.json() == {"stored": True}
+
+    def test_api_health(self, client: TestClient):
+        """Test /api/health returns the summary fields."""
+        response = client.get("/api/health")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "ok"
+        assert data["health_score"] == 75
+        assert data["critical_issues"] == 1
+
+    def test_api_endpoints_without_report(self):
+        """Test the JSON API endpoints when no report is available."""
+        client = TestClient(create_app())
+
+        assert client.get("/api/report").json() == {
+            "error": "No analysis data available"
+        }
+        assert client.get("/api/health").json() == {"status": "no_data"}
+
+
+class TestFilterFindings:
+    """Tests for the findings filter helper."""
+
+    def test_filter_findings_combines_filters(self, sample_report):
+        """Test that filters are case-insensitive and combined."""
+        findings = sample_report.get_all_findings()
+
+        assert filter_findings(findings, severity="CRITICAL") == findings
+        assert filter_findings(findings, category="schema", index="test-index") == (
+            findings
+        )
+        assert filter_findings(findings, severity="warning") == []
+        assert filter_findings(findings, category="unknown") == []
+        assert filter_findings(findings, index="other") == []